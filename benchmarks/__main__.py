@@ -0,0 +1,81 @@
+"""
+Benchmarks for the framework itself, run against the bundled local copy of the app.
+
+    python -m benchmarks                              # run everything, print percentiles
+    python -m benchmarks --save-baseline main         # store results in benchmarks/baselines/main.json
+    python -m benchmarks --compare main --tolerance 0.15
+    python -m benchmarks --filter flows/
+    python -m benchmarks --backend cdp --compare main   # DevTools-protocol driver against a chromedriver baseline
+"""
+import argparse
+import sys
+
+from benchmarks import bench_flows, bench_pages, bench_primitives  # noqa: F401 (registers the benchmarks)
+from benchmarks.harness import REGISTRY, BenchContext, compare, load_baseline, run, save_baseline
+from utils.browser import PROFILES, create_chrome_driver
+from utils.cdp_driver import CdpBrowser
+from utils.local_app.server import LocalAppServer
+
+
+def at_least(minimum: int):
+    def parse(value: str) -> int:
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+        return number
+    parse.__name__ = "int" # argparse names the type in "invalid int value: 'x'"
+    return parse
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=at_least(1), default=20, help="Measured iterations per benchmark.")
+    parser.add_argument("--warmup", type=at_least(0), default=3, help="Unmeasured iterations run first.")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose group/name contains this.")
+    parser.add_argument("--save-baseline", metavar="NAME", help="Save the results as a named baseline.")
+    parser.add_argument("--compare", metavar="NAME", help="Compare the results with a named baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed p50 slowdown against the baseline before it counts as a regression.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="lean", help="Browser profile to benchmark with.")
+    parser.add_argument("--backend", choices=("chromedriver", "cdp"), default="chromedriver",
+                        help="Drive Chrome through chromedriver or directly over the DevTools protocol.")
+    args = parser.parse_args(argv)
+
+    selected = [bench for bench in REGISTRY if args.filter in bench.key]
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results = {}
+
+    profile = PROFILES[args.profile]
+    cdp_browser = CdpBrowser(profile) if args.backend == "cdp" else None
+    driver = cdp_browser.new_driver() if cdp_browser is not None else create_chrome_driver(profile)
+    try:
+        with LocalAppServer() as server:
+            ctx = BenchContext(driver, server.url)
+            print(f"{'benchmark':<50} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'vs base':>8}")
+            for bench in selected:
+                summary = run(bench, ctx, args.iterations, args.warmup)
+                results[bench.key] = summary
+                delta = ""
+                if bench.key in baseline:
+                    delta = f"{(summary['p50'] / baseline[bench.key]['p50'] - 1) * 100:+.1f}%"
+                print(f"{bench.key:<50} {summary['p50']:>8.2f} {summary['p90']:>8.2f} {summary['p99']:>8.2f} {delta:>8}")
+    finally:
+        driver.quit()
+        if cdp_browser is not None:
+            cdp_browser.close()
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"Baseline saved as '{args.save_baseline}'.")
+    if args.compare:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Slower than baseline '{args.compare}' by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+            return 1
+        print(f"No regressions against baseline '{args.compare}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+from pages.cart_page import CartPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from benchmarks.harness import benchmark, opened, seeded
+
+PRODUCT_1_NAME = "Sauce Labs Backpack"
+PRODUCT_2_NAME = "Sauce Labs Bike Light"
+CHECKOUT_INFO = {"first_name": "Test", "last_name": "User", "postal_code": "12345"}
+
+
+@benchmark("flows", setup=opened(LoginPage))
+def ui_login_to_inventory(ctx, login_page: LoginPage):
+    login_page.login_as("standard_user", "secret_sauce")
+
+
+@benchmark("flows", setup=seeded(InventoryPage))
+def e2e_purchase_single_item(ctx, inventory_page: InventoryPage):
+    """Same steps as test_full_e2e_purchase_flow_single_item, starting from a logged in session"""
+    inventory_page.add_item_to_cart_by_name(PRODUCT_1_NAME)
+    inventory_page.get_cart_badge_count()
+    cart_page = inventory_page.go_to_cart()
+    cart_page.is_cart_page_displayed()
+    cart_page.get_item_names_in_cart()
+    step_one = cart_page.proceed_to_checkout()
+    step_one.is_checkout_step_one_page_displayed()
+    step_one.fill_checkout_info(CHECKOUT_INFO["first_name"], CHECKOUT_INFO["last_name"], CHECKOUT_INFO["postal_code"])
+    step_two = step_one.continue_to_overview()
+    step_two.is_checkout_overview_page_displayed()
+    step_two.get_item_names_in_overview()
+    complete = step_two.click_finish()
+    complete.is_checkout_complete_page_displayed()
+    complete.get_complete_header_message()
+    inventory_page = complete.click_back_home()
+    inventory_page.is_inventory_page_displayed()
+    inventory_page.get_cart_badge_count()
+
+
+@benchmark("flows", setup=seeded(InventoryPage))
+def add_two_remove_one_in_cart(ctx, inventory_page: InventoryPage):
+    """Same steps as test_remove_item_from_cart_page"""
+    cart_page = CartPage(ctx.driver, ctx.base_url)
+    inventory_page.add_item_to_cart_by_name(PRODUCT_1_NAME)
+    inventory_page.add_item_to_cart_by_name(PRODUCT_2_NAME)
+    inventory_page.go_to_cart()
+    cart_page.is_cart_page_displayed()
+    cart_page.get_item_names_in_cart()
+    cart_page.remove_item_from_cart_by_name(PRODUCT_1_NAME)
+    cart_page.get_item_names_in_cart()
+    cart_page.continue_shopping()
+    inventory_page.is_inventory_page_displayed()
+    inventory_page.get_cart_badge_count()
@@ -0,0 +1,132 @@
+from pages.cart_page import CartPage
+from pages.checkout_complete import CheckoutCompletePage
+from pages.checkout_step_one import CheckoutStepOnePage
+from pages.checkout_step_two import CheckoutStepTwoPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from benchmarks.harness import benchmark, opened, seeded
+
+PRODUCT_1_NAME = "Sauce Labs Backpack"
+PRODUCT_2_NAME = "Sauce Labs Bike Light"
+ONE_ITEM = (PRODUCT_1_NAME,)
+TWO_ITEMS = (PRODUCT_1_NAME, PRODUCT_2_NAME)
+
+
+@benchmark("login_page", setup=opened(LoginPage))
+def login(ctx, page: LoginPage):
+    page.login("standard_user", "secret_sauce")
+
+
+@benchmark("login_page", setup=opened(LoginPage))
+def login_keystrokes(ctx, page: LoginPage):
+    page.login("standard_user", "secret_sauce", keystrokes=True)
+
+
+@benchmark("login_page", setup=opened(LoginPage))
+def login_with_error(ctx, page: LoginPage):
+    page.login("wronguser", "secret_sauce")
+    page.get_error_message()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def get_item_count(ctx, page: InventoryPage):
+    page.get_item_count()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def get_product_names(ctx, page: InventoryPage):
+    page.get_product_names()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def get_product_prices(ctx, page: InventoryPage):
+    page.get_product_prices()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def get_all_item_details(ctx, page: InventoryPage):
+    page.get_all_item_details()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def add_item_to_cart_by_name(ctx, page: InventoryPage):
+    page.add_item_to_cart_by_name(PRODUCT_1_NAME)
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def add_items_to_cart(ctx, page: InventoryPage):
+    page.add_items_to_cart(list(TWO_ITEMS))
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def is_sorted_by_price(ctx, page: InventoryPage):
+    page.is_sorted_by(InventoryPage.SORT_PRICE_ASC)
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage, ONE_ITEM))
+def remove_product_from_cart_by_name(ctx, page: InventoryPage):
+    page.remove_product_from_cart_by_name(PRODUCT_1_NAME)
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def get_cart_badge_count_empty(ctx, page: InventoryPage):
+    page.get_cart_badge_count()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage, ONE_ITEM))
+def get_cart_badge_count_one_item(ctx, page: InventoryPage):
+    page.get_cart_badge_count()
+
+
+@benchmark("inventory_page", setup=seeded(InventoryPage))
+def go_to_cart(ctx, page: InventoryPage):
+    page.go_to_cart()
+
+
+@benchmark("cart_page", setup=seeded(CartPage, TWO_ITEMS))
+def get_item_names_in_cart(ctx, page: CartPage):
+    page.get_item_names_in_cart()
+
+
+@benchmark("cart_page", setup=seeded(CartPage, TWO_ITEMS))
+def remove_item_from_cart_by_name(ctx, page: CartPage):
+    page.remove_item_from_cart_by_name(PRODUCT_1_NAME)
+
+
+@benchmark("cart_page", setup=seeded(CartPage, ONE_ITEM))
+def is_cart_page_displayed(ctx, page: CartPage):
+    page.is_cart_page_displayed()
+
+
+@benchmark("checkout_step_one", setup=seeded(CheckoutStepOnePage, ONE_ITEM))
+def fill_checkout_info(ctx, page: CheckoutStepOnePage):
+    page.fill_checkout_info("Test", "User", "12345")
+
+
+@benchmark("checkout_step_one", setup=seeded(CheckoutStepOnePage, ONE_ITEM))
+def fill_checkout_info_keystrokes(ctx, page: CheckoutStepOnePage):
+    page.fill_checkout_info("Test", "User", "12345", keystrokes=True)
+
+
+@benchmark("checkout_step_one", setup=seeded(CheckoutStepOnePage, ONE_ITEM))
+def missing_field_error(ctx, page: CheckoutStepOnePage):
+    page.fill_checkout_info("", "User", "12345")
+    page.click_continue()
+    page.get_error_message()
+
+
+@benchmark("checkout_step_two", setup=seeded(CheckoutStepTwoPage, TWO_ITEMS))
+def get_item_names_in_overview(ctx, page: CheckoutStepTwoPage):
+    page.get_item_names_in_overview()
+
+
+@benchmark("checkout_step_two", setup=seeded(CheckoutStepTwoPage, TWO_ITEMS))
+def get_totals(ctx, page: CheckoutStepTwoPage):
+    page.get_subtotal()
+    page.get_tax()
+    page.get_total()
+
+
+@benchmark("checkout_complete", setup=seeded(CheckoutCompletePage))
+def get_complete_header_message(ctx, page: CheckoutCompletePage):
+    page.get_complete_header_message()
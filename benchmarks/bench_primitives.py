@@ -0,0 +1,72 @@
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from benchmarks.harness import benchmark, opened, seeded
+
+ADD_BACKPACK = (By.ID, f"{InventoryPage.ADD_TO_CART_BUTTON_PREFIX}sauce-labs-backpack")
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def navigate_to(ctx, page: BasePage):
+    page.navigate_to(InventoryPage.PATH)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def find_element(ctx, page: BasePage):
+    page._find_element(InventoryPage.PAGE_TITLE)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def find_elements(ctx, page: BasePage):
+    page._find_elements(InventoryPage.INVENTORY_ITEM)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def click(ctx, page: BasePage):
+    page._click(ADD_BACKPACK)
+
+
+@benchmark("primitives", setup=opened(LoginPage))
+def type_text(ctx, page: BasePage):
+    page._type_text(LoginPage.USERNAME_INPUT, "standard_user")
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def get_text(ctx, page: BasePage):
+    page._get_text(InventoryPage.PAGE_TITLE)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def get_element_attribute(ctx, page: BasePage):
+    page._get_element_attribute(InventoryPage.SHOPPING_CART_ICON, "class")
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def is_displayed_present(ctx, page: BasePage):
+    page._is_displayed(InventoryPage.PAGE_TITLE)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def is_displayed_now_absent(ctx, page: BasePage):
+    page._is_displayed_now(InventoryPage.SHOPPING_CART_BADGE)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def assert_absent(ctx, page: BasePage):
+    page._assert_absent(InventoryPage.SHOPPING_CART_BADGE)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def get_texts(ctx, page: BasePage):
+    page._get_texts(InventoryPage.INVENTORY_ITEM_NAME)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def read_records(ctx, page: BasePage):
+    page._read_records(InventoryPage.INVENTORY_ITEM, InventoryPage.ITEM_DETAIL_FIELDS)
+
+
+@benchmark("primitives", setup=seeded(InventoryPage))
+def select_dropdown_by_value(ctx, page: BasePage):
+    page._select_dropdown_by_value(InventoryPage.PRODUCT_SORT_CONTAINER, "hilo")
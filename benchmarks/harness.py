@@ -0,0 +1,91 @@
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+from pages.base_page import BasePage
+from pages.session_state import SessionSeeder, SessionState
+from utils.stats import summarize
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+STANDARD_USER = "standard_user"
+
+
+class Benchmark:
+    """
+    One measured operation. `setup` runs before every iteration and is not timed; whatever it
+    returns is passed to the timed `body`.
+    """
+    def __init__(self, group: str, name: str, body: Callable, setup: Callable | None):
+        self.group = group
+        self.name = name
+        self.body = body
+        self.setup = setup
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+REGISTRY: list[Benchmark] = []
+
+
+def benchmark(group: str, name: str | None = None, setup: Callable | None = None):
+    """Registers the decorated function as a benchmark: body(ctx, prepared) where prepared = setup(ctx)"""
+    def register(body):
+        REGISTRY.append(Benchmark(group, name or body.__name__, body, setup))
+        return body
+    return register
+
+
+def opened(page_cls: type[BasePage]) -> Callable:
+    """Setup that opens a page without a session (e.g. the login page)"""
+    def setup(ctx):
+        page = page_cls(ctx.driver, ctx.base_url)
+        page.navigate_to(page_cls.PATH)
+        return page
+    return setup
+
+
+def seeded(page_cls: type[BasePage], cart_items: tuple = ()) -> Callable:
+    """Setup that starts from a logged in session with the given cart, on the given page"""
+    def setup(ctx):
+        return ctx.seeder.seed(SessionState(STANDARD_USER, cart_items, page_cls))
+    return setup
+
+
+class BenchContext:
+    def __init__(self, driver, base_url: str):
+        self.driver = driver
+        self.base_url = base_url
+        self.seeder = SessionSeeder(driver, base_url)
+
+
+def run(bench: Benchmark, ctx: BenchContext, iterations: int, warmup: int) -> dict:
+    """Runs one benchmark and returns its latency summary in milliseconds"""
+    samples = []
+    for i in range(warmup + iterations):
+        prepared = bench.setup(ctx) if bench.setup else None
+        start = time.perf_counter()
+        bench.body(ctx, prepared)
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+    return summarize(samples)
+
+
+def save_baseline(name: str, results: dict[str, dict]):
+    BASELINE_DIR.mkdir(exist_ok=True)
+    (BASELINE_DIR / f"{name}.json").write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def load_baseline(name: str) -> dict[str, dict]:
+    return json.loads((BASELINE_DIR / f"{name}.json").read_text())
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float, stat: str = "p50") -> list[str]:
+    """Names of the benchmarks whose `stat` got slower than the baseline by more than `tolerance` (0.1 = 10%)"""
+    return [
+        key for key, summary in results.items()
+        if key in baseline and summary[stat] > baseline[key][stat] * (1 + tolerance)
+    ]
@@ -0,0 +1,12 @@
+pytest_plugins = [
+    "utils.adaptive_timeouts",
+    "utils.browser_metrics",
+    "utils.duration_sharding",
+    "utils.failure_capture",
+    "utils.impact_selection",
+    "utils.instrumentation",
+    "utils.profile_selection",
+    "utils.round_trip_budget",
+    "utils.shared_browser",
+    "utils.state_order",
+]
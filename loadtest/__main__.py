@@ -0,0 +1,81 @@
+"""
+Replays page-object flows as concurrent virtual users and reports throughput and per-step latency.
+
+    python -m loadtest --local --users 20 --ramp-up 10 --duration 60
+    python -m loadtest --base-url http://staging:8080 --flow checkout --users 5 --iterations 10 --think-time 0.5 2
+    SAUCEDEMO_BASE_URL=http://staging:8080 python -m loadtest --users 50 --rate 5 --json load.json
+
+The target must be given explicitly (--local, --base-url or SAUCEDEMO_BASE_URL); there is no default,
+so a load test never hits the public site by accident.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from loadtest.flows import FLOWS
+from loadtest.runner import LoadConfig, run_load
+from pages.base_page import resolve_base_url
+from utils.aio_webdriver import ChromeDriverServer
+from utils.browser import PROFILES
+from utils.local_app.server import LocalAppServer
+
+
+def print_report(report: dict):
+    print(f"{'step':<50} {'n':>6} {'p50 ms':>8} {'p90 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for step, stats in report["steps"].items():
+        print(f"{step:<50} {stats['n']:>6} {stats['p50']:>8.1f} {stats['p90']:>8.1f} "
+              f"{stats['p95']:>8.1f} {stats['p99']:>8.1f} {stats['max']:>8.1f}")
+    print(f"\n{report['completed']} flows completed, {report['failed']} failed in {report['elapsed_s']:.1f}s "
+          f"({report['throughput_per_s']:.2f} flows/s)")
+    for error, count in report["errors"].items():
+        print(f"  {count:>5} x {error}")
+
+
+async def _main(args, base_url: str) -> dict:
+    config = LoadConfig(users=args.users, ramp_up=args.ramp_up, duration=args.duration,
+                        iterations=args.iterations, think_time=tuple(args.think_time), rate=args.rate)
+    async with ChromeDriverServer(max_connections=args.connections) as server:
+        profile = PROFILES[args.profile]
+        drivers = await asyncio.gather(*(server.new_session(profile) for _ in range(args.users)))
+        return await run_load(FLOWS[args.flow], drivers, base_url, config)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--flow", choices=sorted(FLOWS), default="checkout")
+    parser.add_argument("--users", type=int, default=10, help="Number of concurrent virtual users (one browser each).")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds over which the users are started.")
+    parser.add_argument("--duration", type=float, help="Seconds to keep running after ramp-up.")
+    parser.add_argument("--iterations", type=int, default=1, help="Flows per user, when no --duration is given.")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.0, 0.0), metavar=("MIN", "MAX"),
+                        help="Seconds paused after every step, drawn uniformly between MIN and MAX.")
+    parser.add_argument("--rate", type=float, help="Target flows started per second across all users.")
+    parser.add_argument("--connections", type=int, default=32, help="Pooled HTTP connections to chromedriver.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="lean", help="Browser profile for every user.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--local", action="store_true", help="Run against the bundled local copy of the app.")
+    target.add_argument("--base-url", help="Run against this deployment of the app (default: SAUCEDEMO_BASE_URL).")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON.")
+    args = parser.parse_args(argv)
+    base_url = args.base_url or os.getenv("SAUCEDEMO_BASE_URL")
+    if not args.local and not base_url:
+        parser.error("no target: pass --local, --base-url URL or set SAUCEDEMO_BASE_URL")
+
+    if args.local:
+        with LocalAppServer() as server:
+            report = asyncio.run(_main(args, server.url))
+    else:
+        report = asyncio.run(_main(args, resolve_base_url(base_url)))
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Flows replayed by every virtual user. Each is built from the async page objects, so the load test
+uses the same locators as the functional suite. Every page-object call is reported as its own step.
+"""
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.checkout_step_one import AsyncCheckoutStepOnePage
+from pages.aio.checkout_step_two import AsyncCheckoutStepTwoPage
+from pages.aio.inventory_page import AsyncInventoryPage
+from pages.aio.login_page import AsyncLoginPage
+from loadtest.runner import VirtualUser
+
+STANDARD_USER = ("standard_user", "secret_sauce")
+PRODUCT_NAME = "Sauce Labs Backpack"
+
+
+async def checkout(user: VirtualUser):
+    await user.page(AsyncLoginPage).login(*STANDARD_USER)
+    inventory = user.page(AsyncInventoryPage)
+    await inventory.add_item_to_cart_by_name(PRODUCT_NAME)
+    await inventory.go_to_cart()
+    await user.page(AsyncCartPage).proceed_to_checkout()
+    await user.page(AsyncCheckoutStepOnePage).fill_checkout_info("Load", "User", "12345", submit=True)
+    await user.page(AsyncCheckoutStepTwoPage).click_finish()
+
+
+async def browse(user: VirtualUser):
+    await user.page(AsyncLoginPage).login(*STANDARD_USER)
+    inventory = user.page(AsyncInventoryPage)
+    await inventory.get_product_names()
+    await inventory.add_item_to_cart_by_name(PRODUCT_NAME)
+    await inventory.get_cart_badge_count()
+    await inventory.click_logout()
+
+
+FLOWS = {"checkout": checkout, "browse": browse}
@@ -0,0 +1,138 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from pages.aio.base_page import AsyncBasePage
+from utils.aio_webdriver import AsyncWebDriver
+from utils.stats import summarize
+
+
+@dataclass
+class LoadConfig:
+    users: int = 10
+    ramp_up: float = 0.0  # seconds until the last virtual user has started
+    duration: float | None = 60.0  # seconds; None runs `iterations` flows per user instead
+    iterations: int = 1
+    think_time: tuple[float, float] = (0.0, 0.0)  # pause between steps, drawn uniformly from (min, max)
+    rate: float | None = None  # flows started per second across all users; None means as fast as possible
+
+
+class Pacer:
+    """Spaces flow starts out so that all users together start at most `rate` flows per second"""
+    def __init__(self, rate: float | None):
+        self.interval = 1 / rate if rate else 0.0
+        self._next = time.monotonic()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+class Results:
+    def __init__(self):
+        self.steps: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.completed = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+        self.finished_at = self.started_at
+
+    def report(self) -> dict:
+        elapsed = self.finished_at - self.started_at
+        return {
+            "elapsed_s": elapsed,
+            "completed": self.completed,
+            "failed": self.failed,
+            "throughput_per_s": self.completed / elapsed if elapsed else 0.0,
+            "steps": {name: summarize(samples) for name, samples in self.steps.items()},
+            "errors": dict(self.errors),
+        }
+
+
+class TimedPage:
+    """
+    Wraps an async page object so every awaited method is timed as a step, keyed by page and method
+    name (e.g. "InventoryPage.add_item_to_cart_by_name"). Think time is spent after each step and is not
+    part of its latency.
+    """
+    def __init__(self, page: AsyncBasePage, user: "VirtualUser"):
+        self._page = page
+        self._user = user
+
+    def __getattr__(self, name):
+        attribute = getattr(self._page, name)
+        if not asyncio.iscoroutinefunction(attribute):
+            return attribute
+        step = f"{type(self._page).__name__.removeprefix('Async')}.{name}"
+
+        async def timed(*args, **kwargs):
+            self._user.current_step = step
+            start = time.perf_counter()
+            result = await attribute(*args, **kwargs)
+            self._user.results.steps[step].append((time.perf_counter() - start) * 1000)
+            await self._user.think()
+            return result
+        return timed
+
+
+class VirtualUser:
+    def __init__(self, number: int, driver: AsyncWebDriver, base_url: str, config: LoadConfig, results: Results):
+        self.number = number
+        self.driver = driver
+        self.base_url = base_url
+        self.config = config
+        self.results = results
+        self.current_step = ""
+
+    def page(self, page_cls: type[AsyncBasePage]) -> TimedPage:
+        return TimedPage(page_cls(self.driver, self.base_url), self)
+
+    async def think(self):
+        low, high = self.config.think_time
+        if high:
+            await asyncio.sleep(random.uniform(low, high))
+
+    async def reset(self):
+        """Drops the session and cart left by the previous flow, so every flow starts as a new visitor"""
+        if (await self.driver.current_url()).startswith(self.base_url):
+            await self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        await self.driver.delete_all_cookies()
+
+
+Flow = Callable[[VirtualUser], Awaitable[None]]
+
+
+async def _run_user(user: VirtualUser, flow: Flow, pacer: Pacer, start_delay: float, deadline: float | None):
+    await asyncio.sleep(start_delay)
+    done = 0
+    while (time.monotonic() < deadline) if deadline else (done < user.config.iterations):
+        await pacer.wait()
+        if deadline and time.monotonic() >= deadline:
+            break
+        try:
+            await user.reset()
+            await flow(user)
+            user.results.completed += 1
+        except Exception as e:
+            user.results.failed += 1
+            user.results.errors[f"{user.current_step}: {type(e).__name__}"] += 1
+        done += 1
+
+
+async def run_load(flow: Flow, drivers: list[AsyncWebDriver], base_url: str, config: LoadConfig) -> dict:
+    """Runs the flow with one virtual user per driver and returns the report"""
+    results = Results()
+    pacer = Pacer(config.rate)
+    deadline = results.started_at + config.ramp_up + config.duration if config.duration else None
+    spacing = config.ramp_up / max(1, len(drivers) - 1) if len(drivers) > 1 else 0.0
+    users = [VirtualUser(number, driver, base_url, config, results) for number, driver in enumerate(drivers)]
+    await asyncio.gather(*(_run_user(user, flow, pacer, user.number * spacing, deadline) for user in users))
+    results.finished_at = time.monotonic()
+    return results.report()
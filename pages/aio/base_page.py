@@ -0,0 +1,118 @@
+import time
+from selenium.common.exceptions import TimeoutException, JavascriptException
+from pages import scripts
+from pages.base_page import BasePage, resolve_base_url
+from utils.aio_webdriver import AsyncWebDriver, AsyncWebElement
+
+class AsyncBasePage:
+    """
+    Awaitable counterpart of BasePage for driving many sessions from one event loop.
+    Runs the same in-browser scripts, so every wait and bulk read costs one round trip here too.
+    Pages declare the same readiness contract as their sync counterparts (see BasePage).
+    """
+    PATH = ""
+    READY_LOCATOR: tuple | None = None
+    TITLE_TEXT: str | None = None
+    PAGE_TITLE: tuple | None = None
+
+    def __init__(self, driver: AsyncWebDriver, base_url: str | None = None):
+        self.driver = driver
+        self.base_url = resolve_base_url(base_url)
+
+    async def _wait_for(self, condition: str, locator: tuple, timeout: float = 10, contract: dict | None = None):
+        """
+        Waits in the browser until the condition ("present", "visible", "clickable", "absent" or "ready") holds for the locator.
+        Returns the element (True for "absent"), or None once the timeout runs out.
+        """
+        deadline = time.monotonic() + timeout # AsyncWebDriver sessions allow scripts to run for up to 60 seconds
+        while True:
+            remaining_ms = int(max(0.0, deadline - time.monotonic()) * 1000)
+            try:
+                return await self.driver.execute_async_script(scripts.WAIT_FOR, *locator, condition, remaining_ms, contract)
+            except JavascriptException as e:
+                # The page navigated away mid-wait; pick up again on the new document
+                if "unloaded" not in (e.msg or "") or time.monotonic() >= deadline:
+                    raise
+
+    async def _check_now(self, condition: str, locator: tuple):
+        """Evaluates a wait condition once, without waiting"""
+        return await self.driver.execute_script(scripts.CHECK, *locator, condition, None)
+
+    _readiness = BasePage._readiness
+
+    async def is_ready(self, timeout: float = 2) -> bool:
+        """Checks the page's readiness contract in one in-browser wait"""
+        return await self._wait_for("ready", self.READY_LOCATOR, timeout, self._readiness()) is not None
+
+    async def _find_element(self, locator: tuple, timeout: int = 10) -> AsyncWebElement:
+        element = await self._wait_for("visible", locator, timeout)
+        if element is None:
+            raise TimeoutException(f"Element with locator {locator} not found within {timeout} seconds.")
+        return element
+
+    async def _read_elements(self, locator: tuple, attributes: tuple = (), timeout: int = 10) -> list[dict]:
+        """Reads the text (and the given attributes) of every element matching the locator in one script call"""
+        elements = await self.driver.execute_script(scripts.READ_ELEMENTS, *locator, list(attributes))
+        if elements or not timeout:
+            return elements
+        if await self._wait_for("present", locator, timeout) is None:
+            print(f"Elements with locator {locator} not found within {timeout} seconds.")
+            return []
+        return await self.driver.execute_script(scripts.READ_ELEMENTS, *locator, list(attributes))
+
+    async def _read_records(self, item_locator: tuple, fields: dict[str, tuple], timeout: int = 10) -> list[dict]:
+        """Reads one record per item matching item_locator, all in one round trip (see BasePage._read_records)"""
+        specs = BasePage._field_specs(fields)
+        records = await self.driver.execute_script(scripts.READ_RECORDS, *item_locator, specs)
+        if records or not timeout:
+            return records
+        if await self._wait_for("present", item_locator, timeout) is None:
+            print(f"Elements with locator {item_locator} not found within {timeout} seconds.")
+            return []
+        return await self.driver.execute_script(scripts.READ_RECORDS, *item_locator, specs)
+
+    async def _get_texts(self, locator: tuple, timeout: int = 10) -> list[str]:
+        return [element["text"] for element in await self._read_elements(locator, timeout=timeout)]
+
+    async def _click(self, locator: tuple, timeout: int = 10):
+        element = await self._wait_for("clickable", locator, timeout)
+        if element is None:
+            raise TimeoutException(f"Element with locator {locator} not clickable within {timeout} seconds.")
+        await element.click()
+
+    async def _click_in_grid(self, item_locator: tuple, fields: dict[str, tuple], expected_fingerprint: str,
+                             buttons: list[tuple]) -> dict:
+        """Clicks the buttons in one round trip while the grid matches the fingerprint (see BasePage._click_in_grid)"""
+        specs = {name: list(locator) for name, locator in fields.items()}
+        return await self.driver.execute_script(scripts.CLICK_IN_GRID, list(item_locator), specs, expected_fingerprint,
+                                                [list(button) for button in buttons])
+
+    async def _type_text(self, locator: tuple, text: str, timeout: int = 10):
+        element = await self._find_element(locator, timeout)
+        await element.clear()
+        await element.send_keys(text)
+
+    async def _fill_fields(self, fields: dict[tuple, str], submit: tuple | None = None, timeout: int = 10):
+        """Sets several fields and optionally clicks a submit element, all in one round trip"""
+        specs = [[*locator, text] for locator, text in fields.items()]
+        submit_spec = list(submit) if submit else None
+        missing = await self.driver.execute_script(scripts.FILL_FIELDS, specs, submit_spec)
+        while missing:
+            await self._find_element(tuple(missing), timeout)
+            missing = await self.driver.execute_script(scripts.FILL_FIELDS, specs, submit_spec)
+
+    async def _get_text(self, locator: tuple, timeout: int = 10) -> str:
+        element = await self._find_element(locator, timeout)
+        return await element.text()
+
+    async def _is_displayed(self, locator: tuple, timeout: int = 2) -> bool:
+        return await self._wait_for("visible", locator, timeout) is not None
+
+    async def _is_displayed_now(self, locator: tuple) -> bool:
+        return await self._check_now("visible", locator) is not None
+
+    async def _get_current_url(self) -> str:
+        return await self.driver.current_url()
+
+    async def navigate_to(self, path: str = ""):
+        await self.driver.get(self.base_url + path)
@@ -0,0 +1,38 @@
+from selenium.webdriver.common.by import By
+from pages.aio.base_page import AsyncBasePage
+from pages.cart_page import CartPage
+
+class AsyncCartPage(AsyncBasePage):
+    PATH = CartPage.PATH
+    PAGE_TITLE = CartPage.PAGE_TITLE
+    CART_ITEM = CartPage.CART_ITEM
+    CART_ITEM_NAME = CartPage.CART_ITEM_NAME
+    CART_ITEM_FIELDS = CartPage.CART_ITEM_FIELDS
+    CHECKOUT_BUTTON = CartPage.CHECKOUT_BUTTON
+    CONTINUE_SHOPPING_BUTTON = CartPage.CONTINUE_SHOPPING_BUTTON
+    READY_LOCATOR = CartPage.READY_LOCATOR
+    TITLE_TEXT = CartPage.TITLE_TEXT
+
+    async def is_cart_page_displayed(self) -> bool:
+        return await self.is_ready()
+
+    async def get_item_names_in_cart(self) -> list[str]:
+        return await self._get_texts(self.CART_ITEM_NAME)
+
+    async def remove_item_from_cart_by_name(self, item_name: str):
+        """Reads the cart's buttons in one round trip and clicks the one of the named product, as CartPage does"""
+        buttons = await self._remove_buttons()
+        if item_name not in buttons and await self.is_ready(timeout=10):
+            buttons = await self._remove_buttons()
+        if item_name not in buttons:
+            raise ValueError(f"No product named {item_name!r} in the cart.")
+        await self._click((By.ID, buttons[item_name]))
+
+    async def _remove_buttons(self) -> dict[str, str]:
+        return {item["name"]: item["button_id"] for item in await self._read_records(self.CART_ITEM, self.CART_ITEM_FIELDS, timeout=0)}
+
+    async def proceed_to_checkout(self):
+        await self._click(self.CHECKOUT_BUTTON)
+
+    async def continue_shopping(self):
+        await self._click(self.CONTINUE_SHOPPING_BUTTON)
@@ -0,0 +1,16 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.checkout_complete import CheckoutCompletePage
+
+class AsyncCheckoutCompletePage(AsyncBasePage):
+    PATH = CheckoutCompletePage.PATH
+    PAGE_TITLE = CheckoutCompletePage.PAGE_TITLE
+    READY_LOCATOR = CheckoutCompletePage.READY_LOCATOR
+    TITLE_TEXT = CheckoutCompletePage.TITLE_TEXT
+    COMPLETE_HEADER = CheckoutCompletePage.COMPLETE_HEADER
+    BACK_HOME_BUTTON = CheckoutCompletePage.BACK_HOME_BUTTON
+
+    async def get_complete_header_message(self) -> str:
+        return await self._get_text(self.COMPLETE_HEADER)
+
+    async def click_back_home(self):
+        await self._click(self.BACK_HOME_BUTTON)
@@ -0,0 +1,39 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.checkout_step_one import CheckoutStepOnePage
+
+class AsyncCheckoutStepOnePage(AsyncBasePage):
+    PATH = CheckoutStepOnePage.PATH
+    PAGE_TITLE = CheckoutStepOnePage.PAGE_TITLE
+    READY_LOCATOR = CheckoutStepOnePage.READY_LOCATOR
+    TITLE_TEXT = CheckoutStepOnePage.TITLE_TEXT
+    FIRST_NAME_INPUT = CheckoutStepOnePage.FIRST_NAME_INPUT
+    LAST_NAME_INPUT = CheckoutStepOnePage.LAST_NAME_INPUT
+    POSTAL_CODE_INPUT = CheckoutStepOnePage.POSTAL_CODE_INPUT
+    CONTINUE_BUTTON = CheckoutStepOnePage.CONTINUE_BUTTON
+    CANCEL_BUTTON = CheckoutStepOnePage.CANCEL_BUTTON
+    ERROR_MESSAGE_CONTAINER = CheckoutStepOnePage.ERROR_MESSAGE_CONTAINER
+
+    async def fill_checkout_info(self, first_name: str, last_name: str, postal_code: str, submit: bool = False, keystrokes: bool = False):
+        if keystrokes:
+            await self._type_text(self.FIRST_NAME_INPUT, first_name)
+            await self._type_text(self.LAST_NAME_INPUT, last_name)
+            await self._type_text(self.POSTAL_CODE_INPUT, postal_code)
+            if submit:
+                await self.click_continue()
+            return
+        await self._fill_fields({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.POSTAL_CODE_INPUT: postal_code,
+        }, submit=self.CONTINUE_BUTTON if submit else None)
+
+    async def click_continue(self):
+        await self._click(self.CONTINUE_BUTTON)
+
+    async def click_cancel(self):
+        await self._click(self.CANCEL_BUTTON)
+
+    async def get_error_message(self) -> str:
+        if await self._is_displayed(self.ERROR_MESSAGE_CONTAINER):
+            return await self._get_text(self.ERROR_MESSAGE_CONTAINER)
+        return ""
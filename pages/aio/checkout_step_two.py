@@ -0,0 +1,25 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.checkout_step_two import CheckoutStepTwoPage
+
+class AsyncCheckoutStepTwoPage(AsyncBasePage):
+    PATH = CheckoutStepTwoPage.PATH
+    PAGE_TITLE = CheckoutStepTwoPage.PAGE_TITLE
+    READY_LOCATOR = CheckoutStepTwoPage.READY_LOCATOR
+    TITLE_TEXT = CheckoutStepTwoPage.TITLE_TEXT
+    CART_ITEM_NAME = CheckoutStepTwoPage.CART_ITEM_NAME
+    FINISH_BUTTON = CheckoutStepTwoPage.FINISH_BUTTON
+    CANCEL_BUTTON = CheckoutStepTwoPage.CANCEL_BUTTON
+    SUMMARY_TOTAL_LABEL = CheckoutStepTwoPage.SUMMARY_TOTAL_LABEL
+
+    async def get_item_names_in_overview(self) -> list[str]:
+        return await self._get_texts(self.CART_ITEM_NAME)
+
+    async def get_total(self) -> float:
+        text = await self._get_text(self.SUMMARY_TOTAL_LABEL) # "Total: $X.XX"
+        return float(text.split("$")[-1])
+
+    async def click_finish(self):
+        await self._click(self.FINISH_BUTTON)
+
+    async def click_cancel(self):
+        await self._click(self.CANCEL_BUTTON)
@@ -0,0 +1,89 @@
+from selenium.common.exceptions import TimeoutException
+from pages.aio.base_page import AsyncBasePage
+from pages.catalog import Catalog, Product, cached_catalog, store_catalog
+from pages.inventory_page import InventoryPage
+
+class AsyncInventoryPage(AsyncBasePage):
+    PATH = InventoryPage.PATH
+    PAGE_TITLE = InventoryPage.PAGE_TITLE
+    SHOPPING_CART_ICON = InventoryPage.SHOPPING_CART_ICON
+    SHOPPING_CART_BADGE = InventoryPage.SHOPPING_CART_BADGE
+    BURGER_MENU_BUTTON = InventoryPage.BURGER_MENU_BUTTON
+    LOGOUT_LINK = InventoryPage.LOGOUT_LINK
+    INVENTORY_ITEM = InventoryPage.INVENTORY_ITEM
+    INVENTORY_ITEM_NAME = InventoryPage.INVENTORY_ITEM_NAME
+    INVENTORY_ITEM_PRICE = InventoryPage.INVENTORY_ITEM_PRICE
+    CATALOG_FIELDS = InventoryPage.CATALOG_FIELDS
+    READY_LOCATOR = InventoryPage.READY_LOCATOR
+    TITLE_TEXT = InventoryPage.TITLE_TEXT
+
+    async def get_page_title_text(self) -> str:
+        return await self._get_text(self.PAGE_TITLE)
+
+    async def is_inventory_page_displayed(self) -> bool:
+        return await self.is_ready()
+
+    async def get_item_count(self) -> int:
+        return len(await self._read_elements(self.INVENTORY_ITEM))
+
+    async def catalog(self, refresh: bool = False) -> Catalog:
+        """The product catalog the sync pages share (see pages/catalog.py), built from one bulk read of the grid"""
+        cached = cached_catalog(self.base_url)
+        if cached is not None and not refresh:
+            return cached
+        built = Catalog.from_records(await self._read_records(self.INVENTORY_ITEM, self.CATALOG_FIELDS))
+        store_catalog(self.base_url, built)
+        return built
+
+    async def product(self, item_name: str) -> Product:
+        products = await self.catalog()
+        if item_name not in products:
+            products = await self.catalog(refresh=True)
+        if item_name not in products:
+            raise ValueError(f"No product named {item_name!r} in the inventory.")
+        return products[item_name]
+
+    async def add_item_to_cart_by_name(self, item_name: str):
+        await self._click_products([item_name])
+
+    async def add_items_to_cart(self, item_names: list[str]):
+        await self._click_products(item_names)
+
+    async def remove_product_from_cart_by_name(self, item_name: str):
+        await self._click_products([item_name], remove=True)
+
+    async def _click_products(self, item_names: list[str], remove: bool = False):
+        """Clicks the products' buttons in one script call while the grid matches the catalog, as InventoryPage does"""
+        fields = {"name": self.INVENTORY_ITEM_NAME, "price": self.INVENTORY_ITEM_PRICE}
+        pending, rebuilt = list(item_names), False
+        while pending:
+            products = [await self.product(name) for name in pending]
+            buttons = [product.remove_locator if remove else product.add_locator for product in products]
+            result = await self._click_in_grid(self.INVENTORY_ITEM, fields, (await self.catalog()).fingerprint, buttons)
+            if result.get("stale"):
+                if rebuilt:
+                    raise TimeoutException("The inventory grid kept changing while clicking its buttons.")
+                await self.catalog(refresh=True)
+                rebuilt = True
+                continue
+            pending = pending[result["clicked"]:]
+            if result.get("missing"):
+                await self._find_element(tuple(result["missing"]))
+
+    async def get_cart_badge_count(self) -> int:
+        badge = await self._get_texts(self.SHOPPING_CART_BADGE, timeout=0)
+        return int(badge[0]) if badge else 0
+
+    async def go_to_cart(self):
+        await self._click(self.SHOPPING_CART_ICON)
+
+    async def get_product_names(self) -> list[str]:
+        return await self._get_texts(self.INVENTORY_ITEM_NAME)
+
+    async def get_product_prices(self) -> list[float]:
+        return [float(price.replace("$", "")) for price in await self._get_texts(self.INVENTORY_ITEM_PRICE)]
+
+    async def click_logout(self):
+        if not await self._is_displayed_now(self.LOGOUT_LINK):
+            await self._click(self.BURGER_MENU_BUTTON)
+        await self._click(self.LOGOUT_LINK)
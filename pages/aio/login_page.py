@@ -0,0 +1,36 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.login_page import LoginPage
+
+class AsyncLoginPage(AsyncBasePage):
+    PATH = LoginPage.PATH
+    READY_LOCATOR = LoginPage.READY_LOCATOR
+    USERNAME_INPUT = LoginPage.USERNAME_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    ERROR_MESSAGE_CONTAINER = LoginPage.ERROR_MESSAGE_CONTAINER
+
+    async def open(self):
+        await self.navigate_to(self.PATH)
+
+    async def enter_username(self, username: str):
+        await self._type_text(self.USERNAME_INPUT, username)
+
+    async def enter_password(self, password: str):
+        await self._type_text(self.PASSWORD_INPUT, password)
+
+    async def click_login_btn(self):
+        await self._click(self.LOGIN_BUTTON)
+
+    async def login(self, username: str, password: str, keystrokes: bool = False):
+        await self.open()
+        if keystrokes:
+            await self.enter_username(username)
+            await self.enter_password(password)
+            await self.click_login_btn()
+            return
+        await self._fill_fields({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password}, submit=self.LOGIN_BUTTON)
+
+    async def get_error_message(self) -> str | None:
+        if await self._is_displayed(self.ERROR_MESSAGE_CONTAINER):
+            return await self._get_text(self.ERROR_MESSAGE_CONTAINER)
+        return None
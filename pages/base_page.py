@@ -1,68 +1,235 @@
+import os
+import time
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, JavascriptException
+from pages import scripts
+
+DEFAULT_BASE_URL = "https://www.saucedemo.com/"
+DEFAULT_TIMEOUT = 10
+DISPLAYED_TIMEOUT = 2
+
+def resolve_base_url(base_url: str | None = None) -> str:
+    """Explicit base_url first, then the SAUCEDEMO_BASE_URL environment variable, then the public site"""
+    url = base_url or os.getenv("SAUCEDEMO_BASE_URL") or DEFAULT_BASE_URL
+    return url if url.endswith("/") else url + "/"
 
 class BasePage:
     """
     Base class for all Page Objects
     It contians common methods for interacting with web elements
+    Waits without an explicit timeout use the timeout model when one is set (see utils/adaptive_timeouts.py)
     """
-    def __init__(self, driver: WebDriver, base_url="https://www.saucedemo.com/"):
+    timeout_model = None
+    # Readiness contract, declared by each page: the URL contains PATH, READY_LOCATOR is visible and,
+    # if TITLE_TEXT is set, PAGE_TITLE shows exactly that text
+    PATH = ""
+    READY_LOCATOR: tuple | None = None
+    TITLE_TEXT: str | None = None
+    def __init__(self, driver: WebDriver, base_url: str | None = None):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
-        self.base_url = base_url
+        self.base_url = resolve_base_url(base_url)
     
-    def _find_element(self, locator: tuple, timeout: int = 10) -> WebElement:
-        """Finds element with explicit wait"""
+    def _resolve_timeout(self, condition: str, locator: tuple, timeout: float | None, default: float = DEFAULT_TIMEOUT) -> float:
+        """An explicit timeout wins, then the timeout model's timeout for the locator, then the fixed default"""
+        if timeout is not None:
+            return timeout
+        if self.timeout_model is None:
+            return default
+        return self.timeout_model.timeout_for(condition, locator, default)
+
+    def _wait_for(self, condition: str, locator: tuple, timeout: float | None = None, default: float = DEFAULT_TIMEOUT,
+                  contract: dict | None = None):
+        """
+        Waits in the browser until the condition ("present", "visible", "clickable", "absent", or "ready" with
+        a readiness contract) holds for the locator.
+        A MutationObserver re-checks on every DOM change, so nothing is polled from here.
+        Returns the element (True for "absent"), or None once the timeout runs out.
+        """
+        timeout = self._resolve_timeout(condition, locator, timeout, default)
+        start = time.monotonic()
+        deadline = start + timeout
+        previous_script_timeout = None
+        if timeout > 25: # chromedriver's default script timeout is 30 seconds
+            previous_script_timeout = self.driver.timeouts.script
+            if previous_script_timeout < timeout + 5:
+                self.driver.set_script_timeout(timeout + 5)
+            else:
+                previous_script_timeout = None
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-        except TimeoutException:
-            raise TimeoutException(f"Element with locator {locator} not found within {timeout} seconds.")
+            while True:
+                remaining_ms = int(max(0.0, deadline - time.monotonic()) * 1000)
+                try:
+                    result = self.driver.execute_async_script(scripts.WAIT_FOR, *locator, condition, remaining_ms, contract)
+                    break
+                except JavascriptException as e:
+                    # The page navigated away mid-wait; pick up again on the new document
+                    if "unloaded" not in (e.msg or "") or time.monotonic() >= deadline:
+                        raise
+        finally:
+            # Only this wait needs the longer timeout, the browser keeps serving other tests
+            if previous_script_timeout is not None:
+                self.driver.set_script_timeout(previous_script_timeout)
+        if result is not None and self.timeout_model is not None:
+            self.timeout_model.record(condition, locator, time.monotonic() - start)
+        return result
+
+    def _not_found(self, condition: str, locator: tuple, timeout: float | None, problem: str = "not found") -> TimeoutException:
+        """The error for a wait that ran out; flagged as a latency anomaly when the timeout was a learned one"""
+        message = f"Element with locator {locator} {problem} within {self._resolve_timeout(condition, locator, timeout)} seconds."
+        if timeout is None and self.timeout_model is not None:
+            anomaly = self.timeout_model.miss(condition, locator, self._resolve_timeout(condition, locator, timeout))
+            if anomaly:
+                message += f" Latency anomaly: {anomaly}"
+        return TimeoutException(message)
+
+    def _check_now(self, condition: str, locator: tuple, contract: dict | None = None):
+        """Evaluates a wait condition once, without waiting"""
+        return self.driver.execute_script(scripts.CHECK, *locator, condition, contract)
+
+    def _readiness(self) -> dict:
+        title = [*self.PAGE_TITLE, self.TITLE_TEXT] if self.TITLE_TEXT else None
+        return {"url": self.PATH, "title": title}
+
+    def is_ready(self, timeout: float | None = None) -> bool:
+        """Checks the page's readiness contract in one in-browser wait, up to 2 seconds by default"""
+        return self._wait_for("ready", self.READY_LOCATOR, timeout, DISPLAYED_TIMEOUT, self._readiness()) is not None
+
+    def wait_until_ready(self, timeout: float | None = None):
+        """Waits for the page's readiness contract and returns the page; raises a TimeoutException if it never holds"""
+        if self._wait_for("ready", self.READY_LOCATOR, timeout, contract=self._readiness()) is None:
+            raise self._not_found("ready", self.READY_LOCATOR, timeout, f"not ready as {type(self).__name__}")
+        return self
+
+    def _transition_to(self, page_cls, timeout: float | None = None):
+        """The page object of the page a navigation leads to, once that page is ready"""
+        return page_cls(self.driver, self.base_url).wait_until_ready(timeout)
+
+    def _find_element(self, locator: tuple, timeout: float | None = None) -> WebElement:
+        """Finds element with explicit wait"""
+        element = self._wait_for("visible", locator, timeout)
+        if element is None:
+            raise self._not_found("visible", locator, timeout)
+        return element
     
-    def _find_elements(self, locator: tuple, timeout: int = 10) -> list[WebElement]:
+    def _find_elements(self, locator: tuple, timeout: float | None = None) -> list[WebElement]:
         """Finds multiple web elements within explicit wait"""
-        try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_all_elements_located(locator)
-            )
-        except:
-            print(f"Elements with locator {locator} not found within {timeout} seconds.")
+        if self._wait_for("visible", locator, timeout) is None:
+            print(f"Elements with locator {locator} not found within {self._resolve_timeout('visible', locator, timeout)} seconds.")
             return []
+        return self.driver.find_elements(*locator)
     
-    def _click(self, locator: tuple, timeout: int = 10):
+    def _read_elements(self, locator: tuple, attributes: tuple = (), timeout: float | None = None) -> list[dict]:
+        """
+        Reads the text (and the given attributes) of every element matching the locator in one script call.
+        Returns e.g. [{"text": "Sauce Labs Backpack", "id": "..."}], or [] if nothing shows up within the timeout.
+        """
+        elements = self.driver.execute_script(scripts.READ_ELEMENTS, *locator, list(attributes))
+        if elements or timeout == 0:
+            return elements
+        if self._wait_for("present", locator, timeout) is None:
+            print(f"Elements with locator {locator} not found within {self._resolve_timeout('present', locator, timeout)} seconds.")
+            return []
+        return self.driver.execute_script(scripts.READ_ELEMENTS, *locator, list(attributes))
+
+    def _get_texts(self, locator: tuple, timeout: float | None = None) -> list[str]:
+        """Gets the text of all elements matching the locator in one round trip"""
+        return [element["text"] for element in self._read_elements(locator, timeout=timeout)]
+
+    def _read_records(self, item_locator: tuple, fields: dict[str, tuple], timeout: float | None = None) -> list[dict]:
+        """
+        Reads one record per item matching item_locator, all in one round trip.
+        Each field is a locator inside the item, (By, value) for its text or (By, value, attribute) for an attribute:
+        {"name": (By.CLASS_NAME, "inventory_item_name"), "button_id": (By.TAG_NAME, "button", "id")}
+        """
+        records = self.driver.execute_script(scripts.READ_RECORDS, *item_locator, self._field_specs(fields))
+        if records or timeout == 0:
+            return records
+        if self._wait_for("present", item_locator, timeout) is None:
+            print(f"Elements with locator {item_locator} not found within {self._resolve_timeout('present', item_locator, timeout)} seconds.")
+            return []
+        return self.driver.execute_script(scripts.READ_RECORDS, *item_locator, self._field_specs(fields))
+
+    def _read_record(self, element: WebElement, fields: dict[str, tuple]) -> dict:
+        """Reads the given fields of an already located element in one round trip"""
+        return self.driver.execute_script(scripts.READ_RECORDS, [element], None, self._field_specs(fields))[0]
+
+    @staticmethod
+    def _field_specs(fields: dict[str, tuple]) -> dict[str, list]:
+        return {name: [field[0], field[1], field[2] if len(field) > 2 else None] for name, field in fields.items()}
+
+    def _click(self, locator: tuple, timeout: float | None = None):
         """Clicks a web element after ensuirng it's clickable"""
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            element.click()
-        except TimeoutException:
-            raise TimeoutException("Element with locator {locator} not clickable within {timeout} seconds.")
+        element = self._wait_for("clickable", locator, timeout)
+        if element is None:
+            raise self._not_found("clickable", locator, timeout, "not clickable")
+        element.click()
     
-    def _type_text(self, locator: tuple, text: str, timeout: int = 10):
+    def _type_text(self, locator: tuple, text: str, timeout: float | None = None):
         """Types text into a web element"""
         element = self._find_element(locator, timeout)
         element.clear()
         element.send_keys(text)
     
-    def _get_text(self, locator: tuple, timeout: int = 10) -> str:
+    def _fill_fields(self, fields: dict[tuple, str], submit: tuple | None = None, timeout: float | None = None):
+        """
+        Sets several fields and optionally clicks a submit element, all in one round trip.
+        Input and change events are fired for every field, but no keystrokes are sent: use _type_text
+        where keystroke behaviour itself is under test.
+        """
+        specs = [[*locator, text] for locator, text in fields.items()]
+        submit_spec = list(submit) if submit else None
+        missing = self.driver.execute_script(scripts.FILL_FIELDS, specs, submit_spec)
+        while missing:
+            # Only reached when the form hasn't rendered yet; fails with a TimeoutException if it never does
+            self._find_element(tuple(missing), timeout)
+            missing = self.driver.execute_script(scripts.FILL_FIELDS, specs, submit_spec)
+
+    def _click_in_grid(self, item_locator: tuple, fields: dict[str, tuple], expected_fingerprint: str,
+                       buttons: list[tuple]) -> dict:
+        """
+        Clicks the buttons in order in one round trip, as long as the items' name=price keys (fields "name" and
+        "price" inside each item) still match the expected fingerprint (see pages/catalog.py).
+        Returns {"stale": True} if they don't, otherwise {"clicked": n} plus "missing" with the first absent button.
+        """
+        specs = {name: list(locator) for name, locator in fields.items()}
+        return self.driver.execute_script(scripts.CLICK_IN_GRID, list(item_locator), specs, expected_fingerprint,
+                                          [list(button) for button in buttons])
+
+    def _reset_form(self, fields: list[tuple], dismiss: tuple | None = None) -> list[tuple] | None:
+        """
+        Puts a form back into its initial state in one round trip, touching only what is dirty: non-empty
+        fields are cleared and a visible error is dismissed by clicking `dismiss`.
+        Returns the locators that were reset, or None if the browser has left this page (the URL no longer
+        contains PATH or one of the fields is missing).
+        """
+        reset = self.driver.execute_script(scripts.RESET_FORM, self.PATH, [list(f) for f in fields], list(dismiss) if dismiss else None)
+        return None if reset is None else [tuple(locator) for locator in reset]
+
+    def _get_text(self, locator: tuple, timeout: float | None = None) -> str:
         """Gets the text of web element"""
         element = self._find_element(locator, timeout)
         return element.text
     
-    def _is_displayed(self, locator: tuple, timeout: int = 2) -> bool:
-        """Checks if a web element is displayed"""
-        try:
-            return self._find_element(locator, timeout).is_displayed()
-        except TimeoutException:
-            return False
-        except NoSuchElementException:
-            return False
-        
+    def _is_displayed(self, locator: tuple, timeout: float | None = None) -> bool:
+        """Checks if a web element is displayed, waiting up to the timeout (2 seconds by default) for it to appear"""
+        return self._wait_for("visible", locator, timeout, default=DISPLAYED_TIMEOUT) is not None
+
+    def _is_displayed_now(self, locator: tuple) -> bool:
+        """Checks if a web element is displayed right now, in a single round trip without waiting"""
+        return self._check_now("visible", locator) is not None
+
+    def _assert_absent(self, locator: tuple):
+        """Fails straight away if the element is displayed, without waiting for it to go away"""
+        if not self._check_now("absent", locator):
+            raise AssertionError(f"Element with locator {locator} is displayed.")
+
+    def _wait_until_absent(self, locator: tuple, timeout: float | None = None) -> bool:
+        """Waits for the element to disappear (or be removed); returns False if it is still there after the timeout"""
+        return self._wait_for("absent", locator, timeout) is not None
+
     def _get_current_url(self) -> str:
         return self.driver.current_url
     
@@ -72,19 +239,19 @@ class BasePage:
     def navigate_to(self, path: str = ""):
         self.driver.get(self.base_url + path)
     
-    def _get_element_attribute(self, locator: tuple, attribute_name: str, timeout: int = 10) -> str:
+    def _get_element_attribute(self, locator: tuple, attribute_name: str, timeout: float | None = None) -> str:
         """Gets an attribute value from a web element."""
         element = self._find_element(locator, timeout)
         return element.get_attribute(attribute_name)
 
-    def _select_dropdown_by_visible_text(self, locator: tuple, text: str, timeout: int = 10):
+    def _select_dropdown_by_visible_text(self, locator: tuple, text: str, timeout: float | None = None):
         """Selects an option from a dropdown by its visible text."""
         from selenium.webdriver.support.ui import Select # Local import to avoid circular dependency if Select is widely used
         element = self._find_element(locator, timeout)
         select = Select(element)
         select.select_by_visible_text(text)
 
-    def _select_dropdown_by_value(self, locator: tuple, value: str, timeout: int = 10):
+    def _select_dropdown_by_value(self, locator: tuple, value: str, timeout: float | None = None):
         """Selects an option from a dropdown by its value attribute."""
         from selenium.webdriver.support.ui import Select
         element = self._find_element(locator, timeout)
@@ -1,35 +1,59 @@
+from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from pages.base_page import BasePage
+from pages.catalog import REMOVE_BUTTON_PREFIX
+
+if TYPE_CHECKING:
+    from pages.checkout_step_one import CheckoutStepOnePage
+    from pages.inventory_page import InventoryPage
 
 class CartPage(BasePage):
+    PATH = "cart.html"
     PAGE_TITLE = (By.CLASS_NAME, "title") # "Your Cart"
     CART_ITEM = (By.CLASS_NAME, "cart_item")
     CART_ITEM_NAME = (By.CLASS_NAME, "inventory_item_name")
+    CART_ITEM_FIELDS = {"name": CART_ITEM_NAME, "button_id": (By.TAG_NAME, "button", "id")}
     CHECKOUT_BUTTON = (By.ID, "checkout")
     CONTINUE_SHOPPING_BUTTON = (By.ID, "continue-shopping")
-    REMOVE_BUTTON_PREFIX = "remove-"
+    REMOVE_BUTTON_PREFIX = REMOVE_BUTTON_PREFIX
+    READY_LOCATOR = CHECKOUT_BUTTON
+    TITLE_TEXT = "Your Cart"
 
     def get_page_title_text(self) -> str:
         return self._get_text(self.PAGE_TITLE)
     
     def is_cart_page_displayed(self) -> bool:
-        return self._is_displayed(self.PAGE_TITLE) and self.get_page_title_text() == "Your Cart"
+        return self.is_ready()
     
     def get_item_names_in_cart(self) -> list[str]:
-        item_elements = self._find_elements(self.CART_ITEM_NAME)
-        return [element.text for element in item_elements]
+        return self._get_texts(self.CART_ITEM_NAME)
     
     def remove_item_from_cart_by_name(self, item_name: str):
-        item_id_suffix = item_name.lower().replace(" ", "-")
-        remove_button_locator = (By.ID, f"{self.REMOVE_BUTTON_PREFIX}{item_id_suffix}")
-        self._click(remove_button_locator)
+        """
+        Reads the cart's items and their buttons in one round trip, then clicks the product's remove button.
+        Raises a ValueError for a product that is not in the cart, once the page is ready (an empty cart renders no items).
+        """
+        buttons = self._remove_buttons()
+        if item_name not in buttons:
+            self.wait_until_ready()
+            buttons = self._remove_buttons()
+        if item_name not in buttons:
+            raise ValueError(f"No product named {item_name!r} in the cart.")
+        self._click((By.ID, buttons[item_name]))
+
+    def _remove_buttons(self) -> dict[str, str]:
+        return {item["name"]: item["button_id"] for item in self._read_records(self.CART_ITEM, self.CART_ITEM_FIELDS, timeout=0)}
     
-    def proceed_to_checkout(self):
+    def proceed_to_checkout(self) -> "CheckoutStepOnePage":
+        from pages.checkout_step_one import CheckoutStepOnePage # Local import, checkout links back to the cart
         self._click(self.CHECKOUT_BUTTON)
+        return self._transition_to(CheckoutStepOnePage)
     
-    def continue_shopping(self):
+    def continue_shopping(self) -> "InventoryPage":
+        from pages.inventory_page import InventoryPage
         self._click(self.CONTINUE_SHOPPING_BUTTON)
+        return self._transition_to(InventoryPage)
 
 
     
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Product catalog of the inventory grid, read once per session and shared by the page objects.
+
+InventoryPage.catalog() builds it from one bulk read of the grid: every product's name, id,
+price, description and the slug of its cart buttons, as the page renders them. Later lookups
+(button locators, prices, sort checks) are answered from memory. The catalog is kept per base URL
+for the life of the process. Its fingerprint, the products' names and prices in any order, is
+checked against the grid by every grid action (in the browser, before clicking), every price
+lookup and every sort check (on the records they read anyway). A grid that changed (another
+user, another app version) gets the catalog rebuilt instead of clicks on stale locators or stale prices.
+"""
+import re
+from dataclasses import dataclass
+
+from selenium.webdriver.common.by import By
+
+ADD_TO_CART_BUTTON_PREFIX = "add-to-cart-"  # e.g. add-to-cart-sauce-labs-backpack
+REMOVE_BUTTON_PREFIX = "remove-"
+TITLE_LINK_ID = re.compile(r"item_(\d+)_title_link")
+
+
+@dataclass(frozen=True)
+class Product:
+    name: str
+    slug: str  # "sauce-labs-backpack"
+    item_id: int | None  # SauceDemo's product id, as used in the cart's localStorage entry
+    price: float
+    description: str
+
+    @property
+    def add_locator(self) -> tuple:
+        return (By.ID, f"{ADD_TO_CART_BUTTON_PREFIX}{self.slug}")
+
+    @property
+    def remove_locator(self) -> tuple:
+        return (By.ID, f"{REMOVE_BUTTON_PREFIX}{self.slug}")
+
+
+def fingerprint(records: list[dict]) -> str:
+    """Identifies the grid's products regardless of their order; CLICK_IN_GRID computes the same in the browser"""
+    return "|".join(sorted(f"{record['name']}={record['price']}" for record in records))
+
+
+def slug_of(button_id: str) -> str:
+    for prefix in (ADD_TO_CART_BUTTON_PREFIX, REMOVE_BUTTON_PREFIX):
+        if button_id.startswith(prefix):
+            return button_id[len(prefix):]
+    raise ValueError(f"Unexpected cart button id {button_id!r}")
+
+
+class Catalog:
+    """The products of the grid by name, in the order the grid listed them when it was read"""
+    def __init__(self, products: list[Product], fingerprint: str):
+        self.products = {product.name: product for product in products}
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "Catalog":
+        """Records of InventoryPage.CATALOG_FIELDS: name, description, price text, button id and title link id"""
+        products = []
+        for record in records:
+            link = TITLE_LINK_ID.fullmatch(record["link_id"] or "")
+            products.append(Product(
+                name=record["name"],
+                slug=slug_of(record["button_id"]),
+                item_id=int(link.group(1)) if link else None,
+                price=float(record["price"].replace("$", "")),
+                description=record["description"],
+            ))
+        return cls(products, fingerprint(records))
+
+    def __getitem__(self, name: str) -> Product:
+        return self.products[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.products
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+
+_catalogs: dict[str, Catalog] = {}  # base URL -> catalog, for the whole session
+
+
+def cached_catalog(base_url: str) -> Catalog | None:
+    return _catalogs.get(base_url)
+
+
+def store_catalog(base_url: str, catalog: Catalog):
+    _catalogs[base_url] = catalog
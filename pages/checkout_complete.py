@@ -1,19 +1,28 @@
+from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
+if TYPE_CHECKING:
+    from pages.inventory_page import InventoryPage
+
 class CheckoutCompletePage(BasePage):
+    PATH = "checkout-complete.html"
     PAGE_TITLE = (By.CLASS_NAME, "title") # "Checkout: Complete!"
     COMPLETE_HEADER = (By.CLASS_NAME, "complete-header") # "Thank you for your order!"
     BACK_HOME_BUTTON = (By.ID, "back-to-products")
+    READY_LOCATOR = COMPLETE_HEADER
+    TITLE_TEXT = "Checkout: Complete!"
 
     def get_page_title_text(self) -> str:
         return self._get_text(self.PAGE_TITLE)
 
     def is_checkout_complete_page_displayed(self) -> bool:
-        return self._is_displayed(self.PAGE_TITLE) and self.get_page_title_text() == "Checkout: Complete!"
+        return self.is_ready()
 
     def get_complete_header_message(self) -> str:
         return self._get_text(self.COMPLETE_HEADER)
 
-    def click_back_home(self):
-        self._click(self.BACK_HOME_BUTTON)
\ No newline at end of file
+    def click_back_home(self) -> "InventoryPage":
+        from pages.inventory_page import InventoryPage # Local import, the inventory page leads back to checkout
+        self._click(self.BACK_HOME_BUTTON)
+        return self._transition_to(InventoryPage)
\ No newline at end of file
@@ -1,7 +1,13 @@
+from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
+if TYPE_CHECKING:
+    from pages.cart_page import CartPage
+    from pages.checkout_step_two import CheckoutStepTwoPage
+
 class CheckoutStepOnePage(BasePage):
+    PATH = "checkout-step-one.html"
     PAGE_TITLE = (By.CLASS_NAME, "title") # "Checkout: Your Information"
     FIRST_NAME_INPUT = (By.ID, "first-name")
     LAST_NAME_INPUT = (By.ID, "last-name")
@@ -9,12 +15,15 @@ class CheckoutStepOnePage(BasePage):
     CONTINUE_BUTTON = (By.ID, "continue")
     CANCEL_BUTTON = (By.ID, "cancel")
     ERROR_MESSAGE_CONTAINER = (By.XPATH, "//div[contains(@class, 'error-message-container')]/h3")
+    ERROR_CLOSE_BUTTON = (By.CSS_SELECTOR, "button[data-test='error-button']")
+    READY_LOCATOR = CONTINUE_BUTTON
+    TITLE_TEXT = "Checkout: Your Information"
 
     def get_page_title_text(self) -> str:
         return self._get_text(self.PAGE_TITLE)
     
     def is_checkout_step_one_page_displayed(self) -> bool:
-        return self._is_displayed(self.PAGE_TITLE) and self.get_page_title_text() == "Checkout: Your Information"
+        return self.is_ready()
     
     def enter_first_name(self, first_name: str):
         self._type_text(self.FIRST_NAME_INPUT, first_name)
@@ -25,21 +34,43 @@ class CheckoutStepOnePage(BasePage):
     def enter_postal_code(self, postal_code: str):
         self._type_text(self.POSTAL_CODE_INPUT, postal_code)
     
-    def fill_checkout_info(self, first_name: str, last_name: str, postal_code: str):
-        self.enter_first_name(first_name)
-        self.enter_last_name(last_name)
-        self.enter_postal_code(postal_code)
+    def fill_checkout_info(self, first_name: str, last_name: str, postal_code: str, submit: bool = False, keystrokes: bool = False):
+        """Fills (and with submit=True, continues) in one round trip; keystrokes=True types into each field instead"""
+        if keystrokes:
+            self.enter_first_name(first_name)
+            self.enter_last_name(last_name)
+            self.enter_postal_code(postal_code)
+            if submit:
+                self.click_continue()
+            return
+        self._fill_fields({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.POSTAL_CODE_INPUT: postal_code,
+        }, submit=self.CONTINUE_BUTTON if submit else None)
 
     def click_continue(self):
+        """Submits the form, which stays on this page with an error if a field is missing"""
         self._click(self.CONTINUE_BUTTON)
 
-    def click_cancel(self):
+    def continue_to_overview(self) -> "CheckoutStepTwoPage":
+        from pages.checkout_step_two import CheckoutStepTwoPage # Local import, the overview links back here
+        self.click_continue()
+        return self._transition_to(CheckoutStepTwoPage)
+
+    def click_cancel(self) -> "CartPage":
+        from pages.cart_page import CartPage
         self._click(self.CANCEL_BUTTON)
+        return self._transition_to(CartPage)
 
     def get_error_message(self) -> str:
         if self._is_displayed(self.ERROR_MESSAGE_CONTAINER):
             return self._get_text(self.ERROR_MESSAGE_CONTAINER)
         return ""
+
+    def reset_form(self) -> list[tuple] | None:
+        """Clears filled fields and dismisses the error, if any; None if the browser has left this page"""
+        return self._reset_form([self.FIRST_NAME_INPUT, self.LAST_NAME_INPUT, self.POSTAL_CODE_INPUT], self.ERROR_CLOSE_BUTTON)
     
 
 
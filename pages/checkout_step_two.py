@@ -1,7 +1,13 @@
+from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
+if TYPE_CHECKING:
+    from pages.checkout_complete import CheckoutCompletePage
+    from pages.inventory_page import InventoryPage
+
 class CheckoutStepTwoPage(BasePage):
+    PATH = "checkout-step-two.html"
     PAGE_TITLE = (By.CLASS_NAME, "title") # "Checkout: Overview"
     CART_ITEM_NAME = (By.CLASS_NAME, "inventory_item_name")
     FINISH_BUTTON = (By.ID, "finish")
@@ -11,22 +17,27 @@ class CheckoutStepTwoPage(BasePage):
     SUMMARY_TOTAL_LABEL = (By.CLASS_NAME, "summary_total_label")
     PAYMENT_INFO_VALUE = (By.XPATH, "//div[@class='summary_info_label' and text()='Payment Information']/following-sibling::div[@class='summary_value_label']")
     SHIPPING_INFO_VALUE = (By.XPATH, "//div[@class='summary_info_label' and text()='Shipping Information']/following-sibling::div[@class='summary_value_label']")
+    READY_LOCATOR = FINISH_BUTTON
+    TITLE_TEXT = "Checkout: Overview"
 
     def get_page_title_text(self) -> str:
         return self._get_text(self.PAGE_TITLE)
 
     def is_checkout_overview_page_displayed(self) -> bool:
-        return self._is_displayed(self.PAGE_TITLE) and self.get_page_title_text() == "Checkout: Overview"
+        return self.is_ready()
 
     def get_item_names_in_overview(self) -> list[str]:
-        item_elements = self._find_elements(self.CART_ITEM_NAME)
-        return [element.text for element in item_elements]
+        return self._get_texts(self.CART_ITEM_NAME)
 
-    def click_finish(self):
+    def click_finish(self) -> "CheckoutCompletePage":
+        from pages.checkout_complete import CheckoutCompletePage # Local import, keeps the checkout modules independent
         self._click(self.FINISH_BUTTON)
+        return self._transition_to(CheckoutCompletePage)
 
-    def click_cancel(self):
+    def click_cancel(self) -> "InventoryPage":
+        from pages.inventory_page import InventoryPage
         self._click(self.CANCEL_BUTTON)
+        return self._transition_to(InventoryPage)
 
     def get_subtotal(self) -> float:
         text = self._get_text(self.SUMMARY_SUBTOTAL_LABEL) # "Item total: $X.XX"
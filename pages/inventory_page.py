@@ -1,8 +1,17 @@
+from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
+from pages.catalog import (ADD_TO_CART_BUTTON_PREFIX, REMOVE_BUTTON_PREFIX, Catalog, Product, cached_catalog, fingerprint,
+                           store_catalog)
+
+if TYPE_CHECKING:
+    from pages.cart_page import CartPage
+    from pages.login_page import LoginPage
 
 class InventoryPage(BasePage):
+    PATH = "inventory.html"
     PAGE_TITLE = (By.CLASS_NAME, "title") # "Products"
     SHOPPING_CART_ICON = (By.ID, "shopping_cart_container")
     SHOPPING_CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
@@ -11,60 +20,154 @@ class InventoryPage(BasePage):
     LOGOUT_LINK = (By.ID, "logout_sidebar_link")
     INVENTORY_ITEM = (By.CLASS_NAME, "inventory_item")
     INVENTORY_ITEM_NAME = (By.CLASS_NAME, "inventory_item_name")
-    ADD_TO_CART_BUTTON_PREFIX = "add-to-cart-" # e.g., add-to-cart-sauce-labs-backpack
-    REMOVE_BUTTON_PREFIX = "remove-" 
+    INVENTORY_ITEM_DESC = (By.CLASS_NAME, "inventory_item_desc")
+    INVENTORY_ITEM_PRICE = (By.CLASS_NAME, "inventory_item_price")
+    ITEM_DETAIL_FIELDS = {"name": INVENTORY_ITEM_NAME, "description": INVENTORY_ITEM_DESC, "price": INVENTORY_ITEM_PRICE}
+    CATALOG_FIELDS = {**ITEM_DETAIL_FIELDS, "button_id": (By.TAG_NAME, "button", "id"),
+                      "link_id": (By.CSS_SELECTOR, "a[id$='_title_link']", "id")}
+    ADD_TO_CART_BUTTON_PREFIX = ADD_TO_CART_BUTTON_PREFIX # e.g., add-to-cart-sauce-labs-backpack
+    REMOVE_BUTTON_PREFIX = REMOVE_BUTTON_PREFIX
+    # Values of the sort dropdown
+    SORT_NAME_ASC, SORT_NAME_DESC, SORT_PRICE_ASC, SORT_PRICE_DESC = "az", "za", "lohi", "hilo"
+    READY_LOCATOR = PRODUCT_SORT_CONTAINER
+    TITLE_TEXT = "Products"
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, base_url: str | None = None):
+        super().__init__(driver, base_url)
         self.expected_path_segment = "inventory.html"
     
     def get_page_title_text(self) -> str:
         return self._get_text(self.PAGE_TITLE)
     
     def is_inventory_page_displayed(self) -> bool:
-        return self._is_displayed(self.PAGE_TITLE) and self.get_page_title_text() == "Products"
+        return self.is_ready()
+
+    def is_on_inventory_page(self) -> bool:
+        return self.is_ready()
     
     def get_item_count(self) -> int:
-        return len(self._find_elements(self.INVENTORY_ITEM))
+        return len(self._read_elements(self.INVENTORY_ITEM))
     
+    def catalog(self, refresh: bool = False) -> Catalog:
+        """The session's product catalog, built from one bulk read of the grid the first time (see pages/catalog.py)"""
+        cached = cached_catalog(self.base_url)
+        if cached is not None and not refresh:
+            return cached
+        built = Catalog.from_records(self._read_records(self.INVENTORY_ITEM, self.CATALOG_FIELDS))
+        store_catalog(self.base_url, built)
+        return built
+
+    def product(self, item_name: str) -> Product:
+        """Name, id, slug, price, description and button locators of a product, without a DOM query once cached"""
+        products = self.catalog()
+        if item_name not in products:
+            products = self.catalog(refresh=True)
+        if item_name not in products:
+            raise ValueError(f"No product named {item_name!r} in the inventory.")
+        return products[item_name]
+
+    def checked_catalog(self, records: list[dict] | None = None) -> Catalog:
+        """
+        The catalog, rebuilt when the grid on display no longer matches its fingerprint. The grid is read once,
+        without waiting, unless records of CATALOG_FIELDS are passed in; with no grid on display the cache is used.
+        """
+        if records is None:
+            records = self._read_records(self.INVENTORY_ITEM, self.CATALOG_FIELDS, timeout=0)
+        if not records:
+            return self.catalog()
+        cached = cached_catalog(self.base_url)
+        if cached is not None and cached.fingerprint == fingerprint(records):
+            return cached
+        built = Catalog.from_records(records)
+        store_catalog(self.base_url, built)
+        return built
+
+    def price_of(self, item_name: str) -> float:
+        """The product's price, from a catalog checked against the grid on display"""
+        products = self.checked_catalog()
+        if item_name not in products:
+            raise ValueError(f"No product named {item_name!r} in the inventory.")
+        return products[item_name].price
+
     def add_item_to_cart_by_name(self, item_name: str):
-        item_id_suffix = item_name.lower().replace(" ", "-") # "Sauce Labs Backpack" -> "sauce-labs-backpack"
-        add_to_cart_btn_locator = (By.ID, f"{self.ADD_TO_CART_BUTTON_PREFIX}{item_id_suffix}")
-        self._click(add_to_cart_btn_locator)
-        
+        self.add_items_to_cart([item_name])
+
+    def add_items_to_cart(self, item_names: list[str]):
+        """Adds several products in one round trip"""
+        self._click_products(item_names)
+
     def remove_product_from_cart_by_name(self, item_name: str):
-        item_id_suffix = item_name.lower().replace(" ", "-")
-        remove_from_cart_btn_locator = (By.ID, f"{self.REMOVE_BUTTON_PREFIX}{item_id_suffix}")
-        self._click(remove_from_cart_btn_locator)
+        self._click_products([item_name], remove=True)
+
+    def _click_products(self, item_names: list[str], remove: bool = False):
+        """
+        Clicks the products' add (or remove) buttons in one script call, as long as the grid still matches
+        the catalog's fingerprint. A changed grid rebuilds the catalog; a button that isn't rendered yet is waited for.
+        """
+        fields = {"name": self.INVENTORY_ITEM_NAME, "price": self.INVENTORY_ITEM_PRICE}
+        pending, rebuilt = list(item_names), False
+        while pending:
+            products = [self.product(name) for name in pending]
+            buttons = [product.remove_locator if remove else product.add_locator for product in products]
+            result = self._click_in_grid(self.INVENTORY_ITEM, fields, self.catalog().fingerprint, buttons)
+            if result.get("stale"):
+                if rebuilt:
+                    raise TimeoutException("The inventory grid kept changing while clicking its buttons.")
+                self.catalog(refresh=True) # waits for the grid if it hasn't rendered yet
+                rebuilt = True
+                continue
+            pending = pending[result["clicked"]:]
+            if result.get("missing"):
+                self._find_element(tuple(result["missing"])) # e.g. the product is in the cart already; raises after the timeout
     
     def get_cart_badge_count(self) -> int:
-        if self._is_displayed(self.SHOPPING_CART_BADGE, timeout=1):
-            return int(self._get_text(self.SHOPPING_CART_BADGE))
-        return 0
+        badge = self._get_texts(self.SHOPPING_CART_BADGE, timeout=0) # The badge is only rendered for a non-empty cart
+        return int(badge[0]) if badge else 0
     
-    def go_to_cart(self):
+    def go_to_cart(self) -> "CartPage":
+        from pages.cart_page import CartPage # Local import, the cart page links back here
         self._click(self.SHOPPING_CART_ICON)
+        return self._transition_to(CartPage)
     
     def get_product_names(self) -> list[str]:
-        product_elements = self._find_elements(self.INVENTORY_ITEM_NAME)
-        return [element.text for element in product_elements]
+        return self._get_texts(self.INVENTORY_ITEM_NAME)
     
     def get_product_prices(self) -> list[float]:
-        price_elements =  self._find_elements((By.CLASS_NAME, "inventory_item_price"))
-        return [float(element.replace("$","")) for element in price_elements]
+        return [float(price.replace("$", "")) for price in self._get_texts(self.INVENTORY_ITEM_PRICE)]
+
+    def sort_products(self, order: str):
+        """Picks a sort order (SORT_NAME_ASC, ..., SORT_PRICE_DESC) in one round trip"""
+        self._fill_fields({self.PRODUCT_SORT_CONTAINER: order})
+
+    def is_sorted_by(self, order: str) -> bool:
+        """Checks the grid's order with one read of its records, which also checks the catalog's fingerprint"""
+        records = self._read_records(self.INVENTORY_ITEM, self.CATALOG_FIELDS)
+        products = self.checked_catalog(records)
+        names = [record["name"] for record in records]
+        if order in (self.SORT_NAME_ASC, self.SORT_NAME_DESC):
+            keys = names
+        else:
+            keys = [products[name].price for name in names]
+        return keys == sorted(keys, reverse=order in (self.SORT_NAME_DESC, self.SORT_PRICE_DESC))
     
     def open_burger_menu(self):
         self._click(self.BURGER_MENU_BUTTON)
 
     def get_item_details(self, item_element: WebElement) -> dict:
-        name = item_element.find_element(By.CLASS_NAME, "inventory_item_name").text
-        desc = item_element.find_element(By.CLASS_NAME, "inventory_item_desc").text
-        price_str = item_element.find_element(By.CLASS_NAME, "inventory_item_price").text
-        price = float(price_str.replace("$", ""))
+        details = self._read_record(item_element, self.ITEM_DETAIL_FIELDS)
+        details["price"] = float(details["price"].replace("$", ""))
+        return details
 
-        return {"name": name, "description": desc, "price": price}
+    def get_all_item_details(self) -> list[dict]:
+        """Name, description and price of every product in the grid, read in one round trip"""
+        items = self._read_records(self.INVENTORY_ITEM, self.ITEM_DETAIL_FIELDS)
+        for details in items:
+            details["price"] = float(details["price"].replace("$", ""))
+        return items
     
-    def click_logout(self):
-        if not self._is_displayed(self.LOGOUT_LINK, timeout=1):
+    def click_logout(self) -> "LoginPage":
+        from pages.login_page import LoginPage
+        if not self._is_displayed_now(self.LOGOUT_LINK):
             self.open_burger_menu()
-        self._click(self.LOGOUT_LINK)
\ No newline at end of file
+        self._click(self.LOGOUT_LINK)
+        return self._transition_to(LoginPage)
\ No newline at end of file
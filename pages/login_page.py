@@ -1,18 +1,21 @@
+from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
+if TYPE_CHECKING:
+    from pages.inventory_page import InventoryPage
+
 class LoginPage(BasePage):
+    PATH = ""
     USERNAME_INPUT = (By.ID, "user-name")
     PASSWORD_INPUT = (By.ID, "password")
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE_CONTAINER = (By.CSS_SELECTOR, "h3[data-test='error']")
+    ERROR_CLOSE_BUTTON = (By.CSS_SELECTOR, "button[data-test='error-button']")
+    READY_LOCATOR = LOGIN_BUTTON
 
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.path = ""
-    
     def open(self):
-        super().navigate_to(self.path)
+        self.navigate_to(self.PATH)
     
     def enter_username(self, username: str):
         self._type_text(self.USERNAME_INPUT, username)
@@ -23,11 +26,29 @@ class LoginPage(BasePage):
     def click_login_btn(self):
         self._click(self.LOGIN_BUTTON)
     
-    def login(self, username: str, password: str):
+    def login(self, username: str, password: str, keystrokes: bool = False):
+        """Fills and submits the form in one round trip; keystrokes=True types into each field instead"""
         self.open()
-        self.enter_username(username)
-        self.enter_password(password)
-        self.click_login_btn()
+        if keystrokes:
+            self.enter_username(username)
+            self.enter_password(password)
+            self.click_login_btn()
+            return
+        self.submit(username, password)
+
+    def submit(self, username: str, password: str):
+        """Fills and submits the form already open, in one round trip"""
+        self._fill_fields({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password}, submit=self.LOGIN_BUTTON)
+
+    def reset_form(self) -> list[tuple] | None:
+        """Clears filled fields and dismisses the error, if any; None if the browser has left the login page"""
+        return self._reset_form([self.USERNAME_INPUT, self.PASSWORD_INPUT], self.ERROR_CLOSE_BUTTON)
+
+    def login_as(self, username: str, password: str, keystrokes: bool = False) -> "InventoryPage":
+        """Logs in and returns the inventory page once it is ready; login() is for attempts that may fail"""
+        from pages.inventory_page import InventoryPage # Local import, the inventory page links back here on logout
+        self.login(username, password, keystrokes)
+        return self._transition_to(InventoryPage)
     
     def get_error_message(self) -> str | None:
         if self._is_displayed(self.ERROR_MESSAGE_CONTAINER):
@@ -0,0 +1,190 @@
+"""
+JavaScript snippets run in the page by BasePage.
+Locators are passed to the browser as the same (By, value) tuples the page objects declare.
+"""
+
+# Resolves a Selenium locator in the page. `root` scopes the search (document by default).
+FIND_ALL = """
+function __findAll(by, value, root) {
+    root = root || document;
+    if (by === "xpath") {
+        var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var found = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+        return found;
+    }
+    if (by === "link text" || by === "partial link text") {
+        return Array.prototype.filter.call(root.querySelectorAll("a"), function (a) {
+            var text = a.innerText.trim();
+            return by === "link text" ? text === value : text.indexOf(value) !== -1;
+        });
+    }
+    var selector = {
+        "id": "#" + CSS.escape(value),
+        "class name": "." + CSS.escape(value),
+        "name": "[name=\\"" + CSS.escape(value) + "\\"]",
+        "tag name": value,
+        "css selector": value
+    }[by];
+    return Array.prototype.slice.call(root.querySelectorAll(selector));
+}
+function __text(el) {
+    return (el.innerText || el.textContent || "").trim();
+}
+"""
+
+# arguments: by, value, [attribute names]
+READ_ELEMENTS = FIND_ALL + """
+var attributes = arguments[2];
+return __findAll(arguments[0], arguments[1]).map(function (el) {
+    var record = {text: __text(el)};
+    attributes.forEach(function (name) { record[name] = el.getAttribute(name); });
+    return record;
+});
+"""
+
+# arguments: [containers] or (by, value) of the containers, {field: [by, value, attribute or null]}
+READ_RECORDS = FIND_ALL + """
+var containers = arguments[0] instanceof Array ? arguments[0] : __findAll(arguments[0], arguments[1]);
+var fields = arguments[2];
+return containers.map(function (container) {
+    var record = {};
+    Object.keys(fields).forEach(function (name) {
+        var field = fields[name];
+        var el = __findAll(field[0], field[1], container)[0];
+        record[name] = !el ? null : field[2] ? el.getAttribute(field[2]) : __text(el);
+    });
+    return record;
+});
+"""
+
+VISIBLE = """
+function __visible(el) {
+    if (!el.isConnected) { return false; }
+    var style = window.getComputedStyle(el);
+    if (style.display === "none" || style.visibility === "hidden" || parseFloat(style.opacity) === 0) { return false; }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function __check(condition, by, value, contract) {
+    if (condition === "ready") { return __ready(by, value, contract); }
+    var elements = __findAll(by, value);
+    if (condition === "present") { return elements[0] || null; }
+    var visible = elements.filter(__visible);
+    if (condition === "absent") { return visible.length === 0; }
+    if (condition === "clickable") { visible = visible.filter(function (el) { return !el.disabled; }); }
+    return visible[0] || null;
+}
+// A page is ready when the URL contains contract.url, its key element (by, value) is visible and,
+// if contract.title is [by, value, text], that element shows exactly that text.
+function __ready(by, value, contract) {
+    if (window.location.href.indexOf(contract.url) === -1) { return null; }
+    if (contract.title) {
+        var title = __findAll(contract.title[0], contract.title[1]).filter(__visible)[0];
+        if (!title || __text(title) !== contract.title[2]) { return null; }
+    }
+    return __findAll(by, value).filter(__visible)[0] || null;
+}
+"""
+
+# arguments: by, value, condition, readiness contract (only for "ready") or null.
+# Returns the element (or true for "absent") right now, or null.
+CHECK = FIND_ALL + VISIBLE + """
+return __check(arguments[2], arguments[0], arguments[1], arguments[3]);
+"""
+
+# arguments: by, value, condition, timeout in ms, readiness contract or null, callback.
+# Resolves as soon as the condition holds: immediately if it already does, otherwise on the
+# DOM mutation (or finished transition/animation) that makes it true. Resolves null on timeout.
+WAIT_FOR = FIND_ALL + VISIBLE + """
+var by = arguments[0], value = arguments[1], condition = arguments[2], timeoutMs = arguments[3], contract = arguments[4];
+var done = arguments[arguments.length - 1];
+var result = __check(condition, by, value, contract);
+if (result) { return done(result); }
+var events = ["transitionend", "animationend", "load"];
+var observer = new MutationObserver(recheck);
+var timer = setTimeout(function () { finish(null); }, timeoutMs);
+function recheck() {
+    var result = __check(condition, by, value, contract);
+    if (result) { finish(result); }
+}
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(timer);
+    events.forEach(function (name) { window.removeEventListener(name, recheck, true); });
+    done(result);
+}
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+events.forEach(function (name) { window.addEventListener(name, recheck, true); });
+"""
+
+# arguments: [[by, value, text], ...], [by, value] of a submit element or null.
+# Sets each field through the native value setter and fires input/change, so frameworks that track
+# the value (React) see the change, then clicks submit. Returns null, or the first locator not found.
+FILL_FIELDS = FIND_ALL + """
+var fields = arguments[0], submit = arguments[1];
+for (var i = 0; i < fields.length; i++) {
+    var el = __findAll(fields[i][0], fields[i][1])[0];
+    if (!el) { return [fields[i][0], fields[i][1]]; }
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    el.focus();
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, fields[i][2]);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+    el.blur();
+}
+if (submit) {
+    var button = __findAll(submit[0], submit[1])[0];
+    if (!button) { return submit; }
+    button.click();
+}
+return null;
+"""
+
+# arguments: path, [[by, value], ...] of form fields, [by, value] of the element that dismisses an error or null.
+# Resets only what is dirty: fields that are not empty are cleared (through the native setter, as in
+# FILL_FIELDS) and a visible error is dismissed. Returns the reset [by, value] pairs, or null if the
+# browser is no longer on the page: its URL does not contain path or one of the fields is gone.
+RESET_FORM = FIND_ALL + VISIBLE + """
+var path = arguments[0], fields = arguments[1], dismiss = arguments[2], reset = [];
+// The page is recognized by its form: PATH alone can't tell pages apart when it is "" (the login page)
+var elements = fields.map(function (field) { return __findAll(field[0], field[1])[0]; });
+if (window.location.href.indexOf(path) === -1 || elements.indexOf(undefined) !== -1) { return null; }
+fields.forEach(function (field, i) {
+    var el = elements[i];
+    if (el.value === "") { return; }
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, "");
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+    reset.push(field);
+});
+var button = dismiss && __findAll(dismiss[0], dismiss[1]).filter(__visible)[0];
+if (button) {
+    button.click();
+    reset.push(dismiss);
+}
+return reset;
+"""
+
+# arguments: [by, value] of the grid items, {name: [by, value], price: [by, value]} inside an item,
+# the expected fingerprint, [[by, value], ...] of buttons.
+# Clicks the buttons in order, but only if the grid still holds the products the fingerprint was taken
+# from (see pages/catalog.py). Returns {stale: true} if it does not, {missing: [by, value], clicked: n}
+# when a button is not there, otherwise {clicked: n}.
+CLICK_IN_GRID = FIND_ALL + """
+var items = __findAll(arguments[0][0], arguments[0][1]), fields = arguments[1], buttons = arguments[3];
+var keys = items.map(function (item) {
+    var name = __findAll(fields.name[0], fields.name[1], item)[0], price = __findAll(fields.price[0], fields.price[1], item)[0];
+    return (name ? __text(name) : "") + "=" + (price ? __text(price) : "");
+});
+if (keys.sort().join("|") !== arguments[2]) { return {stale: true}; }
+for (var i = 0; i < buttons.length; i++) {
+    var button = __findAll(buttons[i][0], buttons[i][1])[0];
+    if (!button) { return {missing: buttons[i], clicked: i}; }
+    button.click();
+}
+return {clicked: buttons.length};
+"""
@@ -0,0 +1,86 @@
+import json
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from pages.base_page import BasePage
+from pages.inventory_page import InventoryPage
+
+SESSION_COOKIE = "session-username"
+CART_STORAGE_KEY = "cart-contents"
+SESSION_LIFETIME = 600 # SauceDemo expires the session cookie after 10 minutes
+
+# SauceDemo keeps the cart in localStorage as a JSON list of these ids
+PRODUCT_IDS = {
+    "Sauce Labs Bike Light": 0,
+    "Sauce Labs Bolt T-Shirt": 1,
+    "Sauce Labs Onesie": 2,
+    "Test.allTheThings() T-Shirt (Red)": 3,
+    "Sauce Labs Backpack": 4,
+    "Sauce Labs Fleece Jacket": 5,
+}
+
+SEED_STORAGE_SCRIPT = """
+if (window.location.origin === %(origin)s) {
+    if (%(cart)s === null) { window.localStorage.removeItem(%(key)s); }
+    else { window.localStorage.setItem(%(key)s, %(cart)s); }
+}
+"""
+
+
+@dataclass(frozen=True)
+class SessionState:
+    """Browser state a test starts from: who is logged in, what is in the cart and which page is open"""
+    username: str
+    cart_items: tuple[str, ...] = ()
+    page: type[BasePage] = InventoryPage
+
+
+class SessionSeeder(BasePage):
+    """
+    Puts the browser straight into a SessionState without going through the UI.
+    The session cookie and cart contents are written directly, then the target page is deep-linked.
+    """
+    def seed(self, state: SessionState) -> BasePage:
+        url = self.base_url + state.page.PATH
+        cart = json.dumps([PRODUCT_IDS[name] for name in state.cart_items]) if state.cart_items else None
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self._seed_before_navigation(state.username, cart, url)
+        else:
+            self._seed_on_origin(state.username, cart, url)
+        return state.page(self.driver, self.base_url)
+
+    def _seed_before_navigation(self, username: str, cart: str | None, url: str):
+        """Chromium only: the cookie and storage are in place before the page loads, so one navigation is enough"""
+        self.driver.execute_cdp_cmd("Network.setCookie", {
+            "name": SESSION_COOKIE,
+            "value": username,
+            "url": self.base_url,
+            "expires": int(time.time()) + SESSION_LIFETIME,
+        })
+        script = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": SEED_STORAGE_SCRIPT % {
+                "origin": json.dumps("{0.scheme}://{0.netloc}".format(urlsplit(self.base_url))),
+                "cart": json.dumps(cart),
+                "key": json.dumps(CART_STORAGE_KEY),
+            },
+        })
+        try:
+            self.driver.get(url)
+        finally:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+    def _seed_on_origin(self, username: str, cart: str | None, url: str):
+        """Cookies and storage can only be written from the app's origin, so open it first"""
+        self.navigate_to()
+        self.driver.add_cookie({
+            "name": SESSION_COOKIE,
+            "value": username,
+            "path": "/",
+            "expiry": int(time.time()) + SESSION_LIFETIME,
+        })
+        if cart is None:
+            self.driver.execute_script("window.localStorage.removeItem(arguments[0]);", CART_STORAGE_KEY)
+        else:
+            self.driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);", CART_STORAGE_KEY, cart)
+        self.driver.get(url)
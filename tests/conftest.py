@@ -1,9 +1,6 @@
 import pytest
 import os
 import sys
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
 from dotenv import load_dotenv
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -14,49 +11,126 @@ from pages.cart_page import CartPage
 from pages.checkout_step_one import CheckoutStepOnePage
 from pages.checkout_step_two import CheckoutStepTwoPage
 from pages.checkout_complete import CheckoutCompletePage
+from pages.session_state import SessionSeeder, SessionState
+from pages.base_page import resolve_base_url
+from utils.browser import apply_profile, create_chrome_driver
+from utils.cdp_driver import CdpBrowser, enabled as cdp_backend_enabled
+from utils.driver_pool import DriverPool
+from utils.shared_browser import enabled as shared_browser_enabled, open_shared_browser
+from utils.local_app.server import LocalAppServer
 
 load_dotenv()
 
+@pytest.fixture(scope="session")
+def driver_pools():
+    """
+    Browsers are kept alive for the whole session and reset between tests.
+    There is one pool per browser profile, created the first time a test asks for that profile.
+    """
+    pools = {}
+    def pool_for(profile):
+        if profile.name not in pools:
+            pools[profile.name] = DriverPool(
+                lambda: create_chrome_driver(profile),
+                max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", "25")),
+                prewarm=os.getenv("DRIVER_POOL_PREWARM", "1") != "0",
+                on_reset=lambda driver: apply_profile(driver, profile),
+            )
+        return pools[profile.name]
+    yield pool_for
+    for pool in pools.values():
+        pool.close()
+
+@pytest.fixture(scope="session")
+def shared_browsers(request):
+    """
+    With SHARED_BROWSER=1, one browser per profile is shared by all tests. Each test gets its own window
+    in a fresh browser context instead of a browser of its own (see utils/shared_browser.py).
+    """
+    browsers = {}
+    def browser_for(profile):
+        if profile.name not in browsers:
+            browsers[profile.name] = open_shared_browser(request.config, profile, create_chrome_driver)
+        return browsers[profile.name]
+    yield browser_for
+    for browser in browsers.values():
+        browser.close()
+
+@pytest.fixture(scope="session")
+def cdp_browsers():
+    """
+    With DRIVER_BACKEND=cdp, one Chrome per profile driven over the DevTools protocol instead of chromedriver.
+    Each test gets a tab in a fresh browser context of it (see utils/cdp_driver.py).
+    """
+    browsers = {}
+    def browser_for(profile):
+        if profile.name not in browsers:
+            browsers[profile.name] = CdpBrowser(profile)
+        return browsers[profile.name]
+    yield browser_for
+    for browser in browsers.values():
+        browser.close()
+
 @pytest.fixture(scope="function")
-def driver():
-    chrome_options = Options()
-
-    prefs = {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-
-    chrome_options.add_argument("--incognito")
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(5)
+def driver(request, browser_profile):
+    """
+    A pooled browser, a window of a shared one, or a DevTools-protocol tab. With --state-order, the previous
+    test's browser is handed on as is when this test can start from the state it left (see utils/state_order.py).
+    """
+    state_order = request.config.pluginmanager.get_plugin("state-order")
+    kept = state_order.take(request.node) if state_order is not None else None
+    if kept is not None:
+        driver, release = kept
+    elif cdp_backend_enabled():
+        driver = request.getfixturevalue("cdp_browsers")(browser_profile).new_driver()
+        release = driver.quit
+    elif shared_browser_enabled():
+        browser = request.getfixturevalue("shared_browsers")(browser_profile)
+        driver = browser.open_window(on_open=lambda d: apply_profile(d, browser_profile))
+        release = lambda: browser.close_window(driver)
+    else:
+        pool = request.getfixturevalue("driver_pools")(browser_profile)
+        driver = pool.acquire()
+        release = lambda: pool.release(driver)
     yield driver
-    driver.quit()
+    if state_order is None or not state_order.keep(request.node, driver, release):
+        release()
+
+@pytest.fixture(scope="session")
+def base_url():
+    """
+    The app under test. With SAUCEDEMO_LOCAL_APP=1 a bundled stand-in is served locally for the whole
+    session, otherwise SAUCEDEMO_BASE_URL or the public SauceDemo site is used.
+    """
+    if os.getenv("SAUCEDEMO_LOCAL_APP", "0") == "0":
+        yield resolve_base_url()
+        return
+    with LocalAppServer() as server:
+        yield server.url
 
 @pytest.fixture(scope="function")
-def login_page(driver):
-    return LoginPage(driver)
+def login_page(driver, base_url):
+    return LoginPage(driver, base_url)
 
 @pytest.fixture(scope="function")
-def inventory_page(driver):
-    return InventoryPage(driver)
+def inventory_page(driver, base_url):
+    return InventoryPage(driver, base_url)
 
 @pytest.fixture(scope="function")
-def cart_page(driver):
-    return CartPage(driver)
+def cart_page(driver, base_url):
+    return CartPage(driver, base_url)
 
 @pytest.fixture(scope="function")
-def checkout_step_one_page(driver):
-    return CheckoutStepOnePage(driver)
+def checkout_step_one_page(driver, base_url):
+    return CheckoutStepOnePage(driver, base_url)
 
 @pytest.fixture(scope="function")
-def checkout_step_two_page(driver):
-    return CheckoutStepTwoPage(driver)
+def checkout_step_two_page(driver, base_url):
+    return CheckoutStepTwoPage(driver, base_url)
 
 @pytest.fixture(scope="function")
-def checkout_complete_page(driver):
-    return CheckoutCompletePage(driver)
+def checkout_complete_page(driver, base_url):
+    return CheckoutCompletePage(driver, base_url)
 
 
 @pytest.fixture(scope="session")
@@ -75,7 +149,23 @@ def locked_out_user_credentials():
 
 # --- Helper Fixtures ---
 @pytest.fixture(scope="function")
-def logged_in_standard_user(login_page, standard_user_credentials):
-    """Logs in a standard user and returns the inventory page."""
-    login_page.login(standard_user_credentials["username"], standard_user_credentials["password"])
-    return InventoryPage(login_page.driver)
\ No newline at end of file
+def seed_session(request, driver, base_url):
+    """
+    Starts a test directly in a given state without going through the UI, e.g.
+    seed_session("standard_user", ["Sauce Labs Backpack"], CheckoutStepOnePage)
+    Returns the page object of the page the browser was opened on.
+    Nothing is done when the browser carried over from the previous test is already in that state.
+    """
+    seeder = SessionSeeder(driver, base_url)
+    state_order = request.config.pluginmanager.get_plugin("state-order")
+    def _seed(username, cart_items=(), page=InventoryPage):
+        state = SessionState(username, tuple(cart_items), page)
+        if state_order is not None and state_order.in_state(driver, state):
+            return page(driver, base_url)
+        return seeder.seed(state)
+    return _seed
+
+@pytest.fixture(scope="function")
+def logged_in_standard_user(seed_session, standard_user_credentials):
+    """Seeds a standard user session and returns the inventory page. The UI login itself is covered by TestLogin."""
+    return seed_session(standard_user_credentials["username"])
\ No newline at end of file
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.inventory_page import AsyncInventoryPage
+from pages.catalog import fingerprint
+from pages.inventory_page import InventoryPage
+from utils.aio_webdriver import ELEMENT_KEY, AsyncWebDriver, AsyncWebElement, HttpConnectionPool
+
+class FakeChromeDriver:
+    """
+    A local HTTP/1.1 server that answers every request with the next (status, body) reply, or 200 {"value": null}.
+    With close_idle=True it drops each connection after one reply without saying so, like a server closing idle keep-alives.
+    """
+    def __init__(self, replies=(), close_idle=False):
+        self.replies = list(replies)
+        self.close_idle = close_idle
+        self.connections = 0
+        self.requests = []
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((method, path, json.loads(body) if body else None))
+                status, payload = self.replies.pop(0) if self.replies else (200, {"value": None})
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if self.close_idle:
+                    break
+        finally:
+            writer.close()
+
+def run(scenario):
+    return asyncio.run(scenario())
+
+def test_requests_reuse_one_keep_alive_connection():
+    async def scenario():
+        async with FakeChromeDriver() as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            for _ in range(3):
+                assert await pool.request("GET", "/status") == (200, {"value": None})
+            await pool.close()
+            return server.connections
+    assert run(scenario) == 1
+
+def test_stale_idle_connection_is_retried_on_a_fresh_one():
+    async def scenario():
+        async with FakeChromeDriver(close_idle=True) as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            await pool.request("GET", "/status")
+            await asyncio.sleep(0.05) # let the server's close reach the idle connection
+            status, _ = await pool.request("POST", "/session/1/url", {"url": "about:blank"})
+            await pool.close()
+            return status, server.connections, server.requests
+    status, connections, requests = run(scenario)
+    assert status == 200
+    assert connections == 2
+    assert requests[-1] == ("POST", "/session/1/url", {"url": "about:blank"})
+
+def test_error_reply_raises_the_matching_selenium_exception():
+    async def scenario():
+        error = {"value": {"error": "no such element", "message": "Unable to locate element"}}
+        async with FakeChromeDriver([(404, error)]) as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            try:
+                with pytest.raises(NoSuchElementException, match="Unable to locate element"):
+                    await AsyncWebDriver(pool, "1").find_element("css selector", "#missing")
+                # The connection survives an error reply
+                await pool.request("GET", "/status")
+            finally:
+                await pool.close()
+            return server.connections
+    assert run(scenario) == 1
+
+def test_elements_are_decoded_and_encoded_by_reference():
+    async def scenario():
+        async with FakeChromeDriver([(200, {"value": {ELEMENT_KEY: "e1"}}), (200, {"value": "clicked"})]) as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            driver = AsyncWebDriver(pool, "1")
+            element = await driver.find_element("id", "login-button")
+            result = await driver.execute_script("return arguments[0].id;", element)
+            await pool.close()
+            return element, result, server.requests
+    element, result, requests = run(scenario)
+    assert isinstance(element, AsyncWebElement) and element.id == "e1"
+    assert result == "clicked"
+    assert requests[1] == ("POST", "/session/1/execute/sync", {"script": "return arguments[0].id;", "args": [{ELEMENT_KEY: "e1"}]})
+
+GRID = [
+    {"name": "Sauce Labs Backpack", "description": "", "price": "$29.99",
+     "button_id": "add-to-cart-sauce-labs-backpack", "link_id": "item_4_title_link"},
+    {"name": "Test.allTheThings() T-Shirt (Red)", "description": "", "price": "$15.99",
+     "button_id": "add-to-cart-test.allthethings()-t-shirt-(red)", "link_id": "item_3_title_link"},
+]
+
+def test_async_pages_check_the_sync_pages_readiness_contract():
+    async def scenario():
+        async with FakeChromeDriver([(200, {"value": {ELEMENT_KEY: "e1"}})]) as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            ready = await AsyncInventoryPage(AsyncWebDriver(pool, "1"), f"http://127.0.0.1:{server.port}").is_ready()
+            await pool.close()
+            return ready, server.requests
+    ready, requests = run(scenario)
+    assert ready
+    args = requests[0][2]["args"]
+    assert args[:3] == [*InventoryPage.READY_LOCATOR, "ready"]
+    assert args[4] == {"url": InventoryPage.PATH, "title": [*InventoryPage.PAGE_TITLE, InventoryPage.TITLE_TEXT]}
+
+def test_async_inventory_clicks_the_catalog_button_of_a_product():
+    async def scenario():
+        async with FakeChromeDriver([(200, {"value": GRID}), (200, {"value": {"clicked": 1}})]) as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            page = AsyncInventoryPage(AsyncWebDriver(pool, "1"), f"http://127.0.0.1:{server.port}")
+            await page.add_item_to_cart_by_name("Test.allTheThings() T-Shirt (Red)")
+            with pytest.raises(ValueError, match="No product named"):
+                await page.add_item_to_cart_by_name("Sauce Labs Onesie") # not in the grid, even after a re-read
+            await pool.close()
+            return server.requests
+    requests = run(scenario)
+    click_args = requests[1][2]["args"]
+    assert click_args[2] == fingerprint(GRID)
+    assert click_args[3] == [["id", "add-to-cart-test.allthethings()-t-shirt-(red)"]]
+
+def test_async_cart_refuses_to_remove_a_product_that_is_not_in_it():
+    cart = [{"name": "Sauce Labs Backpack", "button_id": "remove-sauce-labs-backpack"}]
+    async def scenario():
+        replies = [(200, {"value": cart}), (200, {"value": {ELEMENT_KEY: "checkout"}}), (200, {"value": cart})]
+        async with FakeChromeDriver(replies) as server:
+            pool = HttpConnectionPool("127.0.0.1", server.port)
+            page = AsyncCartPage(AsyncWebDriver(pool, "1"), f"http://127.0.0.1:{server.port}")
+            with pytest.raises(ValueError, match="in the cart"):
+                await page.remove_item_from_cart_by_name("Sauce Labs Onesie")
+            await pool.close()
+            return server.requests
+    requests = run(scenario)
+    assert len(requests) == 3, "The cart is read again once the page is ready, and nothing is clicked."
+    assert "ready" in requests[1][2]["args"]
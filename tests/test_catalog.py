@@ -0,0 +1,36 @@
+import pytest
+from selenium.webdriver.common.by import By
+from pages.catalog import Catalog, fingerprint, slug_of
+
+RECORDS = [
+    {"name": "Sauce Labs Backpack", "description": "carry.allTheThings()", "price": "$29.99",
+     "button_id": "add-to-cart-sauce-labs-backpack", "link_id": "item_4_title_link"},
+    {"name": "Test.allTheThings() T-Shirt (Red)", "description": "This classic Sauce Labs t-shirt", "price": "$15.99",
+     "button_id": "remove-test.allthethings()-t-shirt-(red)", "link_id": None},
+]
+
+def test_fingerprint_ignores_the_order_of_the_grid():
+    assert fingerprint(RECORDS) == fingerprint(RECORDS[::-1])
+    assert fingerprint(RECORDS) == "Sauce Labs Backpack=$29.99|Test.allTheThings() T-Shirt (Red)=$15.99"
+
+def test_fingerprint_changes_with_a_price():
+    repriced = [{**RECORDS[0], "price": "$19.99"}, RECORDS[1]]
+    assert fingerprint(repriced) != fingerprint(RECORDS)
+
+def test_slug_of_strips_either_cart_button_prefix():
+    assert slug_of("add-to-cart-sauce-labs-backpack") == "sauce-labs-backpack"
+    assert slug_of("remove-sauce-labs-backpack") == "sauce-labs-backpack"
+    with pytest.raises(ValueError, match="Unexpected cart button id"):
+        slug_of("back-to-products")
+
+def test_catalog_from_records():
+    catalog = Catalog.from_records(RECORDS)
+    assert len(catalog) == 2
+    assert list(catalog.products) == ["Sauce Labs Backpack", "Test.allTheThings() T-Shirt (Red)"]
+    assert "Sauce Labs Onesie" not in catalog
+    backpack, shirt = catalog["Sauce Labs Backpack"], catalog["Test.allTheThings() T-Shirt (Red)"]
+    assert (backpack.slug, backpack.item_id, backpack.price) == ("sauce-labs-backpack", 4, 29.99)
+    assert (shirt.slug, shirt.item_id, shirt.price) == ("test.allthethings()-t-shirt-(red)", None, 15.99)
+    assert shirt.add_locator == (By.ID, "add-to-cart-test.allthethings()-t-shirt-(red)")
+    assert shirt.remove_locator == (By.ID, "remove-test.allthethings()-t-shirt-(red)")
+    assert catalog.fingerprint == fingerprint(RECORDS)
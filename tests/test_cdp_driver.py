@@ -0,0 +1,137 @@
+from concurrent.futures import Future
+from contextlib import contextmanager
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+from utils import cdp_driver, hooks
+from utils.cdp_driver import CdpConnection, CdpDriver, CdpElement
+
+SORT_OPTIONS = [("az", "Name (A to Z)"), ("za", "Name (Z to A)"), ("lohi", "Price (low to high)"), ("hilo", "Price (high to low)")]
+
+class FakeSelectPage:
+    """
+    Stands in for CdpDriver on a page with one <select> (element 0) and its options (elements 1..n).
+    Answers the element scripts the way the page would, and records what the scripts did.
+    """
+    def __init__(self, options, disabled=()):
+        self.nodes = [{"tag": "select", "attributes": {}}]
+        for value, text in options:
+            self.nodes.append({"tag": "option", "attributes": {"value": value}, "text": text,
+                               "selected": False, "disabled": value in disabled})
+        self.nodes[1]["selected"] = True
+        self.events = []
+        self.mouse_events = []
+
+    def execute_script(self, script, element, *args):
+        node = self.nodes[element.index]
+        if script == cdp_driver.ELEMENT_TAG_NAME:
+            return node["tag"]
+        if script == cdp_driver.ELEMENT_DOM_ATTRIBUTE:
+            return node["attributes"].get(args[0])
+        if script == cdp_driver.ELEMENT_ATTRIBUTE:
+            return {"index": str(element.index - 1)}.get(args[0], node["attributes"].get(args[0]))
+        if script == cdp_driver.ELEMENT_TEXT:
+            return node["text"]
+        if script == cdp_driver.ELEMENT_SELECTED:
+            return node.get("selected", False)
+        if script == cdp_driver.ELEMENT_ENABLED:
+            return not node.get("disabled", False)
+        if script == cdp_driver.FIND_CHILD_ELEMENTS:
+            return [CdpElement(self, i) for i, option in enumerate(self.nodes) if option["tag"] == "option"
+                    and self._matches(option, *args)]
+        if script == cdp_driver.ELEMENT_CLICK_POINT:
+            if node["tag"] != "option":
+                return [10, 20]
+            if not node["disabled"] and not node["selected"]:
+                for option in self.nodes[1:]:
+                    option["selected"] = option is node
+                self.events += ["input", "change"]
+            return None
+        raise AssertionError(f"Unexpected script: {script[:60]}")
+
+    def pipeline(self, commands):
+        self.mouse_events += [params["type"] for _, params in commands]
+
+    @staticmethod
+    def _matches(option, by, value):
+        if by == By.TAG_NAME:
+            return value == "option"
+        if by == By.CSS_SELECTOR: # option[value ="lohi"]
+            return f'"{option["attributes"]["value"]}"' in value
+        return f'"{option["text"]}"' in value # .//option[normalize-space(.) = "Name (Z to A)"]
+
+    def selected_values(self):
+        return [node["attributes"]["value"] for node in self.nodes[1:] if node["selected"]]
+
+def test_select_by_value_on_a_cdp_element():
+    page = FakeSelectPage(SORT_OPTIONS)
+    Select(CdpElement(page, 0)).select_by_value("lohi")
+    assert page.selected_values() == ["lohi"]
+    assert page.events == ["input", "change"]
+    assert page.mouse_events == [], "Options are selected in the page, not clicked with the mouse."
+
+def test_select_by_visible_text_on_a_cdp_element():
+    page = FakeSelectPage(SORT_OPTIONS)
+    select = Select(CdpElement(page, 0))
+    select.select_by_visible_text("Name (Z to A)")
+    assert page.selected_values() == ["za"]
+    assert select.first_selected_option.text == "Name (Z to A)"
+    assert [option.get_attribute("value") for option in select.options] == [value for value, _ in SORT_OPTIONS]
+
+def test_selecting_the_selected_option_fires_no_events():
+    page = FakeSelectPage(SORT_OPTIONS)
+    Select(CdpElement(page, 0)).select_by_value("az")
+    assert page.selected_values() == ["az"]
+    assert page.events == []
+
+def test_select_refuses_disabled_and_missing_options():
+    page = FakeSelectPage(SORT_OPTIONS, disabled=("hilo",))
+    select = Select(CdpElement(page, 0))
+    with pytest.raises(NotImplementedError):
+        select.select_by_value("hilo")
+    with pytest.raises(NoSuchElementException):
+        select.select_by_value("nope")
+    assert page.selected_values() == ["az"]
+
+def test_click_on_other_elements_is_a_mouse_click():
+    page = FakeSelectPage(SORT_OPTIONS)
+    CdpElement(page, 0).click()
+    assert page.mouse_events == ["mouseMoved", "mousePressed", "mouseReleased"]
+
+class FakeConnection:
+    """Stands in for CdpConnection: every command succeeds, Runtime.evaluate returns the given value"""
+    result = staticmethod(CdpConnection.result)
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def send(self, method, params=None, session_id=None):
+        future = Future()
+        future.set_result({"result": {"result": {"value": self.value}} if method == "Runtime.evaluate" else {}})
+        return future
+
+    def call(self, method, params=None, session_id=None, timeout=cdp_driver.COMMAND_TIMEOUT):
+        return self.result(self.send(method, params, session_id), method, timeout)
+
+def test_cdp_commands_reach_the_command_listeners():
+    seen = []
+    @contextmanager
+    def listener(command, params):
+        yield
+        seen.append(command)
+    driver = CdpDriver(FakeConnection(value=2), "session", "target")
+    hooks.add_command_listener(listener)
+    try:
+        assert driver.execute_script("return 1 + 1;") == 2
+        driver.pipeline([("Input.dispatchMouseEvent", {"type": "mousePressed"}), ("Input.dispatchMouseEvent", {"type": "mouseReleased"})])
+    finally:
+        hooks.remove_command_listener(listener)
+    assert seen == ["Runtime.evaluate", "Input.dispatchMouseEvent", "Input.dispatchMouseEvent"]
+
+def test_element_references_carry_the_document_they_came_from():
+    driver = CdpDriver(FakeConnection(), "session", "target")
+    element = driver._from_js({cdp_driver.ELEMENT_KEY: ["document-1", 3]})
+    assert (element.document, element.index) == ("document-1", 3)
+    assert driver._to_js([element]) == [{cdp_driver.ELEMENT_KEY: ["document-1", 3]}]
+    assert element != CdpElement(driver, 3, "document-2"), "The same index in another document is another element."
@@ -0,0 +1,49 @@
+import pytest
+from pathlib import Path
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from pages.checkout_step_one import CheckoutStepOnePage
+from utils.data_driven import RowStream
+
+DATA_DIR = Path(__file__).parent / "data"
+PRODUCT_NAME = "Sauce Labs Backpack"
+
+@pytest.mark.login
+def test_logins_from_file(login_page: LoginPage, inventory_page: InventoryPage, subtests):
+    """Every row of logins.csv is attempted on the same open login page; a row that logs in gets the page reopened"""
+    def reopen():
+        login_page.driver.delete_all_cookies()
+        login_page.open()
+
+    login_page.open()
+    stream = RowStream(login_page, reopen)
+    for row in stream.read(DATA_DIR / "logins.csv"):
+        with subtests.test(msg=row["case"]):
+            login_page.submit(row["username"], row["password"])
+            if not row["expected_error"]:
+                assert inventory_page.is_on_inventory_page(), f"Login did not redirect to inventory page for user: {row['username']}"
+                continue
+            error_message = login_page.get_error_message()
+            assert error_message is not None, f"Error message not displayed for user: {row['username']}"
+            assert row["expected_error"] in error_message, \
+                f"Incorrect error message. Expected message: {row['expected_error']}, Received: {error_message}"
+    # Every row but the first starts from a reset, except the one after the valid login, which reopens the page
+    assert (stream.resets, stream.reopens) == (stream.rows - 2, 1), stream.summary()
+
+@pytest.mark.checkout
+def test_checkout_missing_fields_from_file(seed_session, standard_user_credentials, subtests):
+    """Every row of checkout_missing_fields.jsonl is submitted on the same open checkout form"""
+    def reopen():
+        return seed_session(standard_user_credentials["username"], [PRODUCT_NAME], CheckoutStepOnePage)
+
+    checkout_step_one_page: CheckoutStepOnePage = reopen()
+    stream = RowStream(checkout_step_one_page, reopen)
+    for row in stream.read(DATA_DIR / "checkout_missing_fields.jsonl"):
+        with subtests.test(msg=row["case"]):
+            checkout_step_one_page.fill_checkout_info(row["first_name"], row["last_name"], row["postal_code"], submit=True)
+            error_message = checkout_step_one_page.get_error_message()
+            assert row["expected_error"] in error_message, \
+                f"Incorrect error. Expected: '{row['expected_error']}', Got: '{error_message}'"
+            assert checkout_step_one_page.is_checkout_step_one_page_displayed(), "Should remain on checkout step one page."
+    # Every row leaves an error showing, so each one after the first starts from a reset and none reopens the page
+    assert (stream.resets, stream.reopens) == (stream.rows - 1, 0), stream.summary()
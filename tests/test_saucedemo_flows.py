@@ -1,3 +1,4 @@
+import os
 import pytest
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
@@ -5,10 +6,14 @@ from pages.cart_page import CartPage
 from pages.checkout_step_one import CheckoutStepOnePage
 from pages.checkout_step_two import CheckoutStepTwoPage
 from pages.checkout_complete import CheckoutCompletePage
+from pages.session_state import SessionState
 
 PRODUCT_1_NAME = "Sauce Labs Backpack"
 PRODUCT_2_NAME = "Sauce Labs Bike Light"
 CHECKOUT_INFO = {"first_name": "Test", "last_name": "User", "postal_code": "12345"}
+# Session states for --state-order (see utils/state_order.py)
+STANDARD_USER = os.getenv("SAUCEDEMO_STANDARD_USER", "standard_user")
+LOGGED_IN = SessionState(STANDARD_USER)
 
 @pytest.mark.login
 class TestLogin:
@@ -19,6 +24,10 @@ class TestLogin:
         assert inventory_page.get_item_count() > 0, "No products found on inventory page."
 
 
+    def test_login_by_typing_into_fields(self, login_page: LoginPage, inventory_page: InventoryPage, standard_user_credentials):
+        login_page.login(standard_user_credentials["username"], standard_user_credentials["password"], keystrokes=True)
+        assert inventory_page.is_inventory_page_displayed(), "Typed login did not redirect to inventory page."
+
     def test_locked_out_user_login(self, login_page: LoginPage, inventory_page: InventoryPage, locked_out_user_credentials):
         login_page.login(locked_out_user_credentials["username"], locked_out_user_credentials["password"])
         error_message = login_page.get_error_message()
@@ -42,6 +51,7 @@ class TestLogin:
 @pytest.mark.inventory
 class TestInventoryActions:
     @pytest.mark.regression
+    @pytest.mark.state(requires=LOGGED_IN, leaves=SessionState(STANDARD_USER, (PRODUCT_1_NAME,), CartPage))
     def test_add_single_item_to_cart(self, logged_in_standard_user, cart_page: CartPage):
         inventory_page: InventoryPage = logged_in_standard_user
 
@@ -56,6 +66,7 @@ class TestInventoryActions:
         assert len(cart_items) == 1, "Incorrect number of items in cart."
 
     @pytest.mark.regression
+    @pytest.mark.state(requires=LOGGED_IN, leaves=SessionState(STANDARD_USER, (PRODUCT_1_NAME, PRODUCT_2_NAME), CartPage))
     def test_add_multiple_items_to_cart(self, logged_in_standard_user, cart_page: CartPage):
         inventory_page: InventoryPage = logged_in_standard_user
         
@@ -70,9 +81,32 @@ class TestInventoryActions:
         assert PRODUCT_2_NAME in cart_items, f"{PRODUCT_2_NAME} not found in cart."
         assert len(cart_items) == 2, "Incorrect number of items in cart."
 
+    @pytest.mark.state(requires=LOGGED_IN, leaves=LOGGED_IN)
+    def test_product_details_match_grid(self, logged_in_standard_user):
+        inventory_page: InventoryPage = logged_in_standard_user
+        details = inventory_page.get_all_item_details()
+        assert len(details) == inventory_page.get_item_count(), "Details not read for every product."
+        assert [item["name"] for item in details] == inventory_page.get_product_names(), "Product names do not match."
+        assert [item["price"] for item in details] == inventory_page.get_product_prices(), "Product prices do not match."
+        assert all(item["description"] for item in details), "Product without a description."
+
+    @pytest.mark.state(requires=LOGGED_IN)
+    def test_sort_orders(self, logged_in_standard_user):
+        inventory_page: InventoryPage = logged_in_standard_user
+        for order in (InventoryPage.SORT_PRICE_ASC, InventoryPage.SORT_PRICE_DESC, InventoryPage.SORT_NAME_DESC, InventoryPage.SORT_NAME_ASC):
+            inventory_page.sort_products(order)
+            assert inventory_page.is_sorted_by(order), f"Products not sorted by '{order}'."
+
+    @pytest.mark.state(requires=LOGGED_IN, leaves=SessionState(STANDARD_USER, (PRODUCT_1_NAME, PRODUCT_2_NAME), InventoryPage))
+    def test_add_items_in_one_call(self, logged_in_standard_user):
+        inventory_page: InventoryPage = logged_in_standard_user
+        inventory_page.add_items_to_cart([PRODUCT_1_NAME, PRODUCT_2_NAME])
+        assert inventory_page.get_cart_badge_count() == 2, "Cart badge count incorrect after adding two items at once."
+
 @pytest.mark.cart
 class TestCartActions:
     @pytest.mark.regression
+    @pytest.mark.state(requires=LOGGED_IN, leaves=SessionState(STANDARD_USER, (PRODUCT_2_NAME,), InventoryPage))
     def test_remove_item_from_cart_page(self, logged_in_standard_user, cart_page: CartPage):
         inventory_page: InventoryPage = logged_in_standard_user
         inventory_page.add_item_to_cart_by_name(PRODUCT_1_NAME)
@@ -93,14 +127,20 @@ class TestCartActions:
         assert inventory_page.is_inventory_page_displayed(), "Not back on inventory page."
         assert inventory_page.get_cart_badge_count() == 1, "Cart badge on inventory page not updated after removal."
 
+    @pytest.mark.state(requires=SessionState(STANDARD_USER, (PRODUCT_1_NAME, PRODUCT_2_NAME), CartPage),
+                       leaves=SessionState(STANDARD_USER, (PRODUCT_1_NAME, PRODUCT_2_NAME), CartPage))
+    def test_seeded_cart_is_shown_on_cart_page(self, seed_session, standard_user_credentials):
+        cart_page: CartPage = seed_session(standard_user_credentials["username"], [PRODUCT_1_NAME, PRODUCT_2_NAME], CartPage)
+        assert cart_page.is_cart_page_displayed(), "Seeded session did not open the cart page."
+        cart_items = cart_page.get_item_names_in_cart()
+        assert sorted(cart_items) == sorted([PRODUCT_1_NAME, PRODUCT_2_NAME]), "Seeded cart contents not shown."
+
 @pytest.mark.checkout
+@pytest.mark.state(requires=SessionState(STANDARD_USER, (PRODUCT_1_NAME,), CheckoutStepOnePage)) # leaves an error showing
 class TestCheckoutValidations:
     @pytest.fixture(autouse=True) 
-    def test_navigate_to_checkout_step_one(self, logged_in_standard_user, cart_page: CartPage):
-        self.inventory_page: InventoryPage = logged_in_standard_user
-        self.inventory_page.add_item_to_cart_by_name(PRODUCT_1_NAME)
-        self.inventory_page.go_to_cart()
-        cart_page.proceed_to_checkout()
+    def test_navigate_to_checkout_step_one(self, seed_session, standard_user_credentials):
+        seed_session(standard_user_credentials["username"], [PRODUCT_1_NAME], CheckoutStepOnePage)
     
     @pytest.mark.parametrize("first_name, last_name, postal_code, expected_error", [
         ("", "User", "12345", "Error: First Name is required"),
@@ -121,12 +161,8 @@ class TestCheckoutValidations:
 class TestEndToEndPurchase:
     @pytest.mark.smoke
     @pytest.mark.regression
-    def test_full_e2e_purchase_flow_single_item(
-        self, logged_in_standard_user, cart_page: CartPage,
-        checkout_step_one_page: CheckoutStepOnePage,
-        checkout_step_two_page: CheckoutStepTwoPage,
-        checkout_complete_page: CheckoutCompletePage
-    ):
+    @pytest.mark.state(requires=LOGGED_IN, leaves=LOGGED_IN)
+    def test_full_e2e_purchase_flow_single_item(self, logged_in_standard_user):
         """Verifies the complete end-to-end purchase flow for a single item."""
         inventory_page: InventoryPage = logged_in_standard_user
 
@@ -134,25 +170,25 @@ class TestEndToEndPurchase:
         inventory_page.add_item_to_cart_by_name(PRODUCT_1_NAME)
         assert inventory_page.get_cart_badge_count() == 1, "Cart badge incorrect after adding item."
 
-        # 2. Go to Cart Page and verify item
-        inventory_page.go_to_cart()
+        # 2. Go to Cart Page and verify item. Every navigation waits until the next page is ready and returns it.
+        cart_page = inventory_page.go_to_cart()
         assert cart_page.is_cart_page_displayed(), "Not on Cart Page."
         assert PRODUCT_1_NAME in cart_page.get_item_names_in_cart(), f"{PRODUCT_1_NAME} not in cart."
 
         # 3. Proceed to Checkout Step One Page
-        cart_page.proceed_to_checkout()
+        checkout_step_one_page = cart_page.proceed_to_checkout()
         assert checkout_step_one_page.is_checkout_step_one_page_displayed(), "Not on Checkout Step One page."
 
         # 4. Fill checkout information and continue
         checkout_step_one_page.fill_checkout_info(
             CHECKOUT_INFO["first_name"], CHECKOUT_INFO["last_name"], CHECKOUT_INFO["postal_code"]
         )
-        checkout_step_one_page.click_continue()
+        checkout_step_two_page = checkout_step_one_page.continue_to_overview()
         assert checkout_step_two_page.is_checkout_overview_page_displayed(), "Not on Checkout Overview page."
 
         # 5. Verify item on Overview Page and Finish
         assert PRODUCT_1_NAME in checkout_step_two_page.get_item_names_in_overview(), f"{PRODUCT_1_NAME} not in overview." 
-        checkout_step_two_page.click_finish()
+        checkout_complete_page = checkout_step_two_page.click_finish()
         assert checkout_complete_page.is_checkout_complete_page_displayed(), "Not on Checkout Complete page."
 
         # 6. Verify completion message
@@ -160,8 +196,6 @@ class TestEndToEndPurchase:
             "Incorrect completion message."
 
         # 7. Go back home and verify cart is empty
-        checkout_complete_page.click_back_home()
+        inventory_page = checkout_complete_page.click_back_home()
         assert inventory_page.is_inventory_page_displayed(), "Not back on Inventory Page."
         assert inventory_page.get_cart_badge_count() == 0, "Cart should be empty after completing order."
-
-
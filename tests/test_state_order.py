@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from pages.cart_page import CartPage
+from pages.session_state import SessionState
+from utils.state_order import StateOrder
+
+STANDARD = SessionState("standard_user")
+STANDARD_CART = SessionState("standard_user", ("Sauce Labs Backpack",), CartPage)
+PROBLEM = SessionState("problem_user")
+
+class FakeItem:
+    """Stands in for a pytest item with a state marker and a browser_profile marker"""
+    def __init__(self, nodeid, requires=None, leaves=None, profile="full"):
+        self.nodeid = nodeid
+        self.markers = {"state": SimpleNamespace(kwargs={"requires": requires, "leaves": leaves}),
+                        "browser_profile": SimpleNamespace(args=(profile,))}
+
+    def get_closest_marker(self, name):
+        return self.markers.get(name)
+
+def finish(order, item, nextitem, failed=False):
+    """Runs item the way pytest would, then offers its browser to nextitem; returns whether it was kept"""
+    protocol = order.pytest_runtest_protocol(item, nextitem)
+    next(protocol)
+    order._failed = failed
+    released = []
+    return order.keep(item, "driver", lambda: released.append("driver")), released
+
+def test_browser_is_carried_to_a_test_of_the_same_user():
+    order = StateOrder()
+    first = FakeItem("test_add", requires=STANDARD, leaves=STANDARD_CART)
+    second = FakeItem("test_cart", requires=STANDARD_CART)
+    kept, released = finish(order, first, second)
+    assert kept
+    driver, _ = order.take(second)
+    assert driver == "driver" and order.carried == 1
+    assert order.in_state(driver, STANDARD_CART), "The next test can skip seeding the state it was handed."
+    assert released == []
+
+def test_browser_is_not_kept_for_another_user():
+    order = StateOrder()
+    first = FakeItem("test_add", requires=STANDARD, leaves=STANDARD_CART)
+    second = FakeItem("test_problem_user", requires=PROBLEM)
+    assert finish(order, first, second) == (False, [])
+    assert order.take(second) is None
+
+def test_browser_is_not_kept_after_a_failure_or_for_another_profile():
+    order = StateOrder()
+    first = FakeItem("test_add", requires=STANDARD, leaves=STANDARD_CART)
+    assert finish(order, first, FakeItem("test_cart", requires=STANDARD_CART), failed=True)[0] is False
+    assert finish(order, first, FakeItem("test_lean", requires=STANDARD_CART, profile="lean"))[0] is False
+    assert finish(order, first, FakeItem("test_undeclared"))[0] is False
+
+def test_kept_browser_is_released_when_its_test_does_not_run():
+    order = StateOrder()
+    first = FakeItem("test_add", requires=STANDARD, leaves=STANDARD_CART)
+    skipped = FakeItem("test_cart", requires=STANDARD_CART)
+    kept, released = finish(order, first, skipped)
+    assert kept
+    next(order.pytest_runtest_protocol(FakeItem("test_other"), None)) # the kept-for test was deselected
+    assert released == ["driver"]
+    assert order.take(skipped) is None
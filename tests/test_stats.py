@@ -0,0 +1,36 @@
+import pytest
+from benchmarks.harness import compare
+from utils.stats import percentile, summarize
+
+SAMPLES = [40.0, 10.0, 30.0, 20.0]
+
+def test_percentile_interpolates_between_samples():
+    assert percentile(SAMPLES, 0) == 10.0
+    assert percentile(SAMPLES, 50) == 25.0
+    assert percentile(SAMPLES, 90) == pytest.approx(37.0)
+    assert percentile(SAMPLES, 100) == 40.0
+
+def test_percentile_of_a_single_sample():
+    assert percentile([7.5], 99) == 7.5
+
+def test_summarize():
+    summary = summarize(SAMPLES)
+    assert summary["n"] == 4
+    assert summary["mean"] == 25.0
+    assert (summary["min"], summary["max"]) == (10.0, 40.0)
+    assert summary["p50"] == 25.0
+    assert summary["p50"] <= summary["p90"] <= summary["p95"] <= summary["p99"] <= summary["max"]
+
+def test_summarize_without_samples():
+    assert summarize([]) == {"n": 0}
+
+def test_compare_flags_only_slowdowns_beyond_the_tolerance():
+    baseline = {"a": {"p50": 100.0}, "b": {"p50": 100.0}, "c": {"p50": 100.0}}
+    results = {"a": {"p50": 109.0}, "b": {"p50": 111.0}, "c": {"p50": 50.0}, "new": {"p50": 500.0}}
+    assert compare(results, baseline, tolerance=0.10) == ["b"]
+
+def test_compare_on_another_statistic():
+    baseline = {"a": {"p50": 100.0, "p99": 200.0}}
+    results = {"a": {"p50": 100.0, "p99": 300.0}}
+    assert compare(results, baseline, tolerance=0.10) == []
+    assert compare(results, baseline, tolerance=0.10, stat="p99") == ["a"]
@@ -0,0 +1,154 @@
+"""
+Per-locator wait timeouts learned from how long each locator took in earlier runs.
+
+With --record-locator-timings or --adaptive-timeouts, every successful BasePage wait records how
+long its locator took to become present, visible, clickable or absent. The samples are kept in
+--locator-timings-file between runs. With --adaptive-timeouts, a wait that is not given an
+explicit timeout uses
+
+    p99 of the locator's recorded times * 1.5 + 0.25s    (at least 0.5s, at most the fixed default)
+
+once the locator has at least 5 samples. A locator that regresses then fails within a fraction of a
+second instead of after 10. The failure is reported as a latency anomaly in the test report and
+in the terminal summary. Locators without enough history keep the fixed defaults. Without either
+option the plugin is not registered: nothing is recorded and BasePage keeps its fixed timeouts.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from pages.base_page import BasePage
+from utils.stats import percentile
+
+DEFAULT_FILE = ".locator_timings.json"
+PERCENTILE = 99
+FACTOR = 1.5
+MARGIN = 0.25
+MINIMUM = 0.5
+MIN_SAMPLES = 5
+KEEP_SAMPLES = 50
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("adaptive timeouts")
+    group.addoption("--adaptive-timeouts", action="store_true", default=False,
+                    help="Base wait timeouts on each locator's recorded appearance times (and keep recording them).")
+    group.addoption("--record-locator-timings", action="store_true", default=False,
+                    help="Record each locator's appearance times without changing any timeout.")
+    group.addoption("--locator-timings-file", default=DEFAULT_FILE,
+                    help="File where per-locator appearance times are stored between runs.")
+
+
+def pytest_configure(config):
+    if not config.getoption("adaptive_timeouts") and not config.getoption("record_locator_timings"):
+        return
+    path = Path(config.rootpath, config.getoption("locator_timings_file"))
+    model = TimeoutModel(load_samples(path), adaptive=config.getoption("adaptive_timeouts"))
+    config.pluginmanager.register(AdaptiveTimeouts(config, model, path), "adaptive-timeouts")
+
+
+def load_samples(path: Path) -> dict[str, list[float]]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def timing_key(condition: str, locator: tuple) -> str:
+    return f"{condition}:{locator[0]}={locator[1]}"
+
+
+class TimeoutModel:
+    """Recorded wait times per (condition, locator) and the timeouts derived from them"""
+    def __init__(self, samples: dict[str, list[float]] | None = None, adaptive: bool = True):
+        self.samples = samples or {}
+        self.adaptive = adaptive
+        self.new: dict[str, list[float]] = {}
+        self.anomalies: list[dict] = []
+
+    def learned(self, condition: str, locator: tuple) -> float | None:
+        """The learned timeout for a locator, or None while it has too little history"""
+        history = self.samples.get(timing_key(condition, locator), [])
+        if len(history) < MIN_SAMPLES:
+            return None
+        return max(MINIMUM, percentile(history, PERCENTILE) * FACTOR + MARGIN)
+
+    def timeout_for(self, condition: str, locator: tuple, default: float) -> float:
+        learned = self.learned(condition, locator) if self.adaptive else None
+        return default if learned is None else min(default, round(learned, 3))
+
+    def record(self, condition: str, locator: tuple, elapsed: float):
+        self.new.setdefault(timing_key(condition, locator), []).append(round(elapsed, 3))
+
+    def miss(self, condition: str, locator: tuple, timeout: float) -> str | None:
+        """Notes a wait that ran out of a learned timeout and describes it; None for a default timeout"""
+        if not self.adaptive or self.learned(condition, locator) is None:
+            return None
+        key = timing_key(condition, locator)
+        history = self.samples[key]
+        anomaly = {"locator": key, "timeout": timeout, "p50": round(percentile(history, 50), 3),
+                   "p99": round(percentile(history, PERCENTILE), 3), "samples": len(history)}
+        self.anomalies.append(anomaly)
+        return (f"{key} usually takes {anomaly['p50']}s (p99 {anomaly['p99']}s over {anomaly['samples']} runs) "
+                f"but did not happen within {timeout}s")
+
+    def merge(self, new: dict[str, list[float]]) -> dict[str, list[float]]:
+        """Stored samples with the new ones appended, keeping the most recent KEEP_SAMPLES per locator"""
+        merged = {key: list(values) for key, values in self.samples.items()}
+        for key, values in new.items():
+            merged[key] = (merged.get(key, []) + values)[-KEEP_SAMPLES:]
+        return merged
+
+
+class AdaptiveTimeouts:
+    def __init__(self, config, model: TimeoutModel, path: Path):
+        self.config = config
+        self.model = model
+        self.path = path
+        self.anomalies: dict[str, list[dict]] = {}
+        self._seen = 0
+
+    def pytest_sessionstart(self, session):
+        BasePage.timeout_model = self.model
+
+    def pytest_runtest_setup(self, item):
+        self._seen = len(self.model.anomalies)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        new = self.model.anomalies[self._seen:]
+        self._seen = len(self.model.anomalies)
+        if new and report.failed:
+            self.anomalies.setdefault(item.nodeid, []).extend(new)
+            report.sections.append(("latency anomalies", "\n".join(
+                f"{a['locator']}: timed out after {a['timeout']}s, p99 {a['p99']}s" for a in new)))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collects the samples and anomalies of an xdist worker on the controller"""
+        output = json.loads(node.workeroutput.get("locator_timings", "{}"))
+        for key, values in output.get("new", {}).items():
+            self.model.new.setdefault(key, []).extend(values)
+        self.anomalies.update(output.get("anomalies", {}))
+
+    def pytest_sessionfinish(self, session):
+        BasePage.timeout_model = None
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["locator_timings"] = json.dumps({"new": self.model.new, "anomalies": self.anomalies})
+            return
+        if self.model.new:
+            self.path.write_text(json.dumps(self.model.merge(self.model.new), indent=2, sort_keys=True))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.anomalies:
+            return
+        terminalreporter.section("latency anomalies")
+        for nodeid, anomalies in self.anomalies.items():
+            terminalreporter.write_line(nodeid)
+            for a in anomalies:
+                terminalreporter.write_line(f"  {a['locator']}: timed out after {a['timeout']}s "
+                                            f"(p50 {a['p50']}s, p99 {a['p99']}s over {a['samples']} runs)")
+
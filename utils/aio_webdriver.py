@@ -0,0 +1,236 @@
+"""
+A small asyncio WebDriver (W3C) client for driving many browser sessions from one event loop.
+
+All sessions share one chromedriver process and a pool of keep-alive HTTP connections to it, so a
+command only occupies a connection while it is in flight. Only the commands the async page objects
+need are implemented.
+
+    async with ChromeDriverServer() as server:
+        drivers = await asyncio.gather(*(server.new_session(LEAN) for _ in range(20)))
+"""
+import asyncio
+import json
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.driver_finder import DriverFinder
+
+from utils.browser import DISABLE_ANIMATIONS_SCRIPT, FULL, BrowserProfile, chrome_options
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+SCRIPT_TIMEOUT_MS = 60_000
+
+ERRORS = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "javascript error": JavascriptException,
+    "timeout": TimeoutException,
+    "script timeout": TimeoutException,
+}
+
+
+class HttpConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one host, shared by every coroutine that sends commands"""
+    def __init__(self, host: str, port: int, max_connections: int = 32):
+        self.host = host
+        self.port = port
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def request(self, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        async with self._slots:
+            reused = bool(self._idle)
+            connection = self._idle.pop() if reused else await asyncio.open_connection(self.host, self.port)
+            try:
+                try:
+                    status, data, keep_alive = await self._round_trip(connection, method, path, body)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    connection[1].close()
+                    if not reused:
+                        raise
+                    # The server closed an idle connection; retry once on a fresh one
+                    connection = await asyncio.open_connection(self.host, self.port)
+                    status, data, keep_alive = await self._round_trip(connection, method, path, body)
+            except BaseException:
+                # Cancelled, timed out or unparsable mid-response: what is left on the connection is unknown
+                connection[1].close()
+                raise
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection[1].close()
+        return status, json.loads(data) if data else {}
+
+    async def _round_trip(self, connection, method: str, path: str, body: bytes) -> tuple[int, bytes, bool]:
+        reader, writer = connection
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json;charset=UTF-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        status_line = (await reader.readline()).split()
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            # b"" when the server closed an idle keep-alive connection; raised as such so request() retries
+            raise ConnectionError(f"No HTTP status line from {self.host}:{self.port}: {b' '.join(status_line)!r}")
+        status = int(status_line[1])
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = b""
+            while size := int((await reader.readline()).strip(), 16):
+                data += await reader.readexactly(size)
+                await reader.readline()
+            await reader.readline()
+        else:
+            data = await reader.readexactly(int(headers.get("content-length", 0)))
+        return status, data, headers.get("connection", "").lower() != "close"
+
+    async def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class AsyncWebElement:
+    def __init__(self, driver: "AsyncWebDriver", element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    async def _command(self, method: str, path: str, payload: dict | None = None):
+        return await self.driver._command(method, f"/element/{self.id}{path}", payload)
+
+    async def click(self):
+        await self._command("POST", "/click", {})
+
+    async def clear(self):
+        await self._command("POST", "/clear", {})
+
+    async def send_keys(self, text: str):
+        await self._command("POST", "/value", {"text": text})
+
+    async def text(self) -> str:
+        return await self._command("GET", "/text")
+
+    async def get_attribute(self, name: str) -> str | None:
+        return await self._command("GET", f"/attribute/{name}")
+
+    async def is_displayed(self) -> bool:
+        return await self._command("GET", "/displayed")
+
+
+class AsyncWebDriver:
+    """One browser session. Every method is a coroutine that sends a single WebDriver command."""
+    def __init__(self, pool: HttpConnectionPool, session_id: str):
+        self.pool = pool
+        self.session_id = session_id
+
+    @classmethod
+    async def start(cls, pool: HttpConnectionPool, profile: BrowserProfile = FULL) -> "AsyncWebDriver":
+        capabilities = chrome_options(profile).to_capabilities()
+        status, response = await pool.request("POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        driver = cls(pool, _unwrap(status, response)["sessionId"])
+        await driver._command("POST", "/timeouts", {"script": SCRIPT_TIMEOUT_MS})
+        if profile.blocked_urls:
+            await driver.execute_cdp_cmd("Network.enable", {})
+            await driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+        if profile.disable_animations:
+            await driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DISABLE_ANIMATIONS_SCRIPT})
+        return driver
+
+    async def _command(self, method: str, path: str, payload: dict | None = None):
+        status, response = await self.pool.request(method, f"/session/{self.session_id}{path}", payload)
+        return self._decode(_unwrap(status, response))
+
+    def _encode(self, value):
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._encode(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._encode(v) for k, v in value.items()}
+        return value
+
+    def _decode(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return AsyncWebElement(self, value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self._decode(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._decode(v) for k, v in value.items()}
+        return value
+
+    async def get(self, url: str):
+        await self._command("POST", "/url", {"url": url})
+
+    async def current_url(self) -> str:
+        return await self._command("GET", "/url")
+
+    async def title(self) -> str:
+        return await self._command("GET", "/title")
+
+    async def execute_script(self, script: str, *args):
+        return await self._command("POST", "/execute/sync", {"script": script, "args": self._encode(list(args))})
+
+    async def execute_async_script(self, script: str, *args):
+        return await self._command("POST", "/execute/async", {"script": script, "args": self._encode(list(args))})
+
+    async def execute_cdp_cmd(self, cmd: str, params: dict):
+        return await self._command("POST", "/goog/cdp/execute", {"cmd": cmd, "params": params})
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        return await self._command("POST", "/element", {"using": by, "value": value})
+
+    async def find_elements(self, by: str, value: str) -> list[AsyncWebElement]:
+        return await self._command("POST", "/elements", {"using": by, "value": value})
+
+    async def delete_all_cookies(self):
+        await self._command("DELETE", "/cookie")
+
+    async def quit(self):
+        await self.pool.request("DELETE", f"/session/{self.session_id}")
+
+
+def _unwrap(status: int, response: dict):
+    value = response.get("value")
+    if status == 200:
+        return value
+    error = value.get("error", "") if isinstance(value, dict) else ""
+    message = value.get("message", "") if isinstance(value, dict) else str(value)
+    raise ERRORS.get(error, WebDriverException)(f"{error}: {message}")
+
+
+class ChromeDriverServer:
+    """Runs one chromedriver process that every async session talks to"""
+    def __init__(self, max_connections: int = 32):
+        self.max_connections = max_connections
+        self.service = Service()
+        self.pool: HttpConnectionPool | None = None
+        self.sessions: list[AsyncWebDriver] = []
+
+    async def __aenter__(self) -> "ChromeDriverServer":
+        self.service.path = self.service.env_path() or DriverFinder(self.service, chrome_options()).get_driver_path()
+        await asyncio.to_thread(self.service.start)
+        self.pool = HttpConnectionPool("localhost", self.service.port, self.max_connections)
+        return self
+
+    async def new_session(self, profile: BrowserProfile = FULL) -> AsyncWebDriver:
+        driver = await AsyncWebDriver.start(self.pool, profile)
+        self.sessions.append(driver)
+        return driver
+
+    async def __aexit__(self, *exc):
+        await asyncio.gather(*(driver.quit() for driver in self.sessions), return_exceptions=True)
+        await self.pool.close()
+        await asyncio.to_thread(self.service.stop)
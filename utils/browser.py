@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+LEAN_ARGUMENTS = (
+    "--window-size=1920,1080",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--no-first-run",
+    "--mute-audio",
+)
+
+# Network.setBlockedURLs patterns: images, fonts and third-party analytics
+BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*backtrace.io*", "*hotjar.com*", "*segment.io*",
+)
+
+DISABLE_ANIMATIONS_SCRIPT = """
+(function () {
+    var style = document.createElement("style");
+    style.textContent = "*, *::before, *::after { transition: none !important; animation: none !important; scroll-behavior: auto !important; }";
+    if (document.documentElement) { document.documentElement.appendChild(style); }
+    else { document.addEventListener("DOMContentLoaded", function () { document.head.appendChild(style); }); }
+}());
+"""
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """How a browser is launched and tuned for a test run"""
+    name: str
+    headless: bool = False
+    arguments: tuple[str, ...] = ()
+    blocked_urls: tuple[str, ...] = ()
+    disable_animations: bool = False
+
+
+FULL = BrowserProfile("full")
+LEAN = BrowserProfile("lean", headless=True, arguments=LEAN_ARGUMENTS, blocked_urls=BLOCKED_URLS, disable_animations=True)
+PROFILES = {profile.name: profile for profile in (FULL, LEAN)}
+
+
+def chrome_options(profile: BrowserProfile = FULL) -> Options:
+    options = Options()
+
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False
+    }
+    options.add_experimental_option("prefs", prefs)
+
+    options.add_argument("--incognito")
+    if profile.headless:
+        options.add_argument("--headless=new")
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    return options
+
+
+def create_chrome_driver(profile: BrowserProfile = FULL) -> webdriver.Chrome:
+    # No implicit wait: BasePage waits in the browser, and an implicit wait would be added on top of every miss
+    driver = webdriver.Chrome(options=chrome_options(profile))
+    apply_profile(driver, profile)
+    return driver
+
+
+def apply_profile(driver: WebDriver, profile: BrowserProfile):
+    """
+    Applies the DevTools side of a profile to the current window.
+    DevTools settings are per tab, so this has to be repeated whenever a fresh window is opened.
+    """
+    if profile.blocked_urls:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+    if profile.disable_animations:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DISABLE_ANIMATIONS_SCRIPT})
@@ -0,0 +1,146 @@
+"""
+Browser-side performance metrics per test, from Chrome DevTools (Performance.getMetrics).
+
+With --browser-metrics, the metrics below are sampled at these points:
+  - before and after the call phase of every test that uses the `driver` fixture
+  - after every page transition in pages/ (navigate_to and wait_until_ready)
+
+Deltas over the thresholds are flagged in the terminal summary. The defaults are in THRESHOLDS and
+can be overridden with the `browser_metric_thresholds` ini option ("JSHeapUsedSize=50000000"). One
+JSON line per test is appended to --browser-metrics-jsonl, tagged with the run's start time and
+$BUILD_ID, so trends can be followed across builds.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils import hooks
+
+DEFAULT_JSONL = "browser_metrics.jsonl"
+METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "Documents", "JSEventListeners",
+           "LayoutCount", "RecalcStyleCount", "LayoutDuration", "ScriptDuration", "TaskDuration")
+# Per-test deltas above these are flagged (bytes, counts, seconds)
+THRESHOLDS = {
+    "JSHeapUsedSize": 20_000_000,
+    "Nodes": 5_000,
+    "JSEventListeners": 1_000,
+    "LayoutCount": 200,
+    "ScriptDuration": 1.0,
+}
+TRANSITION_METHODS = ("navigate_to", "wait_until_ready")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser metrics")
+    group.addoption("--browser-metrics", action="store_true", default=False,
+                    help="Sample Chrome performance metrics around every test and page transition.")
+    group.addoption("--browser-metrics-jsonl", default=DEFAULT_JSONL,
+                    help="File the per-test metrics are appended to, one JSON object per line.")
+    parser.addini("browser_metric_thresholds", type="linelist", default=[],
+                  help="metric=limit overrides for the per-test deltas that get flagged.")
+
+
+def pytest_configure(config):
+    if config.getoption("browser_metrics"):
+        config.pluginmanager.register(BrowserMetrics(config), "browser-metrics")
+
+
+def sample(driver) -> dict[str, float]:
+    """The current metrics of the driver's page, in one round trip"""
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    return {m["name"]: m["value"] for m in metrics if m["name"] in METRICS}
+
+
+def thresholds(config) -> dict[str, float]:
+    limits = dict(THRESHOLDS)
+    for line in config.getini("browser_metric_thresholds"):
+        name, _, limit = line.partition("=")
+        limits[name.strip()] = float(limit)
+    return limits
+
+
+class BrowserMetrics:
+    def __init__(self, config):
+        self.config = config
+        self.thresholds = thresholds(config)
+        self.run = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.build = os.getenv("BUILD_ID")
+        self.records: list[dict] = []
+        self._transitions: list[dict] | None = None
+
+    @contextmanager
+    def page_method(self, page, name, args, kwargs):
+        yield
+        if name in TRANSITION_METHODS and self._transitions is not None:
+            try:
+                self._transitions.append({"page": type(page).__name__, "method": name, "metrics": sample(page.driver)})
+            except WebDriverException:
+                pass
+
+    def pytest_sessionstart(self, session):
+        hooks.add_page_listener(self.page_method)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        driver = item.funcargs.get("driver")
+        if driver is None:
+            yield
+            return
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {}) # per tab, and pooled browsers get a fresh tab per test
+            before = sample(driver)
+        except WebDriverException:
+            yield
+            return
+        self._transitions = []
+        try:
+            yield
+        finally:
+            transitions, self._transitions = self._transitions, None
+            try:
+                after = sample(driver)
+            except WebDriverException:
+                after = None
+            if after is not None:
+                self._record(item.nodeid, before, after, transitions)
+
+    def _record(self, nodeid: str, before: dict, after: dict, transitions: list[dict]):
+        delta = {name: after[name] - before[name] for name in after if name in before}
+        flagged = {name: delta[name] for name, limit in self.thresholds.items() if delta.get(name, 0) > limit}
+        self.records.append({
+            "run": self.run, "build": self.build, "test": nodeid,
+            "before": before, "after": after, "delta": delta,
+            "transitions": transitions, "flagged": flagged,
+        })
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collects the records of an xdist worker on the controller"""
+        self.records.extend(json.loads(node.workeroutput.get("browser_metrics", "[]")))
+
+    def pytest_sessionfinish(self, session):
+        hooks.remove_page_listener(self.page_method)
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["browser_metrics"] = json.dumps(self.records)
+            return
+        if self.records:
+            path = Path(self.config.rootpath, self.config.getoption("browser_metrics_jsonl"))
+            with path.open("a") as f:
+                for record in self.records:
+                    f.write(json.dumps(record, sort_keys=True) + "\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        terminalreporter.section("browser metrics")
+        flagged = [record for record in self.records if record["flagged"]]
+        for record in flagged:
+            over = ", ".join(f"{name} +{value:g}" for name, value in record["flagged"].items())
+            terminalreporter.write_line(f"{record['test']}: {over}")
+        terminalreporter.write_line(f"{len(flagged)} of {len(self.records)} tests over thresholds; "
+                                    f"appended to {self.config.getoption('browser_metrics_jsonl')}")
@@ -0,0 +1,499 @@
+"""
+A WebDriver stand-in that talks to Chrome directly over the DevTools protocol, without chromedriver.
+
+BasePage only uses a small part of the WebDriver API:
+  - execute_script / execute_async_script, get, current_url, title and find_elements on the driver
+  - click / clear / send_keys / text / get_attribute on the elements its scripts return, plus
+    tag_name, get_dom_attribute, get_property, is_selected, is_enabled and find_elements for Select
+CdpDriver implements that surface over one persistent websocket to the browser, so the page
+objects run unchanged:
+  - every command is one websocket message, instead of an HTTP request to chromedriver that
+    chromedriver turns into DevTools messages
+  - commands are pipelined where order is all that matters: a click's mouse events and a
+    keystroke per character are sent together and their replies collected afterwards
+  - waits are event-driven: WAIT_FOR's MutationObserver promise is awaited by one pending
+    Runtime.evaluate, and get() returns on the page's load event instead of polling
+
+Each command is passed to the hooks' command listeners (utils/hooks.py) the way chromedriver's
+HTTP commands are, so --instrument and --round-trip-budget count CDP methods such as Runtime.evaluate.
+
+Every driver is a tab in its own browser context on one Chrome per profile, attached through a
+flattened session on the browser's websocket (as isolated as a browser of its own, see
+utils/shared_browser.py).
+
+    DRIVER_BACKEND=cdp pytest
+    python -m benchmarks --backend cdp
+"""
+import base64
+import json
+import os
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from contextlib import ExitStack
+from urllib.request import urlopen
+
+import websocket
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException, WebDriverException)
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.timeouts import Timeouts
+
+from pages import scripts
+from utils import hooks
+from utils.browser import FULL, BrowserProfile, apply_profile
+from utils.shared_browser import SharedChrome
+
+COMMAND_TIMEOUT = 30
+SCRIPT_TIMEOUT = 30  # chromedriver's default
+PAGE_LOAD_TIMEOUT = 60
+# Protocol errors raised when a script's document goes away under it; BasePage retries on "unloaded"
+UNLOADED_ERRORS = ("Execution context was destroyed", "Inspected target navigated or closed", "Cannot find context")
+# Keys.* characters that are not text, as (key, code, windowsVirtualKeyCode, text)
+SPECIAL_KEYS = {
+    Keys.ENTER: ("Enter", "Enter", 13, "\r"),
+    Keys.RETURN: ("Enter", "Enter", 13, "\r"),
+    Keys.TAB: ("Tab", "Tab", 9, ""),
+    Keys.BACKSPACE: ("Backspace", "Backspace", 8, ""),
+    Keys.ESCAPE: ("Escape", "Escape", 27, ""),
+}
+
+ELEMENT_KEY = "__cdp_element"
+
+# Runs a WebDriver-style script (a function body reading `arguments`, pasted in as is) and converts
+# elements both ways: nodes are kept in a per-document registry and passed as {__cdp_element: [token, index]}.
+# The token is random per document, so a reference from before a navigation is stale instead of naming
+# whatever node has the same index in the new document's registry.
+SCRIPT_WRAPPER = """
+(function (fn, args, asynchronous, timeoutMs) {
+    var registry = window.__cdpElements || (window.__cdpElements = {
+        token: Date.now().toString(36) + Math.random().toString(36).slice(2), nodes: []});
+    function unwrap(value) {
+        if (value && typeof value === "object") {
+            if (%(key)s in value) {
+                var ref = value[%(key)s], el = ref[0] === registry.token ? registry.nodes[ref[1]] : null;
+                if (!el || !el.isConnected) { throw new Error("stale element reference: element is not attached to the page document"); }
+                return el;
+            }
+            if (Array.isArray(value)) { return value.map(unwrap); }
+            var unwrapped = {};
+            Object.keys(value).forEach(function (k) { unwrapped[k] = unwrap(value[k]); });
+            return unwrapped;
+        }
+        return value;
+    }
+    function wrap(value) {
+        if (value instanceof NodeList || value instanceof HTMLCollection) { value = Array.prototype.slice.call(value); }
+        if (value instanceof Node) {
+            var index = registry.nodes.indexOf(value);
+            if (index === -1) { index = registry.nodes.push(value) - 1; }
+            var ref = {}; ref[%(key)s] = [registry.token, index];
+            return ref;
+        }
+        if (Array.isArray(value)) { return value.map(wrap); }
+        if (value && typeof value === "object") {
+            var wrapped = {};
+            Object.keys(value).forEach(function (k) { wrapped[k] = wrap(value[k]); });
+            return wrapped;
+        }
+        return value === undefined ? null : value;
+    }
+    args = unwrap(args);
+    if (!asynchronous) { return wrap(fn.apply(null, args)); }
+    return new Promise(function (resolve, reject) {
+        setTimeout(function () { reject(new Error("script timeout")); }, timeoutMs);
+        args.push(function (result) { resolve(wrap(result)); });
+        fn.apply(null, args);
+    });
+})(function () {
+%(body)s
+}, %(args)s, %(asynchronous)s, %(timeout)s)
+"""
+
+ELEMENT_TEXT = "return (arguments[0].innerText || arguments[0].textContent || '').trim();"
+# WebDriver's getAttribute: the property when there is one (value, checked, ...), the attribute otherwise
+ELEMENT_ATTRIBUTE = """
+var el = arguments[0], name = arguments[1], value = el[name];
+if (value === undefined || value === null || typeof value === "object" || typeof value === "function") { value = el.getAttribute(name); }
+if (typeof value === "boolean") { return value ? "true" : null; }
+return value === null ? null : String(value);
+"""
+# The point a click goes to. An <option> has no box of its own in the page, so it is selected here the way
+# chromedriver does it (toggled in a multiple select, input and change fired when it changed) and null is returned.
+ELEMENT_CLICK_POINT = """
+var el = arguments[0];
+if (el instanceof HTMLOptionElement) {
+    var select = el.closest("select");
+    if (select && !el.matches(":disabled")) {
+        var selected = select.multiple ? !el.selected : true;
+        if (selected !== el.selected) {
+            el.selected = selected;
+            select.dispatchEvent(new Event("input", {bubbles: true}));
+            select.dispatchEvent(new Event("change", {bubbles: true}));
+        }
+    }
+    return null;
+}
+el.scrollIntoView({block: "center", inline: "center"});
+var rect = el.getBoundingClientRect();
+return [rect.left + rect.width / 2, rect.top + rect.height / 2];
+"""
+ELEMENT_TAG_NAME = "return arguments[0].tagName.toLowerCase();"
+ELEMENT_DOM_ATTRIBUTE = "return arguments[0].getAttribute(arguments[1]);"
+ELEMENT_PROPERTY = "return arguments[0][arguments[1]];"
+# WebDriver's isElementSelected: an option's selectedness or a checkbox's / radio button's checkedness
+ELEMENT_SELECTED = "var el = arguments[0]; return el instanceof HTMLOptionElement ? el.selected : el instanceof HTMLInputElement && el.checked;"
+ELEMENT_ENABLED = "return !arguments[0].matches(':disabled');"
+ELEMENT_FOCUS = "arguments[0].focus();"
+ELEMENT_CLEAR = """
+var el = arguments[0];
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+el.focus();
+Object.getOwnPropertyDescriptor(proto, "value").set.call(el, "");
+el.dispatchEvent(new Event("input", {bubbles: true}));
+el.dispatchEvent(new Event("change", {bubbles: true}));
+"""
+FIND_ELEMENTS = scripts.FIND_ALL + "return __findAll(arguments[0], arguments[1]);"
+FIND_CHILD_ELEMENTS = scripts.FIND_ALL + "return __findAll(arguments[1], arguments[2], arguments[0]);"
+
+
+def enabled() -> bool:
+    return os.getenv("DRIVER_BACKEND", "chromedriver") == "cdp"
+
+
+class CdpConnection:
+    """One websocket to the browser. Replies are matched to their command by id; events go to waiters."""
+    def __init__(self, url: str):
+        self._ws = websocket.create_connection(url, suppress_origin=True)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._pending: dict[int, Future] = {}
+        self._waiters: list[tuple[str, str | None, Future]] = []
+        self._closed = False
+        self._reader = threading.Thread(target=self._read, name="cdp-reader", daemon=True)
+        self._reader.start()
+
+    def send(self, method: str, params: dict | None = None, session_id: str | None = None) -> Future:
+        """Sends a command without waiting for its reply"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise WebDriverException("DevTools connection closed")
+            self._next_id += 1
+            self._pending[self._next_id] = future
+            message = {"id": self._next_id, "method": method, "params": params or {}}
+            if session_id is not None:
+                message["sessionId"] = session_id
+            try:
+                self._ws.send(json.dumps(message))
+            except (websocket.WebSocketException, OSError) as e:
+                self._pending.pop(self._next_id)
+                raise WebDriverException(f"DevTools connection lost: {e}")
+        return future
+
+    def call(self, method: str, params: dict | None = None, session_id: str | None = None,
+             timeout: float = COMMAND_TIMEOUT) -> dict:
+        return self.result(self.send(method, params, session_id), method, timeout)
+
+    @staticmethod
+    def result(future: Future, method: str, timeout: float = COMMAND_TIMEOUT) -> dict:
+        try:
+            reply = future.result(timeout)
+        except FutureTimeout:
+            raise TimeoutException(f"No reply to {method} within {timeout} seconds.")
+        if "error" in reply:
+            message = reply["error"].get("message", "")
+            if any(error in message for error in UNLOADED_ERRORS):
+                raise JavascriptException("javascript error: document unloaded while waiting for result")
+            raise WebDriverException(f"{method} failed: {message} {reply['error'].get('data', '')}".strip())
+        return reply.get("result", {})
+
+    def expect(self, method: str, session_id: str | None = None) -> Future:
+        """A future for the next `method` event of the session; register it before the command that causes it"""
+        future = Future()
+        with self._lock:
+            self._waiters.append((method, session_id, future))
+        return future
+
+    def cancel(self, future: Future):
+        with self._lock:
+            self._waiters = [waiter for waiter in self._waiters if waiter[2] is not future]
+
+    def close(self):
+        try:
+            self._ws.close()
+        except (websocket.WebSocketException, OSError):
+            pass
+        self._reader.join(timeout=5)
+
+    def _read(self):
+        while True:
+            try:
+                message = json.loads(self._ws.recv())
+            except (websocket.WebSocketException, OSError, ValueError):
+                break
+            if "id" in message:
+                with self._lock:
+                    future = self._pending.pop(message["id"], None)
+                if future is not None:
+                    future.set_result(message)
+                continue
+            with self._lock:
+                matched = [w for w in self._waiters if w[0] == message.get("method") and w[1] == message.get("sessionId")]
+                self._waiters = [w for w in self._waiters if w not in matched]
+            for _, _, future in matched:
+                future.set_result(message.get("params", {}))
+        with self._lock:
+            self._closed = True
+            pending, self._pending = list(self._pending.values()), {}
+            waiters, self._waiters = self._waiters, []
+        for future in pending + [w[2] for w in waiters]:
+            future.set_result({"error": {"message": "DevTools connection closed"}})
+
+
+class CdpElement:
+    """An element returned by a script, addressed by its index in the element registry of the document it came from"""
+    def __init__(self, driver: "CdpDriver", index: int, document: str | None = None):
+        self._driver = driver
+        self.index = index
+        self.document = document  # the registry's token
+
+    def __eq__(self, other):
+        return (isinstance(other, CdpElement) and other._driver is self._driver and other.index == self.index
+                and other.document == self.document)
+
+    def __hash__(self):
+        return hash((id(self._driver), self.document, self.index))
+
+    @property
+    def text(self) -> str:
+        return self._driver.execute_script(ELEMENT_TEXT, self)
+
+    @property
+    def tag_name(self) -> str:
+        return self._driver.execute_script(ELEMENT_TAG_NAME, self)
+
+    def get_attribute(self, name: str) -> str | None:
+        return self._driver.execute_script(ELEMENT_ATTRIBUTE, self, name)
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        return self._driver.execute_script(ELEMENT_DOM_ATTRIBUTE, self, name)
+
+    def get_property(self, name: str):
+        return self._driver.execute_script(ELEMENT_PROPERTY, self, name)
+
+    def is_displayed(self) -> bool:
+        return self._driver.execute_script(scripts.VISIBLE + "return __visible(arguments[0]);", self)
+
+    def is_selected(self) -> bool:
+        return self._driver.execute_script(ELEMENT_SELECTED, self)
+
+    def is_enabled(self) -> bool:
+        return self._driver.execute_script(ELEMENT_ENABLED, self)
+
+    def find_elements(self, by: str, value: str) -> list["CdpElement"]:
+        return self._driver.execute_script(FIND_CHILD_ELEMENTS, self, by, value)
+
+    def find_element(self, by: str, value: str) -> "CdpElement":
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element found for ({by}, {value}) inside the element.")
+        return elements[0]
+
+    def click(self):
+        """A real mouse click at the element's center, the three mouse events sent in one go; options are selected in the page"""
+        point = self._driver.execute_script(ELEMENT_CLICK_POINT, self)
+        if point is None:
+            return
+        x, y = point
+        mouse = {"x": x, "y": y, "button": "left", "clickCount": 1}
+        self._driver.pipeline([
+            ("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y}),
+            ("Input.dispatchMouseEvent", {"type": "mousePressed", **mouse}),
+            ("Input.dispatchMouseEvent", {"type": "mouseReleased", **mouse}),
+        ])
+
+    def clear(self):
+        self._driver.execute_script(ELEMENT_CLEAR, self)
+
+    def send_keys(self, *values: str):
+        """Focuses the element and types every character as a key press, all key events pipelined"""
+        self._driver.execute_script(ELEMENT_FOCUS, self)
+        events = []
+        for char in "".join(values):
+            key, code, key_code, text = SPECIAL_KEYS.get(char, (char, "", 0, char))
+            down = {"type": "keyDown" if text else "rawKeyDown", "key": key, "code": code, "windowsVirtualKeyCode": key_code}
+            if text:
+                down.update(text=text, unmodifiedText=text)
+            events.append(("Input.dispatchKeyEvent", down))
+            events.append(("Input.dispatchKeyEvent", {"type": "keyUp", "key": key, "code": code, "windowsVirtualKeyCode": key_code}))
+        self._driver.pipeline(events)
+
+
+class CdpDriver:
+    """The WebDriver surface BasePage and the fixtures use, on one tab attached over the DevTools protocol"""
+    def __init__(self, connection: CdpConnection, session_id: str, target_id: str, on_quit=None):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+        self._on_quit = on_quit
+        self._script_timeout = SCRIPT_TIMEOUT
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        return self._call(cmd, cmd_args)
+
+    def _call(self, method: str, params: dict, timeout: float = COMMAND_TIMEOUT) -> dict:
+        with hooks.around_command(method, params):
+            return self.connection.call(method, params, self.session_id, timeout)
+
+    def pipeline(self, commands: list[tuple[str, dict]]) -> list[dict]:
+        """Sends all commands before waiting for any reply; the replies come back in order"""
+        with ExitStack() as listeners:
+            futures = []
+            for method, params in commands:
+                listeners.enter_context(hooks.around_command(method, params))
+                futures.append((method, self.connection.send(method, params, self.session_id)))
+            return [self.connection.result(future, method) for method, future in futures]
+
+    def execute_script(self, script: str, *args):
+        return self._evaluate(script, args, asynchronous=False)
+
+    def execute_async_script(self, script: str, *args):
+        return self._evaluate(script, args, asynchronous=True)
+
+    def set_script_timeout(self, time_to_wait: float):
+        self._script_timeout = time_to_wait
+
+    @property
+    def timeouts(self) -> Timeouts:
+        return Timeouts(page_load=PAGE_LOAD_TIMEOUT, script=self._script_timeout)
+
+    def _evaluate(self, script: str, args: tuple, asynchronous: bool):
+        expression = SCRIPT_WRAPPER % {
+            "key": json.dumps(ELEMENT_KEY),
+            "body": script,
+            "args": json.dumps(self._to_js(list(args))),
+            "asynchronous": json.dumps(asynchronous),
+            "timeout": int(self._script_timeout * 1000),
+        }
+        reply = self._call("Runtime.evaluate", {
+            "expression": expression, "returnByValue": True, "awaitPromise": asynchronous, "userGesture": True,
+        }, timeout=self._script_timeout + COMMAND_TIMEOUT)
+        details = reply.get("exceptionDetails")
+        if details is not None:
+            message = details.get("exception", {}).get("description") or details.get("text", "")
+            if "stale element reference" in message:
+                raise StaleElementReferenceException(message)
+            if "script timeout" in message:
+                raise TimeoutException(f"Script did not finish within {self._script_timeout} seconds.")
+            raise JavascriptException(f"javascript error: {message}")
+        return self._from_js(reply["result"].get("value"))
+
+    def _to_js(self, value):
+        if isinstance(value, CdpElement):
+            return {ELEMENT_KEY: [value.document, value.index]}
+        if isinstance(value, (list, tuple)):
+            return [self._to_js(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._to_js(v) for k, v in value.items()}
+        return value
+
+    def _from_js(self, value):
+        if isinstance(value, list):
+            return [self._from_js(v) for v in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                document, index = value[ELEMENT_KEY]
+                return CdpElement(self, index, document)
+            return {k: self._from_js(v) for k, v in value.items()}
+        return value
+
+    def get(self, url: str):
+        """Navigates and returns on the page's load event"""
+        loaded = self.connection.expect("Page.loadEventFired", self.session_id)
+        try:
+            reply = self.execute_cdp_cmd("Page.navigate", {"url": url})
+        except WebDriverException:
+            self.connection.cancel(loaded)
+            raise
+        if reply.get("errorText"):
+            self.connection.cancel(loaded)
+            raise WebDriverException(f"Navigation to {url} failed: {reply['errorText']}")
+        if "loaderId" not in reply: # same-document navigation, there is no load event
+            self.connection.cancel(loaded)
+            return
+        try:
+            loaded.result(PAGE_LOAD_TIMEOUT)
+        except FutureTimeout:
+            self.connection.cancel(loaded)
+            raise TimeoutException(f"{url} did not load within {PAGE_LOAD_TIMEOUT} seconds.")
+
+    @property
+    def current_url(self) -> str:
+        return self.execute_script("return window.location.href;")
+
+    @property
+    def title(self) -> str:
+        return self.execute_script("return document.title;")
+
+    @property
+    def page_source(self) -> str:
+        return self.execute_script("return document.documentElement.outerHTML;")
+
+    def find_elements(self, by: str, value: str) -> list[CdpElement]:
+        return self.execute_script(FIND_ELEMENTS, by, value)
+
+    def find_element(self, by: str, value: str) -> CdpElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element found for ({by}, {value}).")
+        return elements[0]
+
+    def get_screenshot_as_png(self) -> bytes:
+        return base64.b64decode(self.execute_cdp_cmd("Page.captureScreenshot", {"format": "png"})["data"])
+
+    def add_cookie(self, cookie: dict):
+        params = {"name": cookie["name"], "value": cookie["value"], "url": self.current_url, "path": cookie.get("path", "/")}
+        if "expiry" in cookie:
+            params["expires"] = cookie["expiry"]
+        self.execute_cdp_cmd("Network.setCookie", params)
+
+    def delete_all_cookies(self):
+        self.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+    def quit(self):
+        try:
+            self.connection.call("Target.closeTarget", {"targetId": self.target_id})
+        except WebDriverException:
+            pass
+        if self._on_quit is not None:
+            self._on_quit()
+
+
+class CdpBrowser:
+    """A Chrome with remote debugging and one websocket to it, handing out a CdpDriver per tab"""
+    def __init__(self, profile: BrowserProfile = FULL):
+        self.profile = profile
+        self._chrome = SharedChrome(profile)
+        address = self._chrome.start()
+        with urlopen(f"http://{address}/json/version", timeout=COMMAND_TIMEOUT) as response:
+            self.connection = CdpConnection(json.load(response)["webSocketDebuggerUrl"])
+
+    def new_driver(self) -> CdpDriver:
+        """A tab in a fresh browser context, with the profile's per-tab settings applied"""
+        context_id = self.connection.call("Target.createBrowserContext", {})["browserContextId"]
+        target_id = self.connection.call("Target.createTarget", {"url": "about:blank", "browserContextId": context_id})["targetId"]
+        session_id = self.connection.call("Target.attachToTarget", {"targetId": target_id, "flatten": True})["sessionId"]
+        driver = CdpDriver(self.connection, session_id, target_id, on_quit=lambda: self._dispose(context_id))
+        driver.execute_cdp_cmd("Page.enable", {}) # for the load events get() waits on
+        apply_profile(driver, self.profile)
+        return driver
+
+    def _dispose(self, context_id: str):
+        try:
+            self.connection.call("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except WebDriverException:
+            pass
+
+    def close(self):
+        self.connection.close()
+        self._chrome.stop()
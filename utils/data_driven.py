@@ -0,0 +1,65 @@
+"""
+Data-driven tests that stream many input rows through one open page.
+
+    def test_logins(login_page, inventory_page, subtests):
+        stream = RowStream(login_page, reopen=login_page.open)
+        for row in stream.read(DATA_DIR / "logins.csv"):
+            with subtests.test(msg=row["case"]):
+                login_page.submit(row["username"], row["password"])
+                if row["expected_error"]:
+                    assert row["expected_error"] in login_page.get_error_message()
+                else:
+                    assert inventory_page.is_on_inventory_page()
+
+Rows are read from a CSV or JSONL file one at a time, so a file of any size costs one row of
+memory. Every row is reported as its own subtest, and a failing row does not stop the rest. The
+page is opened once. Between rows, page.reset_form() clears only the fields that were filled and
+dismisses a visible error, in one round trip. Only a row that navigated away (e.g. a login that
+succeeded) costs a reopen().
+"""
+import csv
+import json
+from pathlib import Path
+from typing import Callable, Iterator
+
+
+def read_rows(path: str | Path) -> Iterator[dict]:
+    """Yields the rows of a .csv (header line first) or .jsonl (one object per line) file as they are read"""
+    path = Path(path)
+    if path.suffix not in (".csv", ".jsonl"):
+        raise ValueError(f"Unsupported data file {path.name}: expected .csv or .jsonl")
+    with path.open(newline="") as f:
+        if path.suffix == ".csv":
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RowStream:
+    """Feeds rows to a test on one open page, resetting only the state the previous row left dirty"""
+    def __init__(self, page, reopen: Callable[[], None]):
+        self.page = page  # a page object with reset_form(), e.g. LoginPage
+        self.reopen = reopen
+        self.rows = 0
+        self.resets = 0
+        self.reopens = 0
+
+    def read(self, path: str | Path) -> Iterator[dict]:
+        for row in read_rows(path):
+            if self.rows:
+                self._reset()
+            self.rows += 1
+            yield row
+
+    def _reset(self):
+        reset = self.page.reset_form()
+        if reset is None:
+            self.reopens += 1
+            self.reopen()
+        elif reset:
+            self.resets += 1
+
+    def summary(self) -> str:
+        return f"{self.rows} rows on one page: {self.resets} form resets, {self.reopens} reopens"
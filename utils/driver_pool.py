@@ -0,0 +1,139 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Storage.clearDataForOrigin types; cookies are cleared for every domain at once, session storage goes with the windows
+CLEARED_STORAGE = "local_storage,indexeddb,websql,cache_storage,service_workers"
+
+
+class PooledDriver:
+    """A pooled browser plus the bookkeeping the pool needs to recycle it"""
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    Keeps browsers alive across tests instead of launching one per test.
+    A spare browser is launched in the background while the current one is in use,
+    and a browser is recycled after `max_uses` tests or as soon as it looks unhealthy.
+    """
+    def __init__(self, driver_factory: Callable[[], WebDriver], max_uses: int = 25, prewarm: bool = True,
+                 on_reset: Callable[[WebDriver], None] | None = None):
+        self.driver_factory = driver_factory
+        self.on_reset = on_reset
+        self.max_uses = max_uses
+        self.prewarm = prewarm
+        self._idle: list[PooledDriver] = []
+        self._in_use: dict[int, PooledDriver] = {}
+        self._spare: Future | None = None
+        self._lock = threading.Lock()
+        self._launcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-prewarm")
+
+    def acquire(self) -> WebDriver:
+        """Hands out a clean browser, preferring an idle one over the pre-warmed spare"""
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+            spare, self._spare = (self._spare, None) if pooled is None else (None, self._spare)
+        if pooled is None:
+            pooled = self._take_spare(spare) or PooledDriver(self.driver_factory())
+        pooled.uses += 1
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        self._schedule_spare()
+        return pooled.driver
+
+    def release(self, driver: WebDriver):
+        """Resets a browser and returns it to the pool, or quits it if it is worn out or unhealthy"""
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+        if pooled.uses >= self.max_uses or not self._reset(driver):
+            self._quit(driver)
+            self._schedule_spare()
+            return
+        with self._lock:
+            self._idle.append(pooled)
+
+    def close(self):
+        """Quits every browser the pool still owns, including a spare that is still launching"""
+        with self._lock:
+            drivers = [p.driver for p in self._idle] + [p.driver for p in self._in_use.values()]
+            spare, self._spare = self._spare, None
+            self._idle.clear()
+            self._in_use.clear()
+        pooled = self._take_spare(spare)
+        if pooled is not None:
+            drivers.append(pooled.driver)
+        self._launcher.shutdown(wait=True)
+        for driver in drivers:
+            self._quit(driver)
+
+    def _schedule_spare(self):
+        if not self.prewarm:
+            return
+        with self._lock:
+            if self._idle or self._spare is not None:
+                return
+            self._spare = self._launcher.submit(lambda: PooledDriver(self.driver_factory()))
+
+    @staticmethod
+    def _take_spare(spare: Future | None) -> PooledDriver | None:
+        if spare is None:
+            return None
+        try:
+            return spare.result()
+        except WebDriverException as e:
+            print(f"Pre-warmed browser failed to start, launching a fresh one: {e}")
+            return None
+
+    def _reset(self, driver: WebDriver) -> bool:
+        """
+        Clears the cookies of every domain and the storage of every origin any window visited,
+        and leaves the browser on a single blank window
+        """
+        try:
+            handles = driver.window_handles
+            origins = set()
+            for handle in handles:
+                driver.switch_to.window(handle)
+                origins.update(visited_origins(driver))
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": CLEARED_STORAGE})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.switch_to.new_window("tab")
+            fresh = driver.current_window_handle
+            for handle in handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(fresh)
+            if self.on_reset is not None:
+                self.on_reset(driver)
+            return True
+        except WebDriverException as e:
+            print(f"Browser failed to reset, recycling it: {e}")
+            return False
+
+    @staticmethod
+    def _quit(driver: WebDriver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+def visited_origins(driver: WebDriver) -> set[str]:
+    """The web origins in the current window's back/forward history, not only the page it is on"""
+    history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+    origins = set()
+    for entry in history["entries"]:
+        url = urlsplit(entry["url"])
+        if url.scheme in ("http", "https"):
+            origins.add(f"{url.scheme}://{url.netloc}")
+    return origins
@@ -0,0 +1,144 @@
+"""
+Duration-aware sharding of tests across pytest-xdist workers.
+
+Per-test durations are recorded after every run and used on the next run to
+split the collection into shards of roughly equal total duration (longest test
+first onto the least loaded worker). Tests with no history are estimated from
+their markers.
+
+Usage: pytest -n auto --shard-by-duration
+"""
+import heapq
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+DEFAULT_ESTIMATE = 10.0
+# Seconds, used for tests that have never been run. The slowest matching marker wins.
+MARKER_ESTIMATES = {
+    "smoke": 8.0,
+    "checkout": 15.0,
+    "e2e": 30.0,
+}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration sharding")
+    group.addoption("--durations-file", default=DEFAULT_DURATIONS_FILE,
+                    help="File where per-test durations are stored between runs.")
+    group.addoption("--shard-by-duration", action="store_true", default=False,
+                    help="Split tests across xdist workers by recorded durations.")
+    parser.addini("duration_marker_estimates", type="linelist", default=[],
+                  help="marker=seconds estimates for tests without recorded durations.")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(DurationRecorder(config), "duration-recorder")
+
+
+def _durations_path(config) -> Path:
+    return Path(config.rootpath, config.getoption("durations_file"))
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def marker_estimate(item, config) -> float:
+    """Estimates a test's duration from its markers when there is no recorded history"""
+    estimates = dict(MARKER_ESTIMATES)
+    for line in config.getini("duration_marker_estimates"):
+        marker, _, seconds = line.partition("=")
+        estimates[marker.strip()] = float(seconds)
+    matching = [estimates[m.name] for m in item.iter_markers() if m.name in estimates]
+    return max(matching, default=DEFAULT_ESTIMATE)
+
+
+class DurationRecorder:
+    """Collects setup + call + teardown time per test and saves it at the end of the run"""
+    def __init__(self, config):
+        self.config = config
+        self.durations: dict[str, float] = {}
+        self._estimates_tmp: tempfile.TemporaryDirectory | None = None
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.durations:
+            return
+        path = _durations_path(self.config)
+        stored = load_durations(path)
+        for nodeid, duration in self.durations.items():
+            previous = stored.get(nodeid)
+            # Smooth out one-off slow runs instead of trusting only the latest one
+            stored[nodeid] = round(duration if previous is None else (previous + duration) / 2, 3)
+        path.write_text(json.dumps(stored, indent=2, sort_keys=True))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_finish(self, session):
+        """On an xdist worker, hands the marker estimates to the controller before it schedules"""
+        workerinput = getattr(self.config, "workerinput", None)
+        if workerinput is None or "duration_estimates_dir" not in workerinput:
+            return
+        estimates = {item.nodeid: marker_estimate(item, self.config) for item in session.items}
+        target = Path(workerinput["duration_estimates_dir"], f"{workerinput['workerid']}.json")
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps(estimates))
+        os.replace(tmp, target)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        node.workerinput["duration_estimates_dir"] = self._estimates_dir()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduling(self, config, log):
+        if not config.getoption("shard_by_duration"):
+            return None
+        from xdist.scheduler import LoadScheduling
+
+        recorder = self
+
+        class DurationScheduling(LoadScheduling):
+            def schedule(self):
+                if self.collection is not None or not self._check_nodes_have_same_collection():
+                    return super().schedule()
+                self.collection = next(iter(self.node2collection.values()))
+                self.pending[:] = []
+                for node, shard in zip(self.nodes, recorder.shard(self.collection, len(self.nodes))):
+                    if shard:
+                        self.node2pending[node].extend(shard)
+                        node.send_runtest_some(shard)
+                for node in self.nodes:
+                    node.shutdown()
+
+        return DurationScheduling(config, log)
+
+    def _estimates_dir(self) -> str:
+        if self._estimates_tmp is None:
+            self._estimates_tmp = tempfile.TemporaryDirectory(prefix="duration-estimates-")
+        return self._estimates_tmp.name
+
+    def shard(self, collection: list[str], num_shards: int) -> list[list[int]]:
+        """Greedy longest-processing-time split; each shard keeps the collection order"""
+        history = load_durations(_durations_path(self.config))
+        estimates = {}
+        if self._estimates_tmp is not None:
+            for path in Path(self._estimates_tmp.name).glob("*.json"):
+                estimates.update(json.loads(path.read_text()))
+        cost = {i: history.get(nodeid, estimates.get(nodeid, DEFAULT_ESTIMATE)) for i, nodeid in enumerate(collection)}
+
+        shards: list[list[int]] = [[] for _ in range(num_shards)]
+        loads = [(0.0, n) for n in range(num_shards)]
+        for index in sorted(cost, key=cost.get, reverse=True):
+            load, n = heapq.heappop(loads)
+            shards[n].append(index)
+            heapq.heappush(loads, (load + cost[index], n))
+        return [sorted(shard) for shard in shards]
@@ -0,0 +1,166 @@
+"""
+Failure artifacts from a rolling in-memory buffer of the last BasePage actions.
+
+With --failure-artifacts, every action (navigate_to, _click, _click_in_grid, _type_text, _fill_fields) records a
+step: the method, the locator used, the time and the error it raised, if any. Recording a step
+costs no WebDriver command. Only the last --failure-buffer steps are kept. Nothing is written for
+a passing test. When a test fails, the URL, the DOM and a screenshot are captured once, and
+everything is written to <--failure-artifacts-dir>/<test>-<phase>/ on a background thread:
+
+    steps.json          URL at the failure, then method, locator and time of every buffered step, oldest first
+    page.html.gz        the DOM at the moment of the failure
+    screenshot.png      the browser at the moment of the failure
+
+--failure-step-dom also snapshots the URL and DOM after every step (step-01.html.gz, ...). That
+costs a full DOM serialization per action in every test, so it is meant for chasing one failure.
+Artifacts that could not be written are reported in the terminal summary.
+"""
+import gzip
+import json
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils import hooks
+
+DEFAULT_DIR = "failure_artifacts"
+DEFAULT_BUFFER = 10
+ACTION_METHODS = ("navigate_to", "_click", "_click_in_grid", "_type_text", "_fill_fields")
+SNAPSHOT_SCRIPT = "return [window.location.href, document.documentElement.outerHTML];"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("failure artifacts")
+    group.addoption("--failure-artifacts", action="store_true", default=False,
+                    help="Keep the last page actions in memory and write them with a screenshot when a test fails.")
+    group.addoption("--failure-artifacts-dir", default=DEFAULT_DIR,
+                    help="Directory the artifacts of failed tests are written to.")
+    group.addoption("--failure-buffer", type=int, default=DEFAULT_BUFFER,
+                    help="Number of most recent actions kept per test.")
+    group.addoption("--failure-step-dom", action="store_true", default=False,
+                    help="Also snapshot the URL and DOM after every buffered action (one extra round trip each).")
+
+
+def pytest_configure(config):
+    if config.getoption("failure_artifacts"):
+        config.pluginmanager.register(FailureCapture(config), "failure_capture")
+
+
+@dataclass
+class Step:
+    method: str
+    locator: str | None
+    timestamp: float
+    error: str | None = None
+    url: str | None = None  # with --failure-step-dom
+    dom: Future | None = None  # gzipped outerHTML, compressed on the background thread, with --failure-step-dom
+
+
+class FailureCapture:
+    def __init__(self, config):
+        self.config = config
+        self.directory = Path(config.rootpath, config.getoption("failure_artifacts_dir"))
+        self.steps: deque[Step] = deque(maxlen=config.getoption("failure_buffer"))
+        self.step_dom = config.getoption("failure_step_dom")
+        self.driver = None
+        self.written: list[tuple[Path, Future]] = []
+        self._depth = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-capture")
+
+    @contextmanager
+    def page_method(self, page, name, args, kwargs):
+        if name not in ACTION_METHODS or self._depth:
+            yield
+            return
+        self._depth += 1
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._depth -= 1
+            locator = args[0] if args and isinstance(args[0], tuple) else None
+            self._record(page.driver, name, locator, error)
+
+    def _record(self, driver, method: str, locator: tuple | None, error: str | None):
+        self.driver = driver
+        locator_text = f"{locator[0]}={locator[1]}" if locator else None
+        step = Step(method, locator_text, time.time(), error)
+        if self.step_dom:
+            step.url, html = _snapshot(driver)
+            step.dom = self._executor.submit(gzip.compress, html.encode(), 6)
+        self.steps.append(step)
+
+    def pytest_sessionstart(self, session):
+        hooks.add_page_listener(self.page_method)
+
+    def pytest_runtest_setup(self, item):
+        self.steps.clear()
+        self.driver = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if not report.failed or report.when == "teardown":
+            return
+        driver = item.funcargs.get("driver", self.driver)
+        url, html, screenshot = "", "", None
+        if driver is not None:
+            url, html = _snapshot(driver)
+            try:
+                screenshot = driver.get_screenshot_as_png()
+            except WebDriverException:
+                pass
+        name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+        directory = self.directory / f"{name}-{report.when}" # a setup and a call failure get one each
+        future = self._executor.submit(_write, directory, list(self.steps), url, html, screenshot)
+        self.written.append((directory, future))
+
+    def pytest_sessionfinish(self, session):
+        hooks.remove_page_listener(self.page_method)
+        self._executor.shutdown(wait=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.written:
+            return
+        terminalreporter.section("failure artifacts")
+        for directory, future in self.written:
+            error = future.exception()
+            path = directory.relative_to(self.config.rootpath)
+            terminalreporter.write_line(f"{path}: not written, {type(error).__name__}: {error}" if error else str(path))
+
+
+def _snapshot(driver) -> tuple[str, str]:
+    """URL and outerHTML of the page, or empty strings when the browser can't tell"""
+    try:
+        url, html = driver.execute_script(SNAPSHOT_SCRIPT)
+        return url, html
+    except WebDriverException:
+        return "", ""
+
+
+def _write(directory: Path, steps: list[Step], url: str, html: str, screenshot: bytes | None):
+    directory.mkdir(parents=True, exist_ok=True)
+    index = []
+    for number, step in enumerate(steps, 1):
+        entry = {"step": number, "method": step.method, "locator": step.locator, "timestamp": step.timestamp,
+                 "error": step.error}
+        if step.dom is not None:
+            name = f"step-{number:02d}.html.gz"
+            (directory / name).write_bytes(step.dom.result())
+            entry.update(url=step.url, dom=name)
+        index.append(entry)
+    (directory / "page.html.gz").write_bytes(gzip.compress(html.encode(), 6))
+    (directory / "steps.json").write_text(json.dumps({"url": url, "dom": "page.html.gz", "steps": index}, indent=2))
+    if screenshot is not None:
+        (directory / "screenshot.png").write_bytes(screenshot)
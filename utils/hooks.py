@@ -0,0 +1,122 @@
+"""
+Opt-in hooks around BasePage primitives and raw WebDriver commands.
+
+Nothing is wrapped until the first listener is added, so the framework pays nothing when no
+plugin needs them. A listener is called before the wrapped call and returns a context manager
+that is exited when the call finishes (or raises):
+
+    @contextmanager
+    def timing(page, method, args, kwargs):
+        start = time.perf_counter()
+        yield
+        print(method, time.perf_counter() - start)
+
+    hooks.add_page_listener(timing)
+
+Drivers that don't send HTTP commands (utils/cdp_driver.py) call around_command() for each of theirs.
+"""
+import functools
+from contextlib import ExitStack, nullcontext
+
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from pages.base_page import BasePage
+
+PAGE_METHODS = (
+    "navigate_to",
+    "wait_until_ready",
+    "_wait_for",
+    "_find_element",
+    "_find_elements",
+    "_click",
+    "_click_in_grid",
+    "_type_text",
+    "_fill_fields",
+    "_get_text",
+    "_is_displayed",
+    "_is_displayed_now",
+    "_read_elements",
+    "_read_records",
+)
+
+_page_listeners = []
+_command_listeners = []
+_originals = {}
+
+
+def _enter_all(listeners, *args):
+    stack = ExitStack()
+    try:
+        for listener in list(listeners):
+            stack.enter_context(listener(*args))
+    except BaseException:
+        stack.close()
+        raise
+    return stack
+
+
+def _around_page_method(original):
+    @functools.wraps(original)
+    def wrapper(page, *args, **kwargs):
+        if not _page_listeners:
+            return original(page, *args, **kwargs)
+        with _enter_all(_page_listeners, page, original.__name__, args, kwargs):
+            return original(page, *args, **kwargs)
+    return wrapper
+
+
+def _around_command(original):
+    @functools.wraps(original)
+    def wrapper(connection, command, params):
+        if not _command_listeners:
+            return original(connection, command, params)
+        with _enter_all(_command_listeners, command, params):
+            return original(connection, command, params)
+    return wrapper
+
+
+def _install():
+    if _originals:
+        return
+    for name in PAGE_METHODS:
+        _originals[(BasePage, name)] = getattr(BasePage, name)
+        setattr(BasePage, name, _around_page_method(getattr(BasePage, name)))
+    _originals[(RemoteConnection, "execute")] = RemoteConnection.execute
+    RemoteConnection.execute = _around_command(RemoteConnection.execute)
+
+
+def _uninstall():
+    if _page_listeners or _command_listeners:
+        return
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+
+
+def add_page_listener(listener):
+    """listener(page, method_name, args, kwargs) -> context manager, around every call in PAGE_METHODS"""
+    _install()
+    _page_listeners.append(listener)
+
+
+def remove_page_listener(listener):
+    _page_listeners.remove(listener)
+    _uninstall()
+
+
+def add_command_listener(listener):
+    """listener(command_name, params) -> context manager, around every WebDriver HTTP command"""
+    _install()
+    _command_listeners.append(listener)
+
+
+def remove_command_listener(listener):
+    _command_listeners.remove(listener)
+    _uninstall()
+
+
+def around_command(command: str, params: dict):
+    """The command listeners, entered for a command sent without RemoteConnection (e.g. over the DevTools protocol)"""
+    if not _command_listeners:
+        return nullcontext()
+    return _enter_all(_command_listeners, command, params)
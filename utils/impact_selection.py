@@ -0,0 +1,307 @@
+"""
+Change-impact test selection from a page-object usage index.
+
+    pytest --record-impact              # full run; records which page-object code every test executes
+    pytest --impacted-since HEAD        # later: run only the tests affected by changes since HEAD
+
+While recording, every test is traced with sys.setprofile. The page-object functions it executes
+(fixtures included) are stored per test in the pytest cache, e.g.
+"pages/inventory_page.py::InventoryPage.add_item_to_cart_by_name".
+
+To select tests, `git diff -U0 REF` is mapped onto the definitions in pages/. A changed line
+belongs to a method, a locator constant (e.g. "pages/cart_page.py::CartPage.CART_ITEM_NAME") or
+a module-level name. Locator constants are linked to the methods that read them through a static
+AST pass, so a locator fix selects every test that ran a method using it.
+
+A test is selected when any of these is true:
+  - it executed an affected method
+  - its own test file changed
+  - it is missing from the index
+
+Changes to any other file that tests depend on (utils/, benchmarks/ for tests/test_stats.py,
+conftest.py, pytest.ini, ...) select everything.
+"""
+import ast
+import json
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+CACHE_KEY = "impact/index"
+PAGES_DIR = "pages"
+TESTS_DIR = "tests"
+# Paths that no test depends on; changes here never select anything
+IGNORED = ("README.md", ".gitignore", "requirements.txt", "loadtest/")
+HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact selection")
+    group.addoption("--record-impact", action="store_true", default=False,
+                    help="Trace which page-object code each test executes and store it in the cache.")
+    group.addoption("--impacted-since", metavar="REF", default=None,
+                    help="Only run tests affected by changes since the given git ref (e.g. HEAD, origin/main).")
+
+
+def pytest_configure(config):
+    if config.getoption("record_impact"):
+        config.pluginmanager.register(ImpactRecorder(config), "impact-recorder")
+    if config.getoption("impacted_since"):
+        config.pluginmanager.register(ImpactSelector(config), "impact-selector")
+
+
+class ImpactRecorder:
+    def __init__(self, config):
+        self.config = config
+        self.root = Path(config.rootpath)
+        self.index: dict[str, list[str]] = {}
+        self._files: dict[str, str] = {}  # absolute filename -> path relative to the root
+
+    def _relative(self, filename: str) -> str | None:
+        if filename not in self._files:
+            path = Path(filename)
+            inside = path.is_absolute() and path.is_relative_to(self.root / PAGES_DIR)
+            self._files[filename] = path.relative_to(self.root).as_posix() if inside else None
+        return self._files[filename]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        used = set()
+
+        def profile(frame, event, arg):
+            if event == "call":
+                code = frame.f_code
+                path = self._relative(code.co_filename)
+                if path is not None:
+                    used.add(f"{path}::{code.co_qualname.split('.<locals>')[0]}")
+
+        previous = sys.getprofile()
+        sys.setprofile(profile)
+        try:
+            yield
+        finally:
+            sys.setprofile(previous)
+        self.index[item.nodeid] = sorted(used)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collects the traces of an xdist worker on the controller"""
+        self.index.update(json.loads(node.workeroutput.get("impact_index", "{}")))
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["impact_index"] = json.dumps(self.index)
+            return
+        stored = self.config.cache.get(CACHE_KEY, {})
+        stored.update(self.index)
+        self.config.cache.set(CACHE_KEY, stored)
+
+
+class ImpactSelector:
+    def __init__(self, config):
+        self.config = config
+        self.root = Path(config.rootpath)
+        self.ref = config.getoption("impacted_since")
+        self.summary = ""
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        index = config.cache.get(CACHE_KEY, None)
+        if not index:
+            self.summary = "no impact index recorded yet (run once with --record-impact); running everything"
+            return
+        diff = git_diff(self.root, self.ref)
+        others = [path for path in diff if not path.startswith((f"{PAGES_DIR}/", f"{TESTS_DIR}/test_")) and not path.startswith(IGNORED)]
+        if others:
+            self.summary = f"{', '.join(others)} changed since {self.ref}; running everything"
+            return
+        affected = affected_symbols(self.root, self.ref, {path: lines for path, lines in diff.items() if path.startswith(f"{PAGES_DIR}/")})
+        changed_tests = {path for path in diff if path.startswith(f"{TESTS_DIR}/")}
+        selected, deselected = [], []
+        for item in items:
+            test_path = Path(item.path).relative_to(self.root).as_posix()
+            used = index.get(item.nodeid)
+            if used is None or test_path in changed_tests or affected.intersection(used):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.summary = f"{len(selected)} of {len(selected) + len(deselected)} tests affected by changes since {self.ref}"
+
+    def pytest_report_collectionfinish(self, config, start_path, items):
+        return f"impact selection: {self.summary}"
+
+
+def git_diff(root: Path, ref: str) -> dict[str, dict[str, list[int]]]:
+    """Changed files since ref (working tree included), with the changed line numbers on each side"""
+    try:
+        output = subprocess.run(["git", "diff", "-U0", "--no-color", ref, "--"], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+    except FileNotFoundError:
+        raise pytest.UsageError("--impacted-since needs git, which was not found")
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.strip().splitlines()[0] if e.stderr.strip() else f"exit status {e.returncode}"
+        raise pytest.UsageError(f"--impacted-since {ref}: git diff failed: {message}")
+    changes: dict[str, dict[str, list[int]]] = {}
+    old_path = None
+    for line in output.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:] if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            path = line[6:] if line.startswith("+++ b/") else old_path
+            current = changes.setdefault(path, {"old": [], "new": []})
+        elif match := HUNK.match(line):
+            old_start, old_count, new_start, new_count = (int(g) if g is not None else 1 for g in match.groups())
+            current["old"].extend(range(old_start, old_start + old_count))
+            current["new"].extend(range(new_start, new_start + new_count))
+    return changes
+
+
+def definitions(path: str, source: str) -> list[tuple[int, int, str]]:
+    """
+    (first line, last line, symbol) of every method, constant and module-level name in a module.
+    Other statements get a scope symbol ending in "::" (module) or "." (class): a change there,
+    e.g. an import or a class's bases, counts as a change to everything in that scope.
+    """
+    spans = []
+
+    def visit(body, prefix):
+        for node in body:
+            start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+                continue # docstrings
+            if isinstance(node, ast.ClassDef):
+                spans.append((start, node.body[0].lineno - 1, f"{path}::{prefix}{node.name}."))
+                visit(node.body, f"{prefix}{node.name}.")
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                spans.append((start, node.end_lineno, f"{path}::{prefix}{node.name}"))
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)) and all(isinstance(t, ast.Name) for t in _targets(node)):
+                spans.extend((start, node.end_lineno, f"{path}::{prefix}{t.id}") for t in _targets(node))
+            else:
+                spans.append((start, node.end_lineno, f"{path}::{prefix}"))
+
+    visit(ast.parse(source).body, "")
+    return spans
+
+
+def _targets(node) -> list:
+    return node.targets if isinstance(node, ast.Assign) else [node.target]
+
+
+def changed_symbols(path: str, source: str, lines: list[int]) -> set[str]:
+    """Symbols whose definition covers one of the lines (comments and docstrings are not covered)"""
+    spans = definitions(path, source)
+    symbols = set()
+    for line in lines:
+        covering = [symbol for start, end, symbol in spans if start <= line <= end]
+        if not covering:
+            continue
+        innermost = covering[-1] # spans are listed outermost first
+        if innermost.endswith(("::", ".")):
+            symbols.update(symbol for _, _, symbol in spans if symbol.startswith(innermost))
+        else:
+            symbols.add(innermost)
+    return symbols
+
+
+class _References(ast.NodeVisitor):
+    """Collects the constants and module-level names one definition reads"""
+    def __init__(self, path: str, owner: str | None, modules: dict[str, str], classes: dict[str, str]):
+        self.path = path
+        self.owner = owner
+        self.modules = modules  # local alias -> file, for `from pages import scripts`
+        self.classes = classes  # class name -> file, for every class in pages/
+        self.found: set[tuple[str, str]] = set()  # (class name or file, attribute)
+
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Name):
+            base = node.value.id
+            if base in ("self", "cls") and self.owner:
+                self.found.add((self.owner, node.attr))
+            elif base in self.classes:
+                self.found.add((base, node.attr))
+            elif base in self.modules:
+                self.found.add((self.modules[base], node.attr))
+        self.generic_visit(node)
+
+    def visit_Name(self, node):
+        if self.owner:
+            self.found.add((self.owner, node.id))
+        self.found.add((self.path, node.id))
+
+
+def dependents(root: Path) -> dict[str, set[str]]:
+    """Maps each constant or module-level name in pages/ to the definitions that read it"""
+    sources = {path.relative_to(root).as_posix(): path.read_text() for path in (root / PAGES_DIR).rglob("*.py")}
+    trees = {path: ast.parse(source) for path, source in sources.items()}
+    classes, bases, symbols = {}, {}, set()
+    for path, tree in trees.items():
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                classes[node.name] = path
+                bases[node.name] = [b.id for b in node.bases if isinstance(b, ast.Name)]
+        symbols.update(symbol for _, _, symbol in definitions(path, sources[path]))
+
+    def resolve(owner: str, name: str) -> str | None:
+        if owner in classes:
+            symbol = f"{classes[owner]}::{owner}.{name}"
+            if symbol in symbols:
+                return symbol
+            return next(filter(None, (resolve(base, name) for base in bases.get(owner, []))), None)
+        symbol = f"{owner}::{name}"
+        return symbol if symbol in symbols else None
+
+    readers = defaultdict(set)
+    for path, tree in trees.items():
+        modules = {}
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.module == PAGES_DIR:
+                modules.update({alias.asname or alias.name: f"{PAGES_DIR}/{alias.name}.py" for alias in node.names})
+
+        def scan(body, owner):
+            for node in body:
+                if isinstance(node, ast.ClassDef):
+                    scan(node.body, node.name)
+                    continue
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    names = [node.name]
+                elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                    names = [target.id for target in _targets(node) if isinstance(target, ast.Name)]
+                else:
+                    continue
+                visitor = _References(path, owner, modules, classes)
+                visitor.visit(node)
+                for name in names:
+                    reader = f"{path}::{owner}.{name}" if owner else f"{path}::{name}"
+                    for base, attribute in visitor.found:
+                        symbol = resolve(base, attribute)
+                        if symbol is not None and symbol != reader:
+                            readers[symbol].add(reader)
+
+        scan(tree.body, None)
+    return readers
+
+
+def affected_symbols(root: Path, ref: str, diff: dict[str, dict[str, list[int]]]) -> set[str]:
+    """Changed symbols in pages/ plus, transitively, everything that reads them"""
+    changed = set()
+    for path, lines in diff.items():
+        new_file = root / path
+        if new_file.exists():
+            changed |= changed_symbols(path, new_file.read_text(), lines["new"])
+        old = subprocess.run(["git", "show", f"{ref}:{path}"], cwd=root, capture_output=True, text=True)
+        if old.returncode == 0:
+            changed |= changed_symbols(path, old.stdout, lines["old"])
+    readers = dependents(root)
+    affected, pending = set(), list(changed)
+    while pending:
+        symbol = pending.pop()
+        if symbol not in affected:
+            affected.add(symbol)
+            pending.extend(readers.get(symbol, ()))
+    return affected
@@ -0,0 +1,150 @@
+"""
+Per-test latency breakdown of BasePage primitives and raw WebDriver commands.
+
+With --instrument every test records how many WebDriver round trips it made, how much of that
+time was spent inside waits versus executing actions and reads, time per BasePage method and
+the slowest locators. The results are printed in the terminal summary and written to a JSON
+file (--instrument-json) that can be diffed between runs.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from utils import hooks
+
+DEFAULT_JSON = "instrumentation.json"
+SLOWEST_LOCATORS = 5
+WAIT_METHODS = ("_wait_for",)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("instrumentation")
+    group.addoption("--instrument", action="store_true", default=False,
+                    help="Record WebDriver round trips and a wait/execute breakdown per test.")
+    group.addoption("--instrument-json", default=DEFAULT_JSON,
+                    help="File the per-test instrumentation is written to.")
+
+
+def pytest_configure(config):
+    if config.getoption("instrument"):
+        config.pluginmanager.register(Instrumentation(config), "instrumentation")
+
+
+def locator_key(locator) -> str:
+    return f"{locator[0]}={locator[1]}"
+
+
+class TimingRecord:
+    """Everything measured for one test"""
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.round_trips = 0
+        self.wait_time = 0.0
+        self.execute_time = 0.0
+        self.commands: dict[str, int] = {}
+        self.methods: dict[str, dict] = {}
+        self.locators: dict[str, float] = {}
+
+    def as_dict(self) -> dict:
+        slowest = sorted(self.locators.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_LOCATORS]
+        return {
+            "round_trips": self.round_trips,
+            "wait_time": round(self.wait_time, 4),
+            "execute_time": round(self.execute_time, 4),
+            "commands": self.commands,
+            "methods": {name: {"calls": m["calls"], "time": round(m["time"], 4)} for name, m in self.methods.items()},
+            "slowest_locators": [{"locator": key, "time": round(t, 4)} for key, t in slowest],
+        }
+
+
+class Instrumentation:
+    def __init__(self, config):
+        self.config = config
+        self.results: dict[str, dict] = {}
+        self.current: TimingRecord | None = None
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def page_method(self, page, name, args, kwargs):
+        locator = args[0] if args and isinstance(args[0], tuple) else None
+        self._stack().append((name, locator))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack().pop()
+            if self.current is not None:
+                method = self.current.methods.setdefault(name, {"calls": 0, "time": 0.0})
+                method["calls"] += 1
+                method["time"] += elapsed
+
+    @contextmanager
+    def command(self, command, params):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            timing = self.current
+            if timing is not None:
+                stack = self._stack()
+                timing.round_trips += 1
+                timing.commands[command] = timing.commands.get(command, 0) + 1
+                if any(name in WAIT_METHODS for name, _ in stack):
+                    timing.wait_time += elapsed
+                else:
+                    timing.execute_time += elapsed
+                locator = next((locator for _, locator in reversed(stack) if locator is not None), None)
+                if locator is not None:
+                    key = locator_key(locator)
+                    timing.locators[key] = timing.locators.get(key, 0.0) + elapsed
+
+    def pytest_sessionstart(self, session):
+        hooks.add_page_listener(self.page_method)
+        hooks.add_command_listener(self.command)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.current = TimingRecord(item.nodeid)
+        yield
+        self.results[item.nodeid] = self.current.as_dict()
+        self.current = None
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collects the results of an xdist worker on the controller"""
+        self.results.update(json.loads(node.workeroutput.get("instrumentation", "{}")))
+
+    def pytest_sessionfinish(self, session):
+        hooks.remove_page_listener(self.page_method)
+        hooks.remove_command_listener(self.command)
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["instrumentation"] = json.dumps(self.results)
+            return
+        path = Path(self.config.rootpath, self.config.getoption("instrument_json"))
+        path.write_text(json.dumps(self.results, indent=2, sort_keys=True))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        terminalreporter.section("WebDriver round trips per test")
+        terminalreporter.write_line(f"{'round trips':>11} {'wait s':>8} {'exec s':>8}  test / slowest locator")
+        ordered = sorted(self.results.items(), key=lambda item: item[1]["wait_time"] + item[1]["execute_time"], reverse=True)
+        for nodeid, result in ordered:
+            terminalreporter.write_line(
+                f"{result['round_trips']:>11} {result['wait_time']:>8.3f} {result['execute_time']:>8.3f}  {nodeid}"
+            )
+            if result["slowest_locators"]:
+                slowest = result["slowest_locators"][0]
+                terminalreporter.write_line(f"{'':>30}  {slowest['locator']} ({slowest['time']:.3f}s)")
+        terminalreporter.write_line(f"Full breakdown written to {self.config.getoption('instrument_json')}")
@@ -0,0 +1,63 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Serves the stand-in pages without logging every request to the test output"""
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        # Every page load should hit the server so runs are comparable
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+
+class LocalAppServer:
+    """
+    Serves a local stand-in for the SauceDemo storefront (login, inventory, cart and checkout)
+    on a background thread, so tests can run without network access.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, directory: Path = STATIC_DIR):
+        handler = partial(_QuietHandler, directory=str(directory))
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-app", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "LocalAppServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "LocalAppServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the local SauceDemo stand-in.")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = LocalAppServer(port=args.port).start()
+    print(f"Serving the local app on {server.url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,313 @@
+// Local stand-in for the SauceDemo storefront.
+// Keeps the same element ids, classes and storage layout (session-username cookie,
+// cart-contents in localStorage) that the page objects and the state seeder rely on.
+(function () {
+    "use strict";
+
+    var PASSWORD = "secret_sauce";
+    var USERS = ["standard_user", "locked_out_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+    var LOCKED_OUT = ["locked_out_user"];
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var TAX_RATE = 0.08;
+
+    var PRODUCTS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+    ];
+
+    // --- state ---
+
+    function getSessionUser() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setSessionUser(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/; max-age=600";
+    }
+
+    function clearSession() {
+        document.cookie = SESSION_COOKIE + "=; path=/; max-age=0";
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function productById(id) {
+        return PRODUCTS.filter(function (p) { return p.id === id; })[0];
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/\s+/g, "-");
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    // --- rendering helpers ---
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key === "text") {
+                node.textContent = attrs[key];
+            } else if (key.indexOf("on") === 0) {
+                node.addEventListener(key.slice(2), attrs[key]);
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        });
+        (children || []).forEach(function (child) { if (child) { node.appendChild(child); } });
+        return node;
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) {
+            return;
+        }
+        var badge = link.querySelector(".shopping_cart_badge");
+        var count = getCart().length;
+        if (count && !badge) {
+            link.appendChild(el("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge", text: String(count)}));
+        } else if (count) {
+            badge.textContent = String(count);
+        } else if (badge) {
+            badge.remove();
+        }
+    }
+
+    function cartButton(product) {
+        var inCart = getCart().indexOf(product.id) !== -1;
+        return el("button", {
+            "class": "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary"),
+            id: (inCart ? "remove-" : "add-to-cart-") + slug(product.name),
+            name: (inCart ? "remove-" : "add-to-cart-") + slug(product.name),
+            text: inCart ? "Remove" : "Add to cart",
+            onclick: function () {
+                var cart = getCart();
+                if (cart.indexOf(product.id) === -1) {
+                    cart.push(product.id);
+                } else {
+                    cart.splice(cart.indexOf(product.id), 1);
+                }
+                setCart(cart);
+                this.replaceWith(cartButton(product));
+                renderBadge();
+            }
+        });
+    }
+
+    function itemDescription(product, button) {
+        return el("div", {"class": "inventory_item_description"}, [
+            el("div", {"class": "inventory_item_label"}, [
+                el("a", {href: "#", id: "item_" + product.id + "_title_link"}, [
+                    el("div", {"class": "inventory_item_name", "data-test": "inventory-item-name", text: product.name})
+                ]),
+                el("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc", text: product.desc})
+            ]),
+            el("div", {"class": "pricebar"}, [
+                el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price", text: money(product.price)}),
+                button
+            ])
+        ]);
+    }
+
+    function showError(container, message) {
+        container.classList.add("error");
+        container.innerHTML = "";
+        container.appendChild(el("h3", {"data-test": "error", text: message}, [
+            el("button", {"class": "error-button", "data-test": "error-button", text: "x", onclick: function (event) {
+                event.preventDefault();
+                container.classList.remove("error");
+                container.innerHTML = "";
+            }})
+        ]));
+    }
+
+    // --- pages ---
+
+    function setupHeader() {
+        var menu = document.querySelector(".bm-menu-wrap");
+        document.getElementById("react-burger-menu-btn").addEventListener("click", function () {
+            menu.hidden = false;
+        });
+        document.getElementById("react-burger-cross-btn").addEventListener("click", function () {
+            menu.hidden = true;
+        });
+        document.getElementById("logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            clearSession();
+            go("./");
+        });
+        document.getElementById("reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setCart([]);
+            renderBadge();
+        });
+        document.getElementById("shopping_cart_container").addEventListener("click", function (event) {
+            event.preventDefault();
+            go("cart.html");
+        });
+        renderBadge();
+    }
+
+    var PAGES = {
+        login: function () {
+            var form = document.getElementById("login_form");
+            var errorContainer = document.querySelector(".error-message-container");
+            form.addEventListener("submit", function (event) {
+                event.preventDefault();
+                var username = document.getElementById("user-name").value;
+                var password = document.getElementById("password").value;
+                if (!username) {
+                    return showError(errorContainer, "Epic sadface: Username is required");
+                }
+                if (!password) {
+                    return showError(errorContainer, "Epic sadface: Password is required");
+                }
+                if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+                    return showError(errorContainer, "Epic sadface: Username and password do not match any user in this service");
+                }
+                if (LOCKED_OUT.indexOf(username) !== -1) {
+                    return showError(errorContainer, "Epic sadface: Sorry, this user has been locked out.");
+                }
+                setSessionUser(username);
+                go("inventory.html");
+            });
+        },
+
+        inventory: function () {
+            var list = document.querySelector(".inventory_list");
+            var sort = document.querySelector(".product_sort_container");
+            var orders = {
+                az: function (a, b) { return a.name.localeCompare(b.name); },
+                za: function (a, b) { return b.name.localeCompare(a.name); },
+                lohi: function (a, b) { return a.price - b.price; },
+                hilo: function (a, b) { return b.price - a.price; }
+            };
+            function render() {
+                list.innerHTML = "";
+                PRODUCTS.slice().sort(orders[sort.value]).forEach(function (product) {
+                    list.appendChild(el("div", {"class": "inventory_item", "data-test": "inventory-item"}, [
+                        el("div", {"class": "inventory_item_img"}),
+                        itemDescription(product, cartButton(product))
+                    ]));
+                });
+                document.querySelector(".active_option").textContent = sort.options[sort.selectedIndex].text;
+            }
+            sort.addEventListener("change", render);
+            render();
+        },
+
+        cart: function () {
+            var list = document.querySelector(".cart_list");
+            getCart().map(productById).forEach(function (product) {
+                var item = el("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+                    el("div", {"class": "cart_quantity", text: "1"}),
+                    itemDescription(product, el("button", {
+                        "class": "btn btn_secondary btn_small cart_button",
+                        id: "remove-" + slug(product.name),
+                        name: "remove-" + slug(product.name),
+                        text: "Remove",
+                        onclick: function () {
+                            var cart = getCart();
+                            cart.splice(cart.indexOf(product.id), 1);
+                            setCart(cart);
+                            item.remove();
+                            renderBadge();
+                        }
+                    }))
+                ]);
+                list.appendChild(item);
+            });
+            document.getElementById("continue-shopping").addEventListener("click", function () { go("inventory.html"); });
+            document.getElementById("checkout").addEventListener("click", function () { go("checkout-step-one.html"); });
+        },
+
+        "checkout-step-one": function () {
+            var errorContainer = document.querySelector(".error-message-container");
+            document.getElementById("checkout_info_form").addEventListener("submit", function (event) {
+                event.preventDefault();
+                var required = [["first-name", "First Name"], ["last-name", "Last Name"], ["postal-code", "Postal Code"]];
+                for (var i = 0; i < required.length; i++) {
+                    if (!document.getElementById(required[i][0]).value) {
+                        return showError(errorContainer, "Error: " + required[i][1] + " is required");
+                    }
+                }
+                go("checkout-step-two.html");
+            });
+            document.getElementById("cancel").addEventListener("click", function () { go("cart.html"); });
+        },
+
+        "checkout-step-two": function () {
+            var list = document.querySelector(".cart_list");
+            var products = getCart().map(productById);
+            products.forEach(function (product) {
+                list.appendChild(el("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+                    el("div", {"class": "cart_quantity", text: "1"}),
+                    itemDescription(product, null)
+                ]));
+            });
+            var subtotal = products.reduce(function (sum, p) { return sum + p.price; }, 0);
+            var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+            document.querySelector(".summary_subtotal_label").textContent = "Item total: " + money(subtotal);
+            document.querySelector(".summary_tax_label").textContent = "Tax: " + money(tax);
+            document.querySelector(".summary_total_label").textContent = "Total: " + money(subtotal + tax);
+            document.getElementById("cancel").addEventListener("click", function () { go("inventory.html"); });
+            document.getElementById("finish").addEventListener("click", function () {
+                setCart([]);
+                go("checkout-complete.html");
+            });
+        },
+
+        "checkout-complete": function () {
+            document.getElementById("back-to-products").addEventListener("click", function () { go("inventory.html"); });
+        }
+    };
+
+    document.addEventListener("DOMContentLoaded", function () {
+        var page = document.body.getAttribute("data-page");
+        if (page !== "login" && !getSessionUser()) {
+            window.localStorage.setItem("login-error", "Epic sadface: You can only access '/" + page + ".html' when you are logged in.");
+            return go("./");
+        }
+        if (page === "login" && window.localStorage.getItem("login-error")) {
+            showError(document.querySelector(".error-message-container"), window.localStorage.getItem("login-error"));
+            window.localStorage.removeItem("login-error");
+        }
+        if (page !== "login") {
+            setupHeader();
+        }
+        PAGES[page]();
+    });
+}());
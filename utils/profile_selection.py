@@ -0,0 +1,39 @@
+"""
+Chooses the browser profile (see utils/browser.py) each test runs with.
+
+In order of precedence:
+  1. an explicit @pytest.mark.browser_profile("lean") on the test
+  2. the first `browser_profiles` rule in pytest.ini whose marker the test carries, e.g. "smoke=full"
+  3. the BROWSER_PROFILE environment variable, "full" if unset
+"""
+import os
+
+import pytest
+
+from utils.browser import PROFILES, BrowserProfile
+
+
+def pytest_addoption(parser):
+    parser.addini("browser_profiles", type="linelist", default=[],
+                  help="marker=profile rules, checked in order, choosing the browser profile of a test.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "browser_profile(name): run the test with the named browser profile (full, lean)")
+
+
+def profile_for(item) -> BrowserProfile:
+    explicit = item.get_closest_marker("browser_profile")
+    if explicit is not None:
+        return PROFILES[explicit.args[0]]
+    markers = {marker.name for marker in item.iter_markers()}
+    for rule in item.config.getini("browser_profiles"):
+        marker, _, name = rule.partition("=")
+        if marker.strip() in markers:
+            return PROFILES[name.strip()]
+    return PROFILES[os.getenv("BROWSER_PROFILE", "full")]
+
+
+@pytest.fixture(scope="function")
+def browser_profile(request) -> BrowserProfile:
+    return profile_for(request.node)
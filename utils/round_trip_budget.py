@@ -0,0 +1,169 @@
+"""
+Per-test budgets on WebDriver round trips, checked against a committed baseline file.
+
+    pytest --update-round-trip-baselines        # record the counts of passing tests in the baseline file
+    pytest --round-trip-budget warn             # report tests over budget in the terminal summary
+    pytest --round-trip-budget fail             # ... and fail them
+
+Every WebDriver HTTP command a test issues from its own thread is counted, fixtures included.
+Getting a browser (the `driver` fixture and the pools behind it) is not counted, because it depends
+on the pool's state rather than on the test. A test's budget is its baseline plus
+--round-trip-margin percent. An over-budget report shows which commands grew, e.g. an extra
+executeAsyncScript per loop iteration from a new _is_displayed call.
+
+Counts depend on the plugins that issue commands of their own (--failure-step-dom,
+--browser-metrics), so baselines must be recorded and checked with the same options. With
+DRIVER_BACKEND=cdp the DevTools methods are counted instead, against round_trip_baselines.cdp.json.
+"""
+import json
+import math
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from utils import hooks
+
+DEFAULT_FILE = "round_trip_baselines.json"
+CDP_FILE = "round_trip_baselines.cdp.json"  # the default with DRIVER_BACKEND=cdp
+DEFAULT_MARGIN = 10.0
+# Fixtures whose commands depend on the pool rather than on the test
+UNCOUNTED_FIXTURES = ("driver", "driver_pools", "shared_browsers")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("round-trip budget")
+    group.addoption("--round-trip-budget", choices=("off", "warn", "fail"), default="off",
+                    help="Check each test's WebDriver round trips against its baseline: warn or fail when over budget.")
+    group.addoption("--round-trip-margin", type=float, default=DEFAULT_MARGIN, metavar="PERCENT",
+                    help=f"How far over its baseline a test may go, in percent (default {DEFAULT_MARGIN:g}).")
+    group.addoption("--round-trip-baselines", default=None,
+                    help=f"Baseline file with the round trips of every test (default {DEFAULT_FILE}, {CDP_FILE} with DRIVER_BACKEND=cdp).")
+    group.addoption("--update-round-trip-baselines", action="store_true", default=False,
+                    help="Write the round trips of passing tests to the baseline file.")
+
+
+def pytest_configure(config):
+    if config.getoption("round_trip_budget") != "off" or config.getoption("update_round_trip_baselines"):
+        config.pluginmanager.register(RoundTripBudget(config), "round-trip-budget")
+
+
+def load_baselines(path: Path) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def budget_for(baseline: int, margin: float) -> int:
+    return math.floor(baseline * (1 + margin / 100))
+
+
+def command_growth(baseline: dict[str, int], actual: dict[str, int]) -> dict[str, int]:
+    """Commands issued more often than in the baseline, with how many more"""
+    return {command: count - baseline.get(command, 0) for command, count in sorted(actual.items())
+            if count > baseline.get(command, 0)}
+
+
+class RoundTripBudget:
+    def __init__(self, config):
+        self.config = config
+        self.mode = config.getoption("round_trip_budget")
+        self.margin = config.getoption("round_trip_margin")
+        self.update = config.getoption("update_round_trip_baselines")
+        from utils.cdp_driver import enabled as cdp_backend_enabled # Local import, loads after the shared_browser plugin
+        self.path = Path(config.rootpath, config.getoption("round_trip_baselines") or (CDP_FILE if cdp_backend_enabled() else DEFAULT_FILE))
+        self.baselines = load_baselines(self.path)
+        self.counts: dict[str, dict] = {}  # passing tests, for the baseline update
+        self.over: dict[str, dict] = {}
+        self.unbaselined: list[str] = []
+        self._commands: dict[str, int] | None = None
+        self._thread: int | None = None
+        self._paused = False
+
+    @contextmanager
+    def command(self, command, params):
+        yield
+        if self._commands is not None and not self._paused and threading.get_ident() == self._thread:
+            self._commands[command] = self._commands.get(command, 0) + 1
+
+    def pytest_sessionstart(self, session):
+        hooks.add_command_listener(self.command)
+
+    def pytest_runtest_setup(self, item):
+        self._commands = {}
+        self._thread = threading.get_ident()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        paused, self._paused = self._paused, self._paused or fixturedef.argname in UNCOUNTED_FIXTURES
+        try:
+            yield
+        finally:
+            self._paused = paused
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if call.when != "call" or self._commands is None:
+            return
+        commands, self._commands = self._commands, None
+        total = sum(commands.values())
+        if report.passed:
+            self.counts[item.nodeid] = {"round_trips": total, "commands": commands}
+        baseline = self.baselines.get(item.nodeid)
+        if self.mode == "off":
+            return
+        if baseline is None:
+            self.unbaselined.append(item.nodeid)
+            return
+        budget = budget_for(baseline["round_trips"], self.margin)
+        if total <= budget:
+            return
+        over = {"round_trips": total, "baseline": baseline["round_trips"], "budget": budget,
+                "growth": command_growth(baseline.get("commands", {}), commands)}
+        self.over[item.nodeid] = over
+        message = self._describe(over)
+        report.sections.append(("round-trip budget", message))
+        if self.mode == "fail" and report.passed:
+            report.outcome = "failed"
+            report.longrepr = f"Over the round-trip budget: {message}"
+
+    @staticmethod
+    def _describe(over: dict) -> str:
+        growth = ", ".join(f"{command} +{count}" for command, count in over["growth"].items())
+        return (f"{over['round_trips']} round trips, budget {over['budget']} (baseline {over['baseline']})"
+                + (f"; {growth}" if growth else ""))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collects the counts and overruns of an xdist worker on the controller"""
+        output = json.loads(node.workeroutput.get("round_trip_budget", "{}"))
+        self.counts.update(output.get("counts", {}))
+        self.over.update(output.get("over", {}))
+        self.unbaselined.extend(output.get("unbaselined", []))
+
+    def pytest_sessionfinish(self, session):
+        hooks.remove_command_listener(self.command)
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["round_trip_budget"] = json.dumps(
+                {"counts": self.counts, "over": self.over, "unbaselined": self.unbaselined})
+            return
+        if self.update and self.counts:
+            baselines = {**self.baselines, **self.counts}
+            self.path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.update:
+            terminalreporter.section("round-trip budget")
+            terminalreporter.write_line(f"Baselines of {len(self.counts)} passing tests written to {self.path.name}")
+        if self.mode == "off":
+            return
+        if not self.update:
+            terminalreporter.section("round-trip budget")
+        for nodeid, over in self.over.items():
+            terminalreporter.write_line(f"{nodeid}: {self._describe(over)}")
+        terminalreporter.write_line(f"{len(self.over)} tests over budget (margin {self.margin:g}%)"
+                                    + (f", {len(self.unbaselined)} without a baseline" if self.unbaselined else ""))
@@ -0,0 +1,202 @@
+"""
+Many tests in one Chrome process, each in its own window and browser context.
+
+A browser context (CDP Target.createBrowserContext) has its own cookies, storage and cache, so
+tests sharing a browser stay as isolated as tests in separate browsers. Each test gets a copy of
+the WebDriver that switches to its own window before every command. BasePage and the page
+objects work unchanged.
+
+With SHARED_BROWSER=1 the `driver` fixture hands out windows instead of pooled browsers. Under
+xdist (pytest -n 4), the controller starts one Chrome with remote debugging per browser profile,
+with that profile's launch flags. Every worker attaches its own chromedriver session to the Chrome
+of the test's profile through `debuggerAddress`, so four workers use one browser process per
+profile instead of one per worker.
+"""
+import copy
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.browser import PROFILES, BrowserProfile, chrome_options
+
+STARTUP_TIMEOUT = 30
+
+
+def enabled() -> bool:
+    return os.getenv("SHARED_BROWSER", "0") != "0"
+
+
+class SharedBrowser:
+    """One WebDriver session whose windows are handed out to tests, each in a fresh browser context"""
+    def __init__(self, driver: WebDriver, owns_browser: bool = True):
+        self.driver = driver
+        self.owns_browser = owns_browser
+        self._execute = driver.execute
+        self._lock = threading.RLock()
+        self._current = driver.current_window_handle
+        self._windows: dict[int, tuple[str, str]] = {}  # id(bound driver) -> (window handle, browser context id)
+        # Contexts are created and disposed from a window of our own, which no test can close
+        self._home = self._new_window(None)
+
+    def open_window(self, on_open=None) -> WebDriver:
+        """A driver bound to a new window in a new browser context; on_open(driver) runs before it is returned"""
+        with self._lock:
+            self._switch(self._home)
+            context_id = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+            handle = self._new_window(context_id)
+        bound = self._bind(handle)
+        self._windows[id(bound)] = (handle, context_id)
+        if on_open is not None:
+            on_open(bound)
+        return bound
+
+    def close_window(self, driver: WebDriver) -> bool:
+        """Disposes the window's browser context, and with it every page, cookie and storage entry it had"""
+        handle, context_id = self._windows.pop(id(driver))
+        with self._lock:
+            try:
+                self._switch(self._home)
+                self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                return True
+            except WebDriverException as e:
+                print(f"Browser context of window {handle} failed to close: {e}")
+                return False
+
+    def close(self):
+        self._switch(self._home)
+        for driver_id in list(self._windows):
+            _, context_id = self._windows.pop(driver_id)
+            try:
+                self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            except WebDriverException:
+                pass
+        try:
+            if not self.owns_browser:
+                # Attached to someone else's Chrome: leave it running, only remove our own window
+                self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": self._home})
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+    def _new_window(self, context_id: str | None) -> str:
+        params = {"url": "about:blank"}
+        if context_id is not None:
+            params["browserContextId"] = context_id
+        target_id = self.driver.execute_cdp_cmd("Target.createTarget", params)["targetId"]
+        # chromedriver window handles are the DevTools target ids
+        handles = self.driver.window_handles
+        return target_id if target_id in handles else next(h for h in handles if h.endswith(target_id))
+
+    def _switch(self, handle: str):
+        if self._current != handle:
+            self._execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+            self._current = handle
+
+    def _bind(self, handle: str) -> WebDriver:
+        bound = copy.copy(self.driver)
+
+        def execute(driver_command, params=None):
+            with self._lock:
+                self._switch(handle)
+                return self._execute(driver_command, params)
+
+        bound.execute = execute
+        bound._switch_to = SwitchTo(bound)
+        return bound
+
+
+class SharedChrome:
+    """A Chrome process with remote debugging, started once by the xdist controller for all workers"""
+    def __init__(self, profile: BrowserProfile):
+        self.profile = profile
+        self.address: str | None = None
+        self._process: subprocess.Popen | None = None
+        self._user_data_dir: str | None = None
+
+    def start(self) -> str:
+        options = chrome_options(self.profile)
+        binary = DriverFinder(Service(), options).get_browser_path()
+        self._user_data_dir = tempfile.mkdtemp(prefix="shared-chrome-")
+        arguments = [a for a in options.arguments if a != "--incognito"] # tests get their own contexts instead
+        self._process = subprocess.Popen(
+            [binary, "--remote-debugging-port=0", f"--user-data-dir={self._user_data_dir}", *arguments, "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        port_file = Path(self._user_data_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not port_file.exists() or not port_file.read_text().strip():
+            if time.monotonic() > deadline or self._process.poll() is not None:
+                self.stop()
+                raise RuntimeError("Shared Chrome did not start its DevTools server.")
+            time.sleep(0.05)
+        self.address = f"127.0.0.1:{port_file.read_text().splitlines()[0]}"
+        return self.address
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+        if self._user_data_dir is not None:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+
+
+def attach(address: str) -> webdriver.Chrome:
+    """A new chromedriver session on an already running Chrome"""
+    options = Options()
+    options.debugger_address = address
+    return webdriver.Chrome(options=options)
+
+
+def open_shared_browser(config, profile: BrowserProfile, create_driver) -> SharedBrowser:
+    """Attaches to the controller's Chrome for the profile on an xdist worker, otherwise launches a browser of our own"""
+    addresses = getattr(config, "workerinput", {}).get("shared_chrome")
+    if addresses:
+        if profile.name not in addresses:
+            raise RuntimeError(f"No shared Chrome was started for browser profile {profile.name!r} "
+                               f"(started: {', '.join(sorted(addresses))}).")
+        return SharedBrowser(attach(addresses[profile.name]), owns_browser=False)
+    return SharedBrowser(create_driver(profile))
+
+
+_shared_chromes: dict[str, SharedChrome] = {}  # profile name -> Chrome started by the xdist controller
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    On the xdist controller: start one Chrome per browser profile for all workers and tell each where to
+    find them. Tests are only collected on the workers, so every profile a test may ask for gets its Chrome.
+    """
+    if not enabled():
+        return
+    for name, profile in PROFILES.items():
+        if name not in _shared_chromes:
+            chrome = SharedChrome(profile)
+            chrome.start()
+            _shared_chromes[name] = chrome
+    node.workerinput["shared_chrome"] = {name: chrome.address for name, chrome in _shared_chromes.items()}
+
+
+def pytest_unconfigure(config):
+    for chrome in _shared_chromes.values():
+        chrome.stop()
+    _shared_chromes.clear()
@@ -0,0 +1,139 @@
+"""
+State-aware test ordering that carries the browser from one test to the next.
+
+Tests declare the session state they start from and the state they leave behind:
+
+    @pytest.mark.state(requires=SessionState("standard_user"),
+                       leaves=SessionState("standard_user", ("Sauce Labs Backpack",), CartPage))
+
+With --state-order the tests are reordered greedily: after each test comes the remaining test that
+is cheapest to reach from the state it left.
+  - same state: 0 transitions, the next test starts right where the last one stopped
+  - same user: 1 transition, one seeding navigation in the kept browser (see pages/session_state.py)
+  - anything else, or an undeclared state: a full reset of the browser by its pool, then seeding
+When a test that declares `leaves` passes and the next one `requires` a state of the same user, the
+`driver` fixture hands the same browser on instead of resetting it. `seed_session` skips seeding when the
+browser is already in the requested state. After a failure, or when the next test needs another user or
+another browser profile, the browser goes back to its pool and is reset as usual. A test that leaves an unpredictable state
+(e.g. a form with an error showing) does not declare `leaves`, so the next test gets a clean browser.
+"""
+from typing import Callable
+
+import pytest
+
+from pages.session_state import SessionState
+from utils.profile_selection import profile_for
+
+SAME_STATE = 0
+SAME_USER = 1
+FULL_RESET = 2
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("state order")
+    group.addoption("--state-order", action="store_true", default=False,
+                    help="Order tests by their declared states and carry the browser between compatible tests.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "state(requires=None, leaves=None): SessionState the test starts from and leaves behind")
+    if config.getoption("state_order"):
+        config.pluginmanager.register(StateOrder(), "state-order")
+
+
+def declared(item, key: str) -> SessionState | None:
+    marker = item.get_closest_marker("state")
+    return marker.kwargs.get(key) if marker is not None else None
+
+
+def transition_cost(current: SessionState | None, required: SessionState | None) -> int:
+    if current is None or required is None:
+        return FULL_RESET
+    if current == required:
+        return SAME_STATE
+    return SAME_USER if current.username == required.username else FULL_RESET
+
+
+def order_by_state(items: list) -> list:
+    """Greedy nearest-state order; ties keep the collection order"""
+    pending, ordered, current = list(items), [], None
+    while pending:
+        best = min(pending, key=lambda item: transition_cost(current, declared(item, "requires")))
+        pending.remove(best)
+        ordered.append(best)
+        current = declared(best, "leaves")
+    return ordered
+
+
+class StateOrder:
+    def __init__(self):
+        self.carried = 0
+        self.seeds_skipped = 0
+        self._next = None
+        self._failed = False
+        # (node id of the test it is kept for, driver, release, state the browser is in)
+        self._kept: tuple[str, object, Callable[[], None], SessionState | None] | None = None
+        self._state: tuple[int, SessionState] | None = None  # (id(driver), state) of the carried browser
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        items[:] = order_by_state(items)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self._kept is not None and self._kept[0] != item.nodeid:
+            self._release_kept() # the test it was kept for did not take it (skipped or deselected)
+        self._next = nextitem
+        self._failed = False
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if outcome.get_result().failed:
+            self._failed = True
+
+    def take(self, item):
+        """The (driver, release) kept for this test by the previous one, or None"""
+        if self._kept is None or self._kept[0] != item.nodeid:
+            return None
+        _, driver, release, state = self._kept
+        self._kept = None
+        self._state = (id(driver), state) if state is not None else None
+        self.carried += 1
+        return driver, release
+
+    def keep(self, item, driver, release: Callable[[], None]) -> bool:
+        """Keeps the browser for the next test instead of releasing it, if that test can start from it"""
+        nextitem = self._next
+        if self._failed or nextitem is None:
+            return False
+        if transition_cost(declared(item, "leaves"), declared(nextitem, "requires")) == FULL_RESET:
+            return False # another user (or an undeclared state) needs the reset the pool would do anyway
+        if profile_for(nextitem) != profile_for(item):
+            return False
+        self._kept = (nextitem.nodeid, driver, release, declared(item, "leaves"))
+        return True
+
+    def in_state(self, driver, state: SessionState) -> bool:
+        """True (once) if the carried browser is already in the state a test is about to seed"""
+        if self._state != (id(driver), state):
+            return False
+        self._state = None
+        self.seeds_skipped += 1
+        return True
+
+    def _release_kept(self):
+        _, _, release, _ = self._kept
+        self._kept = None
+        release()
+
+    def pytest_sessionfinish(self, session):
+        if self._kept is not None:
+            self._release_kept()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if terminalreporter.config.option.collectonly:
+            return
+        terminalreporter.write_line(f"state order: {self.carried} tests started in the previous test's browser, "
+                                    f"{self.seeds_skipped} without seeding")